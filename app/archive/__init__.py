@@ -0,0 +1,395 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Columnar History Archive
+Compressed, block-indexed archive of calculation history
+"""
+
+# archive.py
+
+"""
+This module exports calculation history to a compact columnar file and reads it back
+one block at a time.
+
+**Layout** (all numbers little-endian):
+- Header: `b'CALCARC2'` and a 1-byte codec (0 = zlib, 1 = zstd).
+- Blocks of up to `block_rows` rows. Each block stores the five columns `opcode` (uint8),
+  `a`, `b`, `result` and `created` (float64, a Unix timestamp) one after another, each
+  compressed on its own. A float column is also compressed with its bytes shuffled (all
+  first bytes, then all second bytes, ...), and the smaller result is kept. Shuffling
+  puts the slowly changing sign and exponent bytes next to each other: it shrinks a
+  column of timestamps about fiftyfold, but makes a column of random operands larger.
+- A directory with one entry per block: its row count, where each column is, which
+  columns are shuffled, a 256-bit bitmask of the opcodes it holds (one bit for every
+  possible uint8 opcode) and the minimum and maximum of each float column.
+- A footer with the offset of the directory, the number of blocks and the magic again.
+
+`ArchiveReader` reads only the directory when it opens a file. A query first checks each
+block's opcode mask and min/max statistics and skips every block that cannot hold a
+match, then decompresses only the columns it filters on, and the rest only for blocks
+with matching rows. Calculation objects are built only for the rows a caller asks for.
+
+zlib from the standard library is always available. zstd is used when the optional
+`zstandard` package is installed.
+"""
+
+import os
+import struct
+import sys
+import time
+import zlib
+from array import array
+from bisect import bisect_right
+from math import nan
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from app.calculation import Calculation, CalculationFactory
+from app.store import HistoryStore
+
+# zstd is optional: it compresses better and decompresses faster than zlib, but the
+# archive format and every reader work without it.
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - exercised only on hosts without zstandard
+    zstandard = None
+
+ARCHIVE_MAGIC = b'CALCARC2'
+ARCHIVE_HEADER = struct.Struct('<8sB')
+ARCHIVE_FOOTER = struct.Struct('<QI8s')
+COLUMNS = ('opcode', 'a', 'b', 'result', 'created')
+FLOAT_COLUMNS = COLUMNS[1:]
+# Row count, (offset, length) of each column, shuffled-column mask, opcode mask (32
+# little-endian bytes, so every uint8 opcode has a bit) and the (min, max) of each float column.
+BLOCK_ENTRY = struct.Struct('<I' + 'QI' * len(COLUMNS) + 'B32s' + 'dd' * len(FLOAT_COLUMNS))
+_OPCODE_MASK_SIZE = 32
+
+CODECS = ('zlib', 'zstd')
+
+# Rows per block: large enough to compress well, small enough to decode for one row.
+DEFAULT_BLOCK_ROWS = 1 << 16
+DEFAULT_ZLIB_LEVEL = 6
+
+_FLOAT_SIZE = 8
+_BIG_ENDIAN = sys.byteorder == 'big'
+
+Range = Tuple[Optional[float], Optional[float]]
+
+
+class BlockInfo(NamedTuple):
+    """The directory entry of one block."""
+    rows: int
+    columns: Tuple[Tuple[int, int], ...]  # (offset, length) per column, in COLUMNS order.
+    shuffled: int  # Bit i is set when column i is stored with its bytes shuffled.
+    opcode_mask: int
+    bounds: Tuple[Tuple[float, float], ...]  # (min, max) per float column; NaN if all NaN.
+
+
+class ArchiveRow(NamedTuple):
+    """One archived calculation. `result` is NaN when the calculation failed."""
+    index: int
+    opcode: int
+    a: float
+    b: float
+    result: float
+    created: float
+
+    def calculation(self) -> Calculation:
+        """Rebuilds the Calculation object this row was archived from."""
+        return CalculationFactory.calculation_class(self.opcode)(self.a, self.b)
+
+
+def _shuffle(data: bytes) -> bytes:
+    """Groups the i-th byte of every float64 together, for i = 0..7."""
+    return b''.join(data[i::_FLOAT_SIZE] for i in range(_FLOAT_SIZE))
+
+
+def _unshuffle(data: bytes) -> bytes:
+    """Reverses `_shuffle`."""
+    rows = len(data) // _FLOAT_SIZE
+    out = bytearray(len(data))
+    for i in range(_FLOAT_SIZE):
+        out[i::_FLOAT_SIZE] = data[i * rows:(i + 1) * rows]
+    return bytes(out)
+
+
+def _bounds(values: array) -> Tuple[float, float]:
+    """Returns the (min, max) of a column ignoring NaN, or (NaN, NaN) if every value is NaN."""
+    numbers = [value for value in values if value == value]
+    return (min(numbers), max(numbers)) if numbers else (nan, nan)
+
+
+def _overlaps(bounds: Tuple[float, float], wanted: Range) -> bool:
+    """True when a block with these (min, max) bounds may hold a value in `wanted`."""
+    low, high = bounds
+    if low != low:
+        return False  # Every value is NaN, and NaN matches no range.
+    return (wanted[0] is None or high >= wanted[0]) and (wanted[1] is None or low <= wanted[1])
+
+
+def _in_range(value: float, wanted: Range) -> bool:
+    """True when `value` lies within the inclusive range `wanted`."""
+    return (wanted[0] is None or value >= wanted[0]) and (wanted[1] is None or value <= wanted[1])
+
+
+def _compressor(codec: str, level: Optional[int]) -> Callable[[bytes], bytes]:
+    """Returns the compression function of a codec at a level (None for its default)."""
+    if codec == 'zstd':  # pragma: no cover - exercised only on hosts with zstandard
+        return zstandard.ZstdCompressor(level=3 if level is None else level).compress
+    zlib_level = DEFAULT_ZLIB_LEVEL if level is None else level
+    return lambda data: zlib.compress(data, zlib_level)
+
+
+class ArchiveWriter:
+    """
+    Writes calculations to a columnar archive, one compressed block at a time.
+
+    **Parameters:**
+    - `path (str)`: The archive file to create.
+    - `block_rows (int)`: Rows per block.
+    - `codec (str)`: `'zlib'` or `'zstd'` (requires the `zstandard` package).
+    - `level (Optional[int])`: Compression level; the codec's default if None.
+
+    **Raises:**
+    - `ValueError`: If the codec is unknown or zstd is requested but not installed.
+    """
+
+    def __init__(self, path: str, block_rows: int = DEFAULT_BLOCK_ROWS, codec: str = 'zlib',
+                 level: Optional[int] = None) -> None:
+        if codec not in CODECS:
+            raise ValueError(f"Unknown archive codec: '{codec}'. Use one of: {', '.join(CODECS)}.")
+        if codec == 'zstd' and zstandard is None:
+            raise ValueError("The zstd codec requires the 'zstandard' package.")
+        self._compress = _compressor(codec, level)
+        self.path: str = path
+        self.block_rows: int = max(block_rows, 1)
+        self.rows: int = 0
+        self._file = open(path, 'wb')
+        self._file.write(ARCHIVE_HEADER.pack(ARCHIVE_MAGIC, CODECS.index(codec)))
+        self._directory: List[bytes] = []
+        self._reset()
+
+    def append(self, calculation: Calculation, created: Optional[float] = None) -> None:
+        """Adds a calculation, with its result (NaN if it fails) and time (now by default)."""
+        self.append_row(CalculationFactory.opcode_of(calculation), calculation.a, calculation.b,
+                        calculation.try_execute().value, time.time() if created is None else created)
+
+    def append_row(self, opcode: int, a: float, b: float, result: float, created: float) -> None:
+        """Adds one row given as column values."""
+        self._opcodes.append(opcode)
+        self._a.append(a)
+        self._b.append(b)
+        self._result.append(result)
+        self._created.append(created)
+        if len(self._opcodes) == self.block_rows:
+            self._write_block()
+
+    def close(self) -> None:
+        """Writes the last block, the directory and the footer, and closes the file."""
+        if self._file.closed:
+            return
+        if self._opcodes:
+            self._write_block()
+        directory_offset = self._file.tell()
+        self._file.write(b''.join(self._directory))
+        self._file.write(ARCHIVE_FOOTER.pack(directory_offset, len(self._directory), ARCHIVE_MAGIC))
+        self._file.close()
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _reset(self) -> None:
+        """Starts a new, empty block."""
+        self._opcodes = array('B')
+        self._a, self._b, self._result, self._created = (array('d') for _ in FLOAT_COLUMNS)
+
+    def _write_block(self) -> None:
+        """Compresses the buffered columns, appends them and records the block's entry."""
+        floats = (self._a, self._b, self._result, self._created)
+        mask = 0
+        for opcode in set(self._opcodes):
+            mask |= 1 << opcode
+        locations = []
+        shuffled = 0
+        for index, column in enumerate((self._opcodes,) + floats):
+            if _BIG_ENDIAN and index:  # pragma: no cover - little-endian hosts only in CI
+                column.byteswap()
+            data = column.tobytes()
+            payload = self._compress(data)
+            if index:
+                shuffled_payload = self._compress(_shuffle(data))
+                if len(shuffled_payload) < len(payload):
+                    payload = shuffled_payload
+                    shuffled |= 1 << index
+            locations += [self._file.tell(), len(payload)]
+            self._file.write(payload)
+        bounds = [value for column in floats for value in _bounds(column)]
+        self._directory.append(BLOCK_ENTRY.pack(len(self._opcodes), *locations, shuffled,
+                                                mask.to_bytes(_OPCODE_MASK_SIZE, 'little'), *bounds))
+        self.rows += len(self._opcodes)
+        self._reset()
+
+
+def write_archive(path: str, rows: Iterable[Tuple[Calculation, Optional[float]]],
+                  block_rows: int = DEFAULT_BLOCK_ROWS, codec: str = 'zlib') -> int:
+    """
+    Writes `(calculation, created)` pairs to a new archive and returns the row count.
+    """
+    with ArchiveWriter(path, block_rows, codec) as writer:
+        for calculation, created in rows:
+            writer.append(calculation, created)
+    return writer.rows
+
+
+def export_history(store: HistoryStore, path: str, block_rows: int = DEFAULT_BLOCK_ROWS,
+                   codec: str = 'zlib') -> int:
+    """
+    Writes every calculation in a persistent history store to a new archive, oldest
+    first, and returns the row count.
+    """
+    opcode = CalculationFactory.opcode
+    with ArchiveWriter(path, block_rows, codec) as writer:
+        for entry in store.entries():
+            writer.append_row(opcode(entry.operation), entry.a, entry.b,
+                              nan if entry.result is None else entry.result, entry.created)
+    return writer.rows
+
+
+class ArchiveReader:
+    """
+    Random and filtered access to a columnar archive.
+
+    Opening an archive reads only its directory. Columns are decompressed on first use,
+    and the columns of the most recently used block are kept for the next access.
+
+    **Parameters:**
+    - `path (str)`: The archive file.
+
+    **Raises:**
+    - `ValueError`: If the file is not an archive, or uses zstd and it is not installed.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        self._file = open(path, 'rb')
+        try:
+            magic, codec = ARCHIVE_HEADER.unpack(self._file.read(ARCHIVE_HEADER.size))
+            self._file.seek(-ARCHIVE_FOOTER.size, os.SEEK_END)
+            directory_offset, block_count, footer_magic = ARCHIVE_FOOTER.unpack(self._file.read(ARCHIVE_FOOTER.size))
+            if magic != ARCHIVE_MAGIC or footer_magic != ARCHIVE_MAGIC or codec >= len(CODECS):
+                raise ValueError(f"{path} is not a calculation archive.")
+            if CODECS[codec] == 'zstd' and zstandard is None:
+                raise ValueError("This archive uses zstd, which requires the 'zstandard' package.")
+            self._decompress = (zlib.decompress if CODECS[codec] == 'zlib'
+                                else zstandard.ZstdDecompressor().decompress)
+            self._file.seek(directory_offset)
+            directory = self._file.read(block_count * BLOCK_ENTRY.size)
+        except (struct.error, OSError, ValueError):
+            self._file.close()
+            raise
+        self.blocks: List[BlockInfo] = []
+        self._starts: List[int] = []
+        rows = 0
+        columns = len(COLUMNS)
+        for fields in BLOCK_ENTRY.iter_unpack(directory):
+            locations = tuple(zip(fields[1:2 * columns:2], fields[2:2 * columns + 1:2]))
+            shuffled, opcode_mask = fields[2 * columns + 1:2 * columns + 3]
+            floats = fields[2 * columns + 3:]
+            bounds = tuple(zip(floats[0::2], floats[1::2]))
+            self.blocks.append(BlockInfo(fields[0], locations, shuffled, int.from_bytes(opcode_mask, 'little'), bounds))
+            self._starts.append(rows)
+            rows += fields[0]
+        self._rows = rows
+        self._cached_block = -1
+        self._cached_columns: Dict[int, array] = {}
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def row(self, index: int) -> ArchiveRow:
+        """Returns row `index` (negative counts from the end), decoding only its block."""
+        if index < 0:
+            index += self._rows
+        if not 0 <= index < self._rows:
+            raise IndexError("archive index out of range")
+        block = self._block_of(index)
+        offset = index - self._starts[block]
+        return ArchiveRow(index, *(self._column(block, column)[offset] for column in range(len(COLUMNS))))
+
+    def __getitem__(self, index: int) -> Calculation:
+        """Returns the Calculation of row `index`, built on access."""
+        return self.row(index).calculation()
+
+    def __iter__(self) -> Iterator[ArchiveRow]:
+        return self.query()
+
+    def query(self, operation: Optional[str] = None, a: Optional[Range] = None,
+              b: Optional[Range] = None, result: Optional[Range] = None,
+              created: Optional[Range] = None) -> Iterator[ArchiveRow]:
+        """
+        Yields the rows matching every given filter, in archive order.
+
+        **Parameters:**
+        - `operation (Optional[str])`: Keep only this calculation type.
+        - `a`, `b`, `result`, `created (Optional[Tuple[Optional[float], Optional[float]]])`:
+          Inclusive `(low, high)` ranges; None for an open end. NaN matches no range.
+
+        **Raises:**
+        - `ValueError`: If the operation is not a registered calculation type.
+        """
+        opcode = None if operation is None else CalculationFactory.opcode(operation)
+        ranges = [(1 + position, wanted) for position, wanted in enumerate((a, b, result, created))
+                  if wanted is not None]
+        for block, info in enumerate(self.blocks):
+            if opcode is not None and not info.opcode_mask >> opcode & 1:
+                continue
+            if not all(_overlaps(info.bounds[column - 1], wanted) for column, wanted in ranges):
+                continue
+            matches = range(info.rows)
+            if opcode is not None:
+                opcodes = self._column(block, 0)
+                matches = [i for i in matches if opcodes[i] == opcode]
+            for column, wanted in ranges:
+                values = self._column(block, column)
+                matches = [i for i in matches if _in_range(values[i], wanted)]
+            if not matches:
+                continue
+            columns = [self._column(block, column) for column in range(len(COLUMNS))]
+            start = self._starts[block]
+            for i in matches:
+                yield ArchiveRow(start + i, *(values[i] for values in columns))
+
+    def close(self) -> None:
+        """Closes the archive file."""
+        self._file.close()
+
+    def __enter__(self) -> "ArchiveReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _block_of(self, index: int) -> int:
+        """Returns the block holding row `index`."""
+        return bisect_right(self._starts, index) - 1
+
+    def _column(self, block: int, column: int) -> array:
+        """Returns one decompressed column of a block, reading it on first use."""
+        if block != self._cached_block:
+            self._cached_block = block
+            self._cached_columns = {}
+        values = self._cached_columns.get(column)
+        if values is None:
+            info = self.blocks[block]
+            offset, length = info.columns[column]
+            self._file.seek(offset)
+            data = self._decompress(self._file.read(length))
+            if info.shuffled >> column & 1:
+                data = _unshuffle(data)
+            values = array('B' if column == 0 else 'd', data)
+            if _BIG_ENDIAN and column:  # pragma: no cover - little-endian hosts only in CI
+                values.byteswap()
+            self._cached_columns[column] = values
+        return values
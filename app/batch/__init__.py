@@ -0,0 +1,266 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Batch File Processing
+Streams CSV/TSV files of calculations through the CalculationFactory
+"""
+
+# batch.py
+
+"""
+This module processes a delimited file of calculations (one `operation, num1, num2`
+row per line) and writes one result row per input row to an output file.
+
+The work is organized as a pipeline of generators:
+
+    read_rows -> chunk_rows -> calculate_chunks -> write_rows
+
+Only a bounded number of chunks is held in memory at a time, so memory use stays flat
+no matter how large the input file is. Each chunk runs as a single `CalculationBatch`, output
+rows are written in input order, and rows that cannot be calculated are reported
+inline in the `status` column instead of stopping the run.
+
+With `jobs > 1` the calculate stage fans chunks out to a pool of worker processes.
+The parent only finds the byte range of each chunk; every worker reads, decodes and
+parses its own range of the file, so rows are never pickled on the way in. Chunk sizes
+adapt to the latency measured in the workers, and a reorder buffer puts the finished
+chunks back in input order before they are written.
+"""
+
+import csv
+import io
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple
+
+from app.calculation import CalculationFactory, CalculationStatus
+from app.parser import parse_rows
+
+# Number of rows calculated together as one CalculationBatch.
+DEFAULT_CHUNK_ROWS = 4096
+
+OUTPUT_HEADER = ['operation', 'a', 'b', 'result', 'status']
+
+
+class BatchSummary(NamedTuple):
+    """Totals for a processed batch file."""
+    rows: int
+    errors: int
+    output_path: str
+
+
+def delimiter_for(path: str) -> str:
+    """Returns the delimiter implied by a file name: a tab for `.tsv` files, otherwise a comma."""
+    return '\t' if path.lower().endswith('.tsv') else ','
+
+
+def default_output_path(input_path: str) -> str:
+    """Returns the output file used when none is given: `jobs.csv` -> `jobs.results.csv`."""
+    root, ext = os.path.splitext(input_path)
+    return f"{root}.results{ext or '.csv'}"
+
+
+def check_output_path(input_path: str, output_path: str) -> None:
+    """
+    Refuses to write results over the input file, which opening the output would truncate.
+
+    **Raises:**
+    - `ValueError`: If `output_path` is the input file, under any name.
+    """
+    if os.path.exists(output_path) and os.path.samefile(input_path, output_path):
+        raise ValueError(f"Output file {output_path} is the input file.")
+
+
+def read_rows(infile: TextIO, delimiter: str = ',', skip_header: bool = False) -> Iterator[List[str]]:
+    """Yields the non-blank rows of an open delimited file one at a time."""
+    reader = csv.reader(infile, delimiter=delimiter)
+    if skip_header:
+        next(reader, None)
+    for row in reader:
+        if row and any(field.strip() for field in row):
+            yield row
+
+
+def chunk_rows(rows: Iterable[List[str]], size: int = DEFAULT_CHUNK_ROWS) -> Iterator[List[List[str]]]:
+    """Groups rows into lists of at most `size` rows."""
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def calculate_chunk(rows: List[List[str]]) -> List[List[str]]:
+    """
+    Calculates one chunk of rows as a single CalculationBatch and returns the output rows.
+
+    Each output row is the input fields followed by the result and a status: `OK`, or 
+    the error message for a row that could not be parsed or calculated.
+    """
+    opcodes, a_values, b_values, slots = parse_rows(rows)
+    batch = CalculationFactory.create_many(opcodes, a_values, b_values).execute()
+    output: List[List[str]] = []
+    position = 0
+    for row, slot in zip(rows, slots):
+        cells = (row + ['', '', ''])[:3]
+        if slot is not None:
+            output.append(cells + ['', slot])
+            continue
+        code = batch.status[position]
+        if code:
+            output.append(cells + ['', CalculationStatus(code).message])
+        else:
+            output.append(cells + [repr(batch.results[position]), CalculationStatus.OK.message])
+        position += 1
+    return output
+
+
+def calculate_chunks(chunks: Iterable[List[List[str]]]) -> Iterator[List[List[str]]]:
+    """Calculates each chunk in turn, yielding its output rows."""
+    for chunk in chunks:
+        yield calculate_chunk(chunk)
+
+
+# -----------------------------------------------------------------------------------
+# Parallel execution
+# -----------------------------------------------------------------------------------
+
+class AdaptiveChunkSize:
+    """
+    Tunes the number of rows per chunk so each chunk takes about `target_seconds` in a worker.
+
+    Chunks that are too small spend their time on inter-process overhead; chunks that are 
+    too large leave workers idle at the end of the run and hold more rows in memory. Each 
+    finished chunk reports its measured throughput, and the next size moves halfway 
+    towards the size that would hit the target latency.
+    """
+
+    def __init__(self, initial: int = 1024, target_seconds: float = 0.05,
+                 minimum: int = 64, maximum: int = 65536) -> None:
+        self.size: int = initial
+        self.target_seconds: float = target_seconds
+        self.minimum: int = minimum
+        self.maximum: int = maximum
+
+    def observe(self, rows: int, elapsed: float) -> None:
+        """Records the time a worker took for a chunk of `rows` rows and updates `size`."""
+        if rows <= 0:
+            return
+        ideal = rows * self.target_seconds / max(elapsed, 1e-6)
+        self.size = int(min(self.maximum, max(self.minimum, (self.size + ideal) / 2)))
+
+
+def calculate_range(path: str, start: int, stop: int, delimiter: str = ',') -> List[List[str]]:
+    """
+    Reads the rows in bytes `start` to `stop` of a delimited file and calculates them as one chunk.
+
+    The range must start at the beginning of a line and end just after a line break. It is
+    decoded with the same default encoding `process_file` uses for the whole file.
+    """
+    with open(path, 'rb') as infile:
+        infile.seek(start)
+        data = infile.read(stop - start)
+    return calculate_chunk(list(read_rows(io.TextIOWrapper(io.BytesIO(data), newline=''), delimiter)))
+
+
+def _calculate_range_timed(path: str, start: int, stop: int, delimiter: str) -> Tuple[List[List[str]], float]:
+    """Runs `calculate_range` in a worker and reports how long it took."""
+    started = time.perf_counter()
+    output = calculate_range(path, start, stop, delimiter)
+    return output, time.perf_counter() - started
+
+
+def calculate_chunks_parallel(path: str, jobs: int, delimiter: str = ',', skip_header: bool = False,
+                              sizer: Optional[AdaptiveChunkSize] = None) -> Iterator[List[List[str]]]:
+    """
+    Calculates the rows of a delimited file in `jobs` worker processes, yielding output 
+    chunks in input order.
+
+    Each chunk is `sizer.size` lines of the file. The parent only reads the raw lines to find 
+    where each chunk ends and hands the workers byte ranges, so rows cannot contain line 
+    breaks inside quoted fields. At most `2 * jobs` chunks are in flight at once, which 
+    keeps every worker busy while bounding memory. Finished chunks wait in a reorder buffer 
+    until all earlier chunks have been yielded.
+    """
+    sizer = sizer or AdaptiveChunkSize()
+    in_flight: Dict[Future, Tuple[int, int]] = {}
+    ready: Dict[int, List[List[str]]] = {}
+    next_submit = next_yield = 0
+    exhausted = False
+    with open(path, 'rb') as infile, ProcessPoolExecutor(max_workers=jobs) as executor:
+        if skip_header:
+            infile.readline()
+        while True:
+            while not exhausted and len(in_flight) < 2 * jobs:
+                start = infile.tell()
+                lines = sum(1 for _ in islice(infile, sizer.size))
+                if not lines:
+                    exhausted = True
+                    break
+                future = executor.submit(_calculate_range_timed, path, start, infile.tell(), delimiter)
+                in_flight[future] = (next_submit, lines)
+                next_submit += 1
+            if not in_flight:
+                break
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                sequence, size = in_flight.pop(future)
+                output, elapsed = future.result()
+                sizer.observe(size, elapsed)
+                ready[sequence] = output
+            while next_yield in ready:
+                yield ready.pop(next_yield)
+                next_yield += 1
+
+
+def write_rows(path: str, chunks: Iterable[List[List[str]]], delimiter: Optional[str] = None) -> BatchSummary:
+    """Writes the header and every output chunk to `path` and returns the totals."""
+    rows = errors = 0
+    with open(path, 'w', newline='') as outfile:
+        writer = csv.writer(outfile, delimiter=delimiter or delimiter_for(path), lineterminator='\n')
+        writer.writerow(OUTPUT_HEADER)
+        for chunk in chunks:
+            writer.writerows(chunk)
+            rows += len(chunk)
+            errors += sum(1 for row in chunk if row[4] != CalculationStatus.OK.message)
+    return BatchSummary(rows, errors, path)
+
+
+def process_file(input_path: str, output_path: Optional[str] = None, delimiter: Optional[str] = None,
+                 skip_header: bool = False, chunk_rows_size: int = DEFAULT_CHUNK_ROWS,
+                 jobs: int = 1) -> BatchSummary:
+    """
+    Runs every row of a delimited calculation file and streams the results to an output file.
+
+    **Parameters:**
+    - `input_path (str)`: The CSV/TSV file of `operation, num1, num2` rows.
+    - `output_path (Optional[str])`: Where to write results (default: `<input>.results.<ext>`).
+    - `delimiter (Optional[str])`: The field delimiter (default: from the file extension).
+    - `skip_header (bool)`: Skip the first row of the input.
+    - `chunk_rows_size (int)`: Number of rows calculated together per batch (with 
+      `jobs > 1` this is only the starting size; it then adapts to measured latency).
+    - `jobs (int)`: Number of worker processes. `1` calculates in the current process. With 
+      more jobs, rows cannot contain line breaks inside quoted fields.
+
+    **Returns:**
+    - `BatchSummary`: The number of rows written, how many failed, and the output path.
+
+    **Raises:**
+    - `OSError`: If a file cannot be opened.
+    - `ValueError`: If the output path is the input file, or the input cannot be decoded.
+    - `csv.Error`: If the input is not a valid delimited file.
+    """
+    output_path = output_path or default_output_path(input_path)
+    check_output_path(input_path, output_path)
+    input_delimiter = delimiter or delimiter_for(input_path)
+    # The input is opened before the output so a missing file never leaves an empty result file behind.
+    with open(input_path, newline='') as infile:
+        if jobs > 1:
+            results = calculate_chunks_parallel(input_path, jobs, input_delimiter, skip_header,
+                                                AdaptiveChunkSize(initial=chunk_rows_size))
+        else:
+            results = calculate_chunks(chunk_rows(read_rows(infile, input_delimiter, skip_header), chunk_rows_size))
+        return write_rows(output_path, results, delimiter)
@@ -0,0 +1,231 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Binary Batch Files
+Fixed-width binary calculation records read and written through mmap
+"""
+
+# binary.py
+
+"""
+This module defines a fixed-width binary format for bulk calculation jobs, so large
+inputs can be processed without parsing text.
+
+**Request file** (`.bin`):
+- An 8-byte header: `b'CALCREQ1'`.
+- One 17-byte record per calculation: a 1-byte opcode (see `CalculationFactory.opcode`)
+  followed by two little-endian float64 operands (`struct` format `'<Bdd'`).
+
+**Result file**:
+- An 8-byte header: `b'CALCRES1'`.
+- One 9-byte record per request, in the same order: a 1-byte `CalculationStatus`
+  followed by the little-endian float64 result (`'<Bd'`).
+
+Both files are accessed through `mmap`. With NumPy installed, `BinaryBatchReader.columns`
+returns strided views straight into the mapped file, so the operand columns are never
+copied or parsed. Without NumPy the records are decoded with `struct.iter_unpack` over a
+memoryview of the mapping, which still avoids creating any intermediate bytes objects.
+"""
+
+import mmap
+import os
+import struct
+from array import array
+from typing import Iterable, Iterator, Optional, Tuple
+
+from app.batch import BatchSummary, check_output_path
+from app.calculation import CalculationBatch, CalculationStatus
+from app.operation import batch_backend
+
+REQUEST_MAGIC = b'CALCREQ1'
+RESULT_MAGIC = b'CALCRES1'
+HEADER_SIZE = 8
+
+REQUEST_RECORD = struct.Struct('<Bdd')
+RESULT_RECORD = struct.Struct('<Bd')
+
+# Number of records calculated together as one CalculationBatch.
+DEFAULT_CHUNK_RECORDS = 1 << 18
+
+
+def _numpy():
+    """Returns the NumPy module when the NumPy batch backend is active, otherwise None."""
+    if batch_backend() != 'numpy':
+        return None
+    from app.operation import np
+    return np
+
+
+def _request_dtype(np):
+    """The NumPy structured dtype of a request record (packed, 17 bytes)."""
+    return np.dtype([('opcode', 'u1'), ('a', '<f8'), ('b', '<f8')])
+
+
+def _result_dtype(np):
+    """The NumPy structured dtype of a result record (packed, 9 bytes)."""
+    return np.dtype([('status', 'u1'), ('result', '<f8')])
+
+
+def is_binary_file(path: str) -> bool:
+    """Returns True when `path` starts with the request file header."""
+    try:
+        with open(path, 'rb') as infile:
+            return infile.read(HEADER_SIZE) == REQUEST_MAGIC
+    except OSError:
+        return False
+
+
+def default_output_path(input_path: str) -> str:
+    """Returns the result file used when none is given: `jobs.bin` -> `jobs.results.bin`."""
+    root, ext = os.path.splitext(input_path)
+    return f"{root}.results{ext or '.bin'}"
+
+
+def write_requests(path: str, rows: Iterable[Tuple[int, float, float]]) -> int:
+    """
+    Writes `(opcode, a, b)` rows as a request file and returns the number of records.
+    """
+    count = 0
+    pack = REQUEST_RECORD.pack
+    with open(path, 'wb') as outfile:
+        outfile.write(REQUEST_MAGIC)
+        for opcode, a, b in rows:
+            outfile.write(pack(opcode, a, b))
+            count += 1
+    return count
+
+
+class BinaryBatchReader:
+    """
+    Memory-maps a request file and exposes its records without copying them.
+
+    Use it as a context manager so the mapping is released when you are done:
+
+        with BinaryBatchReader('jobs.bin') as reader:
+            opcodes, a, b = reader.columns()
+    """
+
+    def __init__(self, path: str) -> None:
+        self._file = open(path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"'{path}' is not a binary request file.") from None
+        if self._mmap[:HEADER_SIZE] != REQUEST_MAGIC or (len(self._mmap) - HEADER_SIZE) % REQUEST_RECORD.size:
+            self.close()
+            raise ValueError(f"'{path}' is not a binary request file.")
+        self.records: memoryview = memoryview(self._mmap)[HEADER_SIZE:]
+
+    def __len__(self) -> int:
+        return len(self.records) // REQUEST_RECORD.size
+
+    def __enter__(self) -> "BinaryBatchReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Releases the memoryview, the mapping and the file."""
+        if getattr(self, 'records', None) is not None:
+            self.records.release()
+            self.records = None
+        self._mmap.close()
+        self._file.close()
+
+    def iter_records(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Tuple[int, float, float]]:
+        """Yields `(opcode, a, b)` for records `start` to `stop`, decoded in place with struct.iter_unpack."""
+        stop = len(self) if stop is None else stop
+        size = REQUEST_RECORD.size
+        return REQUEST_RECORD.iter_unpack(self.records[start * size:stop * size])
+
+    def columns(self, start: int = 0, stop: Optional[int] = None):
+        """
+        Returns the `(opcodes, a, b)` columns of records `start` to `stop`.
+
+        With NumPy these are zero-copy strided views into the mapped file; drop them
+        before closing the reader. Without NumPy they are `array('B')`/`array('d')`
+        columns filled from `iter_records`.
+        """
+        stop = len(self) if stop is None else stop
+        np = _numpy()
+        if np is not None:
+            records = np.frombuffer(self.records, dtype=_request_dtype(np), count=stop - start,
+                                    offset=start * REQUEST_RECORD.size)
+            return records['opcode'], records['a'], records['b']
+        opcodes, a_values, b_values = array('B'), array('d'), array('d')
+        for opcode, a, b in self.iter_records(start, stop):
+            opcodes.append(opcode)
+            a_values.append(a)
+            b_values.append(b)
+        return opcodes, a_values, b_values
+
+
+def process_binary_file(input_path: str, output_path: Optional[str] = None,
+                        chunk_records: int = DEFAULT_CHUNK_RECORDS) -> BatchSummary:
+    """
+    Calculates every record of a request file into a memory-mapped result file.
+
+    The result file is created at its final size up front and filled chunk by chunk, so
+    memory use is bounded by `chunk_records` no matter how large the input is.
+
+    **Returns:**
+    - `BatchSummary`: The number of records, how many failed, and the output path.
+
+    **Raises:**
+    - `ValueError`: If the input is not a request file or the output path is the input file.
+    """
+    output_path = output_path or default_output_path(input_path)
+    errors = 0
+    with BinaryBatchReader(input_path) as reader:
+        check_output_path(input_path, output_path)
+        count = len(reader)
+        with open(output_path, 'w+b') as outfile:
+            outfile.truncate(HEADER_SIZE + count * RESULT_RECORD.size)
+            with mmap.mmap(outfile.fileno(), 0) as out:
+                out[:HEADER_SIZE] = RESULT_MAGIC
+                for start in range(0, count, chunk_records):
+                    errors += _calculate_records(reader, out, start, min(start + chunk_records, count))
+                out.flush()
+    return BatchSummary(count, errors, output_path)
+
+
+def _calculate_records(reader: BinaryBatchReader, out: mmap.mmap, start: int, stop: int) -> int:
+    """
+    Executes records `start` to `stop` and writes their results, returning the error count.
+
+    With NumPy the batch reads the strided column views of the mapped input directly. The 
+    views go out of scope on return, so the reader's mapping can be closed afterwards.
+    """
+    batch = CalculationBatch(*reader.columns(start, stop)).execute()
+    return _write_results(out, start, batch)
+
+
+def _write_results(out: mmap.mmap, start: int, batch: CalculationBatch) -> int:
+    """Writes a batch's status and result columns into the result file and returns its error count."""
+    offset = HEADER_SIZE + start * RESULT_RECORD.size
+    np = _numpy()
+    if np is not None:
+        records = np.frombuffer(out, dtype=_result_dtype(np), count=len(batch), offset=offset)
+        status = np.frombuffer(batch.status, dtype=np.uint8)
+        records['status'] = status
+        records['result'] = np.frombuffer(batch.results, dtype=np.float64)
+        errors = int(np.count_nonzero(status))
+        del records  # Drop the view so the mapping can be closed.
+        return errors
+    pack_into = RESULT_RECORD.pack_into
+    for status, result in zip(batch.status, batch.results):
+        pack_into(out, offset, status, result)
+        offset += RESULT_RECORD.size
+    return len(batch) - batch.status.count(CalculationStatus.OK)
+
+
+def read_results(path: str) -> Iterator[Tuple[CalculationStatus, float]]:
+    """Yields `(status, result)` for every record of a result file."""
+    with open(path, 'rb') as infile, mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        if mapped[:HEADER_SIZE] != RESULT_MAGIC:
+            raise ValueError(f"'{path}' is not a binary result file.")
+        with memoryview(mapped)[HEADER_SIZE:] as records:
+            for status, result in RESULT_RECORD.iter_unpack(records):
+                yield CalculationStatus(status), result
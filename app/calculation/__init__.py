@@ -17,12 +17,63 @@ Implemented ModulusCalculation and PowerCalculation with factory registration
 # methods that they must implement. This helps in establishing a standard interface for 
 # similar objects without enforcing specific details on how they should work.
 from abc import ABC, abstractmethod
+import struct
+from array import array
+from collections import OrderedDict
+from enum import IntEnum
+from math import inf, isfinite, isinf, nan
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Union
 
 # Import the Operation class from the app.operation module. 
 # The Operation class is where our basic mathematical functions (e.g., addition, subtraction) are defined.
 # Rather than implementing arithmetic logic within each calculation class, we encapsulate it in a 
 # separate class to promote modularity. This makes it easier to modify or extend these functions independently.
-from app.operation import Operation
+from app.operation import BatchResult, Operation, batch_backend
+
+# Sentinel marking a Calculation whose result has not been computed yet. A dedicated
+# object is used instead of None so any value returned by `execute` can be cached.
+_UNSET = object()
+
+# -----------------------------------------------------------------------------------
+# Error-as-Value Results
+# -----------------------------------------------------------------------------------
+class CalculationStatus(IntEnum):
+    """
+    Status codes reported by the non-raising execution API (`Calculation.try_execute` 
+    and `CalculationBatch`). The values fit in one byte so batches can store a status 
+    column as an array('B'); `OK` is 0 so any non-zero status means the row failed.
+    """
+    OK = 0
+    DIV_BY_ZERO = 1  # Division or modulus by zero, or zero raised to a negative power.
+    OVERFLOW = 2  # The result is too large to represent (infinite from finite operands).
+    DOMAIN_ERROR = 3  # No real result exists, e.g. a negative base with a fractional exponent.
+    UNSUPPORTED = 4  # The row's opcode is not registered with the CalculationFactory.
+    OVERLOADED = 5  # Not calculated: the calculation server shed the row under load.
+
+    @property
+    def message(self) -> str:
+        """A short, user-facing description of the status."""
+        return _STATUS_MESSAGES[self]
+
+
+_STATUS_MESSAGES = {
+    CalculationStatus.OK: "OK",
+    CalculationStatus.DIV_BY_ZERO: "Cannot divide by zero.",
+    CalculationStatus.OVERFLOW: "Result is too large to represent.",
+    CalculationStatus.DOMAIN_ERROR: "Result is not a real number.",
+    CalculationStatus.UNSUPPORTED: "Unsupported calculation type.",
+    CalculationStatus.OVERLOADED: "Server is overloaded; try again later.",
+}
+
+
+class CalculationOutcome(NamedTuple):
+    """
+    The result of `Calculation.try_execute`: a status code and the value. The value is 
+    NaN unless the status is OK or OVERFLOW (which carries the infinite result).
+    """
+    status: CalculationStatus
+    value: float
 
 # -----------------------------------------------------------------------------------
 # Abstract Base Class: Calculation
@@ -42,8 +93,17 @@ class Calculation(ABC):
     - **Enforcing Consistency**: The abstract `execute` method enforces that all subclasses implement 
       their own specific version of the calculation logic, making sure that each type of calculation 
       has an `execute` method.
+
+    **Why Use `__slots__`?**
+    - A calculator session can keep hundreds of thousands of calculations in its history. 
+      Declaring the four attributes as slots stores them in a fixed-size layout instead of 
+      a per-instance `__dict__`, saving about a quarter of the memory of each history entry 
+      (see `benchmarks/bench_history_memory.py`).
+    - Subclasses declare `__slots__ = ()` so they add no `__dict__` of their own.
     """
 
+    __slots__ = ('a', 'b', '_result', '_str')
+
     def __init__(self, a: float, b: float) -> None:
         """
         Initializes a Calculation instance with two operands (numbers involved in the calculation).
@@ -60,6 +120,8 @@ class Calculation(ABC):
         """
         self.a: float = a  # Stores the first operand as a floating-point number.
         self.b: float = b  # Stores the second operand as a floating-point number.
+        self._result = _UNSET  # Cached result of `execute`, filled in on first access.
+        self._str = None  # Cached `__str__` rendering, built on first use.
 
     @abstractmethod
     def execute(self) -> float:
@@ -79,18 +141,105 @@ class Calculation(ABC):
         """
         pass  # The actual implementation will be provided by the subclass. # pragma: no cover
 
+    @classmethod
+    def check_operands(cls, a: float, b: float) -> CalculationStatus:
+        """
+        Looks before it leaps: reports whether `execute` would fail for these operands, 
+        without raising. Subclasses with invalid inputs (such as a zero divisor) override 
+        this; the default accepts every pair.
+        """
+        return CalculationStatus.OK
+
+    def try_execute(self) -> CalculationOutcome:
+        """
+        Executes the calculation and returns a `CalculationOutcome` instead of raising.
+
+        **Why an Error-as-Value API?**
+        - Raising and catching an exception per bad row dominates the cost of bulk 
+          processing. Invalid operands are detected up front by `check_operands`, so the 
+          common failures (zero divisors) never create an exception at all.
+        - Rare failures that can only be seen while computing (such as `OverflowError` from 
+          `**`) are still caught and turned into a status, so this method never raises for 
+          arithmetic errors.
+
+        **Returns:**
+        - `CalculationOutcome`: The status code and the value (NaN on failure).
+        """
+        status = self.check_operands(self.a, self.b)
+        if status:
+            return CalculationOutcome(status, nan)
+        try:
+            value = self.result
+        except ZeroDivisionError:
+            return CalculationOutcome(CalculationStatus.DIV_BY_ZERO, nan)
+        except OverflowError:
+            return CalculationOutcome(CalculationStatus.OVERFLOW, inf)
+        except (ArithmeticError, ValueError, TypeError):
+            return CalculationOutcome(CalculationStatus.DOMAIN_ERROR, nan)
+        if isinstance(value, complex):
+            return CalculationOutcome(CalculationStatus.DOMAIN_ERROR, nan)
+        if isinf(value) and isfinite(self.a) and isfinite(self.b):
+            return CalculationOutcome(CalculationStatus.OVERFLOW, value)
+        return CalculationOutcome(CalculationStatus.OK, value)
+
+    @classmethod
+    def execute_many(cls, a: Any, b: Any) -> BatchResult:
+        """
+        Runs this calculation over whole columns of operands and returns a `BatchResult`.
+
+        Concrete calculations override this with the matching vectorized `Operation.batch_*` 
+        kernel. This default keeps any other registered subclass usable in a batch by 
+        executing it row by row and flagging the rows that raise.
+
+        **Parameters:**
+        - `a`: The first operands (a column of floats).
+        - `b`: The second operands (a column of floats of the same length).
+        """
+        values = array('d')
+        errors = array('B')
+        for x, y in zip(a, b):
+            outcome = cls(float(x), float(y)).try_execute()
+            values.append(outcome.value)
+            errors.append(outcome.status != CalculationStatus.OK)
+        return BatchResult(values, errors)
+
+    @property
+    def result(self) -> float:
+        """
+        The result of the calculation, computed lazily on first access and cached.
+
+        **Why Cache the Result?**
+        - A calculation is displayed right after it runs and again every time the history 
+          is shown. Caching means `execute` runs at most once per Calculation, however 
+          often the result or the string form is needed afterwards.
+        - The operands are treated as fixed once the calculation is created, so the 
+          cached value can never go stale.
+        - If `execute` raises (for example on division by zero), nothing is cached and 
+          the exception propagates to the caller as before.
+
+        **Returns:**
+        - `float`: The result of the calculation.
+        """
+        if self._result is _UNSET:
+            self._result = self.execute()
+        return self._result
+
     def __str__(self) -> str:
         """
         Provides a user-friendly string representation of the Calculation instance, 
         showing the operation name, operands, and result. This enhances **Readability** 
         and **Debugging** by giving a clear output for each calculation.
 
+        The string is built once and cached along with the result.
+
         **Returns:**
         - `str`: A string describing the calculation and its result.
         """
-        result = self.execute()  # Run the calculation to get the result.
-        operation_name = self.__class__.__name__.replace('Calculation', '')  # Derive operation name.
-        return f"{self.__class__.__name__}: {self.a} {operation_name} {self.b} = {result}"
+        if self._str is None:
+            result = self.result  # Use the cached result, computing it on first use.
+            operation_name = self.__class__.__name__.replace('Calculation', '')  # Derive operation name.
+            self._str = f"{self.__class__.__name__}: {self.a} {operation_name} {self.b} = {result}"
+        return self._str
 
     def __repr__(self) -> str:
         """
@@ -103,6 +252,206 @@ class Calculation(ABC):
         """
         return f"{self.__class__.__name__}(a={self.a}, b={self.b})"
 
+# -----------------------------------------------------------------------------------
+# Result Cache
+# -----------------------------------------------------------------------------------
+
+# Packs both operands into their exact IEEE-754 bit patterns for use in cache keys.
+_OPERAND_BITS = struct.Struct('<dd')
+
+# Number of calculations the factory caches by default.
+DEFAULT_CACHE_SIZE = 1024
+
+
+class CacheStats(NamedTuple):
+    """A snapshot of the result cache counters."""
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class ResultCache:
+    """
+    A bounded LRU cache of calculation results used by `CalculationFactory`.
+
+    **How Are Keys Built?**
+    - Each key is the canonical (lowercase) operation name plus the exact bit patterns of 
+      both operands. Comparing bits instead of float values keeps `0.0` and `-0.0` apart 
+      (they can give different results, e.g. `power -0.0 -1`), and makes NaN operands 
+      usable as keys even though `nan != nan`. All NaNs share one key since they all 
+      produce NaN.
+
+    **Why Cache Results Instead of Calculation Objects?**
+    - A float result is immutable, so callers can share it safely. Every caller still gets 
+      its own Calculation, created with the cached result already filled in, so a repeated 
+      `(operation, a, b)` triple is not recomputed.
+    - Only successful results are cached; failing calculations raise again when executed.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        """
+        **Parameters:**
+        - `maxsize (int)`: The maximum number of results kept before the least 
+          recently used one is evicted. Must be positive.
+        """
+        if maxsize <= 0:
+            raise ValueError("Cache size must be a positive integer.")
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._entries: "OrderedDict[Tuple[str, bytes], float]" = OrderedDict()
+
+    @staticmethod
+    def make_key(calculation_type: str, a: float, b: float) -> Tuple[str, bytes]:
+        """Builds the cache key for a canonical operation name and two float operands."""
+        if a != a:
+            a = float('nan')  # Canonicalize every NaN payload to the same bits.
+        if b != b:
+            b = float('nan')
+        return calculation_type, _OPERAND_BITS.pack(a, b)
+
+    def get(self, key: Tuple[str, bytes]) -> Optional[float]:
+        """Returns the cached result for `key`, or None, updating the hit/miss counters."""
+        result = self._entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)  # Mark as most recently used.
+        self.hits += 1
+        return result
+
+    def put(self, key: Tuple[str, bytes], result: float) -> None:
+        """Stores a result, evicting the least recently used one when the cache is full."""
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Removes every cached result and resets the counters."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> CacheStats:
+        """Returns the current counters."""
+        return CacheStats(self.hits, self.misses, self.evictions, len(self._entries), self.maxsize)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Number of distinct calculations the heavy-hitter tracker counts by default.
+DEFAULT_TRACKER_SIZE = 256
+
+
+class HeavyHitter(NamedTuple):
+    """
+    One frequently requested calculation. `count` may overestimate the true number of
+    requests by at most `error`, so `count - error` is a guaranteed lower bound.
+    """
+    operation: str
+    a: float
+    b: float
+    count: int
+    error: int
+
+
+class HeavyHitterTracker:
+    """
+    Finds the most frequently requested `(operation, a, b)` triples in bounded memory
+    with the Space-Saving algorithm.
+
+    **How Does Space-Saving Work?**
+    - At most `capacity` triples are counted. A triple that is not counted yet takes the
+      place of the one with the lowest count and inherits that count (recorded as its
+      `error`) plus one. Any triple requested more than `total / capacity` times is
+      guaranteed to be among the counted ones.
+    - Counted triples are grouped in buckets by count, and the lowest non-empty count is
+      tracked, so every request is counted in O(1) time.
+
+    **Parameters:**
+    - `capacity (int)`: The number of distinct triples counted. Must be positive.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_TRACKER_SIZE) -> None:
+        if capacity <= 0:
+            raise ValueError("Tracker size must be a positive integer.")
+        self.capacity: int = capacity
+        self.total: int = 0
+        # key -> [count, error, operation, a, b]; keys are ResultCache keys.
+        self._counters: Dict[Tuple[str, bytes], list] = {}
+        # count -> the keys with that count, in the order they reached it.
+        self._buckets: Dict[int, Dict[Tuple[str, bytes], None]] = {}
+        self._min_count = 0
+
+    def add(self, key: Tuple[str, bytes], operation: str, a: float, b: float, count: int = 1) -> None:
+        """Counts `count` requests of the calculation with the given ResultCache key."""
+        self.total += count
+        counter = self._counters.get(key)
+        if counter is not None and count == 1 and counter[0] != self._min_count:
+            # Fast path: one more request for a counted triple that is not at the minimum,
+            # so the minimum cannot change.
+            old = counter[0]
+            bucket = self._buckets[old]
+            del bucket[key]
+            if not bucket:
+                del self._buckets[old]
+            counter[0] = old + 1
+            self._buckets.setdefault(old + 1, {})[key] = None
+            return
+        emptied = False
+        if counter is None:
+            if len(self._counters) < self.capacity:
+                counter = self._counters[key] = [0, 0, operation, a, b]
+            else:
+                # Take over the counter of the oldest of the least counted triples.
+                evicted = next(iter(self._buckets[self._min_count]))
+                counter = self._counters.pop(evicted)
+                self._counters[key] = counter
+                counter[1:] = [counter[0], operation, a, b]
+                emptied = self._unlink(evicted, counter[0])
+        else:
+            emptied = self._unlink(key, counter[0])
+        old = counter[0]
+        counter[0] += count
+        self._buckets.setdefault(counter[0], {})[key] = None
+        if len(self._counters) == 1:
+            self._min_count = counter[0]
+        elif emptied and old == self._min_count:
+            # Every other count is above `old`, so with single increments it is now `old + 1`.
+            self._min_count = counter[0] if count == 1 else min(self._buckets)
+        else:
+            self._min_count = min(self._min_count, counter[0])
+
+    def top(self, k: Optional[int] = None) -> List[HeavyHitter]:
+        """Returns the `k` most requested calculations (all counted ones if None), most first."""
+        ranked = sorted(self._counters.values(), key=lambda counter: (-counter[0], counter[1]))
+        return [HeavyHitter(operation, a, b, count, error)
+                for count, error, operation, a, b in ranked[:k]]
+
+    def clear(self) -> None:
+        """Forgets every counted calculation."""
+        self.total = 0
+        self._counters.clear()
+        self._buckets.clear()
+        self._min_count = 0
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+    def _unlink(self, key: Tuple[str, bytes], count: int) -> bool:
+        """Removes a key from the bucket of its count; returns True if the bucket emptied."""
+        bucket = self._buckets[count]
+        del bucket[key]
+        if bucket:
+            return False
+        del self._buckets[count]
+        return True
+
 # -----------------------------------------------------------------------------------
 # Factory Class: CalculationFactory
 # -----------------------------------------------------------------------------------
@@ -125,6 +474,22 @@ class CalculationFactory:
     # (like "add" or "subtract") to their respective classes.
     _calculations = {}
 
+    # _opcodes maps each calculation type to a compact integer opcode in registration 
+    # order, and _opcode_classes maps opcodes back to classes. Opcodes fit in one byte 
+    # so batches can store the operation column as an array('B').
+    _opcodes: Dict[str, int] = {}
+    _opcode_classes: List[type] = []
+
+    # _result_cache holds recently computed results so repeated (operation, a, b) 
+    # triples are not recomputed. Caching is opt-in (see `configure_cache`); None 
+    # disables it.
+    _result_cache: Optional[ResultCache] = None
+
+    # _tracker counts requests per (operation, a, b) triple to find the most frequent 
+    # ones, which can be saved and used to pre-warm the cache of a new process. Tracking 
+    # is opt-in (see `configure_tracker`); None disables it.
+    _tracker: Optional[HeavyHitterTracker] = None
+
     @classmethod
     def register_calculation(cls, calculation_type: str):
         """
@@ -149,8 +514,12 @@ class CalculationFactory:
             # Check if the calculation type has already been registered to avoid duplication.
             if calculation_type_lower in cls._calculations:
                 raise ValueError(f"Calculation type '{calculation_type}' is already registered.")
-            # Register the subclass in the _calculations dictionary.
+            if len(cls._opcode_classes) > 255:
+                raise ValueError("At most 256 calculation types can be registered.")
+            # Register the subclass in the _calculations dictionary and give it the next opcode.
             cls._calculations[calculation_type_lower] = subclass
+            cls._opcodes[calculation_type_lower] = len(cls._opcode_classes)
+            cls._opcode_classes.append(subclass)
             return subclass  # Return the subclass for chaining or additional use.
         return decorator  # Return the decorator function.
 
@@ -166,7 +535,9 @@ class CalculationFactory:
         - `b (float)`: The second operand.
         
         **Returns:**
-        - `Calculation`: An instance of the appropriate Calculation subclass.
+        - `Calculation`: A new instance of the appropriate Calculation subclass. When the 
+          result cache is enabled, its result is computed now, or taken from the cache 
+          for a repeated request.
 
         **How Does This Help?**
         - By centralizing object creation here, we only need to specify calculation types 
@@ -181,8 +552,307 @@ class CalculationFactory:
         if not calculation_class:
             available_types = ', '.join(cls._calculations.keys())
             raise ValueError(f"Unsupported calculation type: '{calculation_type}'. Available types: {available_types}")
-        # Create and return an instance of the requested calculation class with the provided operands.
-        return calculation_class(a, b)
+        # Only exact floats are cached: 10 and 10.0 share bits but render differently.
+        cache, tracker = cls._result_cache, cls._tracker
+        if (cache is None and tracker is None) or type(a) is not float or type(b) is not float:
+            return calculation_class(a, b)
+        key = ResultCache.make_key(calculation_type_lower, a, b)
+        if tracker is not None:
+            tracker.add(key, calculation_type_lower, a, b)
+        if cache is None:
+            return calculation_class(a, b)
+        calculation = calculation_class(a, b)
+        result = cache.get(key)
+        if result is not None:
+            calculation._result = result  # Start from the cached result.
+        elif not calculation.try_execute().status:
+            cache.put(key, calculation.result)
+        return calculation
+
+    @classmethod
+    def opcode(cls, calculation_type: str) -> int:
+        """
+        Returns the one-byte opcode registered for a calculation type.
+
+        **Raises:**
+        - `ValueError`: If the calculation type is not registered.
+        """
+        opcode = cls._opcodes.get(calculation_type.lower())
+        if opcode is None:
+            available_types = ', '.join(cls._calculations.keys())
+            raise ValueError(f"Unsupported calculation type: '{calculation_type}'. Available types: {available_types}")
+        return opcode
+
+    @classmethod
+    def lookup_opcode(cls, calculation_type: str) -> Optional[int]:
+        """Returns the opcode registered for a calculation type, or None if it is not registered."""
+        opcode = cls._opcodes.get(calculation_type)
+        return opcode if opcode is not None else cls._opcodes.get(calculation_type.lower())
+
+    @classmethod
+    def opcode_table(cls) -> Mapping[str, int]:
+        """
+        Returns a read-only, live view of the lowercase calculation type to opcode mapping.
+
+        Bulk parsers map whole columns of operation names through its `get` method.
+        """
+        return MappingProxyType(cls._opcodes)
+
+    @classmethod
+    def registered_count(cls) -> int:
+        """Returns the number of registered calculation types; valid opcodes are below it."""
+        return len(cls._opcode_classes)
+
+    @classmethod
+    def calculation_class(cls, opcode: int) -> type:
+        """Returns the Calculation subclass registered under an opcode."""
+        return cls._opcode_classes[opcode]
+
+    @classmethod
+    def type_name_of(cls, calculation: Calculation) -> str:
+        """
+        Returns the calculation type a calculation's class is registered under.
+
+        **Raises:**
+        - `ValueError`: If the calculation's class is not registered.
+        """
+        for calculation_type, subclass in cls._calculations.items():
+            if subclass is type(calculation):
+                return calculation_type
+        raise ValueError(f"{type(calculation).__name__} is not a registered calculation type.")
+
+    @classmethod
+    def opcode_of(cls, calculation: Calculation) -> int:
+        """
+        Returns the opcode of a calculation's registered class.
+
+        **Raises:**
+        - `ValueError`: If the calculation's class is not registered.
+        """
+        return cls._opcodes[cls.type_name_of(calculation)]
+
+    @classmethod
+    def create_many(cls, operations: Iterable[Union[str, int]], a_values: Iterable[float],
+                    b_values: Iterable[float]) -> "CalculationBatch":
+        """
+        Creates a `CalculationBatch` holding many calculations as parallel columns.
+
+        Unlike `create_calculation`, no Calculation object is built per row: operation 
+        names are resolved to opcodes once per row and the operands are packed straight 
+        into float64 columns.
+
+        **Parameters:**
+        - `operations`: Calculation types (e.g. 'add') or opcodes, one per row.
+        - `a_values`: The first operand of each row.
+        - `b_values`: The second operand of each row.
+
+        **Raises:**
+        - `ValueError`: If an operation is not registered or the columns differ in length.
+        """
+        lookup = cls._opcodes
+        opcodes = array('B')
+        for row, operation in enumerate(operations):
+            if isinstance(operation, str):
+                opcode = lookup.get(operation)
+                if opcode is None:
+                    opcode = lookup.get(operation.lower())
+                if opcode is None:
+                    raise ValueError(f"Row {row}: unsupported calculation type: '{operation}'.")
+            elif 0 <= operation < len(cls._opcode_classes):
+                opcode = operation
+            else:
+                raise ValueError(f"Row {row}: unknown opcode {operation}.")
+            opcodes.append(opcode)
+        return CalculationBatch(opcodes, array('d', a_values), array('d', b_values))
+
+    @classmethod
+    def configure_cache(cls, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        """
+        Replaces the result cache with an empty one of the given size. The factory starts 
+        without a cache.
+
+        **Parameters:**
+        - `maxsize (int)`: The maximum number of cached results. `0` disables the cache.
+        """
+        cls._result_cache = ResultCache(maxsize) if maxsize > 0 else None
+
+    @classmethod
+    def cache_stats(cls) -> Optional[CacheStats]:
+        """Returns the result cache counters, or None when the cache is disabled."""
+        return cls._result_cache.stats() if cls._result_cache is not None else None
+
+    @classmethod
+    def configure_tracker(cls, capacity: int = DEFAULT_TRACKER_SIZE) -> None:
+        """
+        Replaces the heavy-hitter tracker with an empty one.
+
+        **Parameters:**
+        - `capacity (int)`: The number of distinct calculations counted. `0` disables tracking.
+        """
+        cls._tracker = HeavyHitterTracker(capacity) if capacity > 0 else None
+
+    @classmethod
+    def tracker(cls) -> Optional[HeavyHitterTracker]:
+        """Returns the heavy-hitter tracker, or None when tracking is disabled."""
+        return cls._tracker
+
+    @classmethod
+    def prewarm(cls, hitters: Iterable[HeavyHitter]) -> int:
+        """
+        Fills the result cache with the results of the given calculations, computing each 
+        one now, so the first requests for them are cache hits. The first hitters are 
+        treated as the most frequent and are the last to be evicted. Calculations that 
+        fail are skipped. Prewarming does not count as requests to the tracker.
+
+        **Returns:**
+        - `int`: The number of results added to the cache (0 when it is disabled).
+        """
+        cache = cls._result_cache
+        if cache is None:
+            return 0
+        warmed = []
+        for hitter in hitters:
+            if len(warmed) == cache.maxsize:
+                break
+            calculation_class = cls._calculations.get(hitter.operation)
+            if calculation_class is None:
+                continue
+            outcome = calculation_class(hitter.a, hitter.b).try_execute()
+            if not outcome.status:
+                warmed.append((ResultCache.make_key(hitter.operation, hitter.a, hitter.b), outcome.value))
+        for key, result in reversed(warmed):
+            cache.put(key, result)
+        return len(warmed)
+
+# -----------------------------------------------------------------------------------
+# Columnar Batch: CalculationBatch
+# -----------------------------------------------------------------------------------
+# Batch kernels flag failed rows with 1 in the status column before classification.
+_KERNEL_ERROR = 1
+
+
+class CalculationBatch:
+    """
+    A batch of calculations stored as parallel columns instead of Calculation objects.
+
+    **Columns:**
+    - `opcodes (array('B'))`: The opcode of each row (see `CalculationFactory.opcode`).
+    - `a (array('d'))`, `b (array('d'))`: The operands of each row.
+      With the NumPy backend the input columns may also be NumPy views of the same item 
+      types, including strided ones, which are read in place without a copy.
+    - `results (array('d'))`: The result of each row, NaN until executed and for failed rows.
+    - `status (array('B'))`: The `CalculationStatus` of each row once executed. Rows 
+      whose opcode is not registered get `UNSUPPORTED` instead of stopping the batch.
+
+    **Why Columns?**
+    - A multi-million-row job held as Calculation objects would allocate one Python object 
+      per row. Columns hold the same data in a few flat float64 buffers.
+    - `execute` groups the rows by opcode and runs each calculation's vectorized kernel 
+      (`Calculation.execute_many`) once per group, instead of dispatching once per row.
+    - Failures never raise: they are recorded in the status column, so a batch of mixed 
+      good and bad rows runs at full speed.
+    """
+
+    __slots__ = ('opcodes', 'a', 'b', 'results', 'status')
+
+    def __init__(self, opcodes: array, a: array, b: array) -> None:
+        if not len(opcodes) == len(a) == len(b):
+            raise ValueError("Batch columns must all have the same length.")
+        self.opcodes: array = opcodes
+        self.a: array = a
+        self.b: array = b
+        self.results: array = array('d', [nan]) * len(opcodes)
+        self.status: array = array('B', bytes(len(opcodes)))
+
+    def __len__(self) -> int:
+        return len(self.opcodes)
+
+    def execute(self) -> "CalculationBatch":
+        """
+        Computes every row, one kernel call per distinct operation, and returns the batch.
+
+        Rows flagged by a kernel are then given their precise `CalculationStatus` and 
+        finite-operand rows with an infinite result are marked as OVERFLOW. Both passes 
+        only touch the affected rows, which are rare in practice.
+        """
+        if not len(self):
+            return self
+        if batch_backend() == 'numpy':
+            self._execute_numpy()
+        else:
+            self._execute_stdlib()
+        return self
+
+    def _execute_numpy(self) -> None:
+        """Groups rows with a stable argsort and gathers/scatters each run with fancy indexing."""
+        from app.operation import np
+        opcodes = np.asarray(self.opcodes, dtype=np.uint8)
+        a = np.asarray(self.a, dtype=np.float64)
+        b = np.asarray(self.b, dtype=np.float64)
+        results = np.frombuffer(self.results, dtype=np.float64)
+        status = np.frombuffer(self.status, dtype=np.uint8)
+        order = np.argsort(opcodes, kind='stable')
+        bounds = np.flatnonzero(np.diff(opcodes[order])) + 1
+        registered = CalculationFactory.registered_count()
+        for run in np.split(order, bounds):
+            if len(run) == len(opcodes):
+                run = slice(None)  # One operation for the whole batch: no gather needed.
+            opcode = int(opcodes[run][0])
+            if opcode >= registered:
+                status[run] = CalculationStatus.UNSUPPORTED
+                continue
+            outcome = CalculationFactory.calculation_class(opcode).execute_many(a[run], b[run])
+            results[run] = outcome.values
+            status[run] = outcome.errors
+        self._classify_failures(np.flatnonzero(status == _KERNEL_ERROR).tolist())
+        overflow = (status == 0) & np.isinf(results) & np.isfinite(a) & np.isfinite(b)
+        status[overflow] = CalculationStatus.OVERFLOW
+
+    def _execute_stdlib(self) -> None:
+        """Groups row indices per opcode and gathers/scatters each run with array columns."""
+        groups: Dict[int, List[int]] = {}
+        for row, opcode in enumerate(self.opcodes):
+            groups.setdefault(opcode, []).append(row)
+        a, b, results, status = self.a, self.b, self.results, self.status
+        registered = CalculationFactory.registered_count()
+        for opcode, rows in groups.items():
+            if opcode >= registered:
+                for row in rows:
+                    status[row] = CalculationStatus.UNSUPPORTED
+                continue
+            calculation_class = CalculationFactory.calculation_class(opcode)
+            if len(rows) == len(self.opcodes):
+                outcome = calculation_class.execute_many(a, b)
+                results[:] = array('d', outcome.values)
+                status[:] = array('B', outcome.errors)
+                continue
+            outcome = calculation_class.execute_many(array('d', map(a.__getitem__, rows)),
+                                                     array('d', map(b.__getitem__, rows)))
+            for row, value, error in zip(rows, outcome.values, outcome.errors):
+                results[row] = value
+                status[row] = error
+        if _KERNEL_ERROR in status:
+            self._classify_failures([row for row, code in enumerate(status) if code == _KERNEL_ERROR])
+        if inf in results or -inf in results:
+            for row, value in enumerate(results):
+                if isinf(value) and not status[row] and isfinite(a[row]) and isfinite(b[row]):
+                    status[row] = CalculationStatus.OVERFLOW
+
+    def _classify_failures(self, rows: List[int]) -> None:
+        """Replaces the kernels' error flags (1) with the exact status of each failed row."""
+        for row in rows:
+            outcome = self.calculation(row).try_execute()
+            self.status[row] = outcome.status
+            self.results[row] = outcome.value
+
+    def calculation(self, row: int) -> Calculation:
+        """Builds the Calculation object for a single row, only when it is actually needed."""
+        calculation_class = CalculationFactory.calculation_class(int(self.opcodes[row]))
+        return calculation_class(float(self.a[row]), float(self.b[row]))
+
+    def outcome(self, row: int) -> CalculationOutcome:
+        """Returns the status and value of an executed row."""
+        return CalculationOutcome(CalculationStatus(self.status[row]), self.results[row])
 
 # -----------------------------------------------------------------------------------
 # Concrete Calculation Classes
@@ -204,6 +874,13 @@ class AddCalculation(Calculation):
     - **Clear Responsibility**: Each class has a clear, single purpose, making the code easier to read.
     """
 
+    __slots__ = ()
+
+    @classmethod
+    def execute_many(cls, a: Any, b: Any) -> BatchResult:
+        # Runs the whole column through the vectorized addition kernel.
+        return Operation.batch_addition(a, b)
+
     def execute(self) -> float:
         # Calls the addition method from the Operation module to perform the addition.
         return Operation.addition(self.a, self.b)
@@ -218,6 +895,13 @@ class SubtractCalculation(Calculation):
     the implementation separate from other operations.
     """
 
+    __slots__ = ()
+
+    @classmethod
+    def execute_many(cls, a: Any, b: Any) -> BatchResult:
+        # Runs the whole column through the vectorized subtraction kernel.
+        return Operation.batch_subtraction(a, b)
+
     def execute(self) -> float:
         # Calls the subtraction method from the Operation module to perform the subtraction.
         return Operation.subtraction(self.a, self.b)
@@ -232,6 +916,13 @@ class MultiplyCalculation(Calculation):
     concerns, making it easy to adjust the multiplication logic without affecting other calculations.
     """
 
+    __slots__ = ()
+
+    @classmethod
+    def execute_many(cls, a: Any, b: Any) -> BatchResult:
+        # Runs the whole column through the vectorized multiplication kernel.
+        return Operation.batch_multiplication(a, b)
+
     def execute(self) -> float:
         # Calls the multiplication method from the Operation module to perform the multiplication.
         return Operation.multiplication(self.a, self.b)
@@ -247,6 +938,18 @@ class DivideCalculation(Calculation):
     checks if the second operand is zero before performing the operation.
     """
 
+    __slots__ = ()
+
+    @classmethod
+    def execute_many(cls, a: Any, b: Any) -> BatchResult:
+        # Runs the whole column through the vectorized division kernel.
+        return Operation.batch_division(a, b)
+
+    @classmethod
+    def check_operands(cls, a: float, b: float) -> CalculationStatus:
+        # A zero divisor is reported as a status instead of raising.
+        return CalculationStatus.DIV_BY_ZERO if b == 0 else CalculationStatus.OK
+
     def execute(self) -> float:
         # Before performing division, check if `b` is zero to avoid ZeroDivisionError.
         if self.b == 0:
@@ -266,6 +969,23 @@ class PowerCalculation(Calculation):
     where we need to multiply a number by itself multiple times.
     """
 
+    __slots__ = ()
+
+    @classmethod
+    def execute_many(cls, a: Any, b: Any) -> BatchResult:
+        # Runs the whole column through the vectorized power kernel.
+        return Operation.batch_power(a, b)
+
+    @classmethod
+    def check_operands(cls, a: float, b: float) -> CalculationStatus:
+        # Zero to a negative power divides by zero; a negative base with a fractional
+        # exponent has no real result (Python would return a complex number).
+        if a == 0 and b < 0:
+            return CalculationStatus.DIV_BY_ZERO
+        if a < 0 and isfinite(a) and isfinite(b) and b != int(b):
+            return CalculationStatus.DOMAIN_ERROR
+        return CalculationStatus.OK
+
     def execute(self) -> float:
         # Calls the power method from the Operation module to perform the exponentiation.
         return Operation.power(self.a, self.b)
@@ -285,6 +1005,18 @@ class ModulusCalculation(Calculation):
     error handling to prevent modulus by zero, which would cause an error.
     """
 
+    __slots__ = ()
+
+    @classmethod
+    def execute_many(cls, a: Any, b: Any) -> BatchResult:
+        # Runs the whole column through the vectorized modulus kernel.
+        return Operation.batch_modulus(a, b)
+
+    @classmethod
+    def check_operands(cls, a: float, b: float) -> CalculationStatus:
+        # A zero divisor is reported as a status instead of raising.
+        return CalculationStatus.DIV_BY_ZERO if b == 0 else CalculationStatus.OK
+
     def execute(self) -> float:
         # Before performing modulus, check if `b` is zero to avoid ZeroDivisionError.
         if self.b == 0:
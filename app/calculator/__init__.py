@@ -21,10 +21,34 @@ Throughout the code, comments explain where and why these paradigms are used,
 providing a comprehensive learning experience for students.
 """
 
+import csv
+import os
+import shlex
+import shutil
+import sqlite3
+import subprocess
 import sys
-import readline  # Enables command history and editing features
-from typing import List
+from contextlib import suppress
+from itertools import chain, islice
+from typing import Iterable, Iterator, List, Optional, TextIO, Union
+from app.batch import process_file
 from app.calculation import Calculation, CalculationFactory
+from app.history import DEFAULT_HISTORY_CAPACITY, History
+from app.hotset import restore_hot_set, save_hot_set
+from app.parser import ParseError, parse_line
+from app.stats import RunningStats, SessionStats
+from app.store import HistoryStore, parse_time
+from app.wal import DEFAULT_RETAIN, WriteAheadLog
+
+# Number of stored calculations a history query shows unless '--last N' is given.
+DEFAULT_QUERY_LIMIT = 20
+
+# Number of calculations the 'hot' command lists.
+HOT_LIST_SIZE = 10
+
+# Entries shown by 'history page N', and history lines formatted and written at a time.
+HISTORY_PAGE_SIZE = 20
+RENDER_BATCH_LINES = 1000
 
 
 def display_help() -> None:
@@ -47,7 +71,17 @@ Usage:
 
 Special Commands:
     help      : Display this help message.
-    history   : Show the history of calculations.
+    history   : Show the history of calculations (through a pager when it is long).
+    history page N | history tail N
+              : Show page N of the history (20 entries per page) or its last N entries.
+    history [operation] [since <time>] [--last N]
+              : Search the saved history of every session, e.g. 'history divide --last 100'
+                or 'history since 2h'. <time> is an age (30m, 2h, 1d) or an ISO date-time.
+    stats     : Show count, sum, mean, variance, min and max of the results, per operation.
+    cache     : Show result cache statistics.
+    hot       : Show the most frequently requested calculations.
+    batch <file> [output]
+              : Calculate every row of a CSV/TSV file and write the results to a file.
     exit      : Exit the calculator.
 
 Examples:
@@ -61,122 +95,440 @@ Examples:
     print(help_message)
 
 
-def display_history(history: List[Calculation]) -> None:
+def history_lines(history: Union[List[Calculation], History], start: int = 0,
+                  stop: Optional[int] = None) -> Iterator[str]:
+    """
+    Lazily yields the numbered display lines of history entries `start` to `stop`.
+
+    Entries are fetched one batch at a time, so a caller that stops early (for example
+    because the reader quit the pager) never formats the rest of the history.
+
+    Parameters:
+        history (Union[List[Calculation], History]): The past calculations, oldest first.
+        start (int): Index of the first entry to show (0 is the oldest).
+        stop (Optional[int]): Index after the last entry to show; the end of the history if None.
+    """
+    stop = len(history) if stop is None else min(stop, len(history))
+    for first in range(start, stop, RENDER_BATCH_LINES):
+        count = min(RENDER_BATCH_LINES, stop - first)
+        entries = history.page(first, count) if isinstance(history, History) else history[first:first + count]
+        for number, calculation in enumerate(entries, start=first + 1):
+            yield f"{number}. {calculation}\n"
+
+
+def write_lines(lines: Iterable[str], stream: TextIO) -> bool:
+    """
+    Writes lines to a stream in batches of RENDER_BATCH_LINES with one write call each.
+
+    Returns False if the reader closed the stream early, True otherwise.
+    """
+    lines = iter(lines)
+    try:
+        while True:
+            batch = ''.join(islice(lines, RENDER_BATCH_LINES))
+            if not batch:
+                return True
+            stream.write(batch)
+            stream.flush()
+    except BrokenPipeError:
+        return False
+
+
+def page_lines(lines: Iterable[str], command: Optional[str] = None) -> None:
+    """
+    Shows lines through a pager ($PAGER, or 'less' by default). Lines are produced only
+    as fast as the pager reads them, and production stops as soon as the reader quits.
+    Without a usable pager the lines are written to standard output.
+
+    Parameters:
+        lines (Iterable[str]): The lines to show, each ending in a newline.
+        command (Optional[str]): The pager command line; $PAGER or 'less' if None.
+    """
+    command = command or os.environ.get("PAGER") or "less"
+    try:
+        pager = subprocess.Popen(shlex.split(command), stdin=subprocess.PIPE, text=True)
+    except OSError:
+        write_lines(lines, sys.stdout)
+        return
+    write_lines(lines, pager.stdin)
+    with suppress(BrokenPipeError):  # Raised when the reader quit with lines still buffered.
+        pager.stdin.close()
+    pager.wait()
+
+
+def display_history(history: Union[List[Calculation], History], start: int = 0,
+                    count: Optional[int] = None) -> None:
     """
-    Displays the history of calculations performed during the session.
+    Displays the history of calculations performed during the session, or part of it.
+
+    Lines are produced lazily and written in batches. When standard output is a terminal
+    and there are more lines than fit on the screen, they go through a pager instead.
 
     Parameters:
-        history (List[Calculation]): A list of Calculation objects representing past calculations.
+        history (Union[List[Calculation], History]): The past calculations, oldest first.
+        start (int): Index of the first entry to show (0 is the oldest).
+        count (Optional[int]): Number of entries to show; all of the rest if None.
     """
     if not history:
         print("No calculations performed yet.")
+        return
+    total = len(history)
+    stop = total if count is None else min(start + count, total)
+    if start == 0 and stop == total:
+        header = "Calculation History:\n"
+    else:
+        header = f"Calculation History (entries {start + 1}-{stop} of {total}):\n"
+    lines = chain([header], history_lines(history, start, stop))
+    if sys.stdout.isatty() and stop - start >= shutil.get_terminal_size().lines - 1:
+        page_lines(lines)
     else:
-        print("Calculation History:")
-        for idx, calculation in enumerate(history, start=1):
-            print(f"{idx}. {calculation}")
+        write_lines(lines, sys.stdout)
+
+
+def run_history_view(history: Union[List[Calculation], History], arguments: List[str]) -> None:
+    """
+    Handles the 'history page N' and 'history tail N' commands.
+
+    Parameters:
+        history (Union[List[Calculation], History]): The past calculations, oldest first.
+        arguments (List[str]): The words following 'history' on the command line.
+    """
+    if len(arguments) != 2 or not arguments[1].isdigit() or int(arguments[1]) == 0:
+        print("Usage: history page N | history tail N, where N is a positive number.\n")
+        return
+    number = int(arguments[1])
+    if arguments[0].lower() == "tail":
+        display_history(history, max(len(history) - number, 0), number)
+        return
+    pages = max(-(-len(history) // HISTORY_PAGE_SIZE), 1)
+    if number > pages:
+        print(f"Page {number} does not exist; the history has {pages} page{'s' if pages > 1 else ''}.\n")
+        return
+    display_history(history, (number - 1) * HISTORY_PAGE_SIZE, HISTORY_PAGE_SIZE)
+
+
+def run_history_query(store: Optional[HistoryStore], arguments: List[str]) -> None:
+    """
+    Handles the 'history [operation] [since <time>] [--last N]' command by querying the
+    persistent history store and printing the matching calculations, oldest first.
+
+    Parameters:
+        store (Optional[HistoryStore]): The persistent store, or None when it is disabled.
+        arguments (List[str]): The words following 'history' on the command line.
+    """
+    if store is None:
+        print("Persistent history is not enabled. Start the calculator with --history-db <file>.\n")
+        return
+    operation: Optional[str] = None
+    since: Optional[float] = None
+    limit = DEFAULT_QUERY_LIMIT
+    words = iter(arguments)
+    for word in words:
+        option = word.lower()
+        if option == "--last":
+            count = next(words, "")
+            if not count.isdigit() or int(count) == 0:
+                print("Usage: history [operation] [since <time>] [--last N], where N is a positive number.\n")
+                return
+            limit = int(count)
+        elif option == "since":
+            text = next(words, "")
+            since = parse_time(text)
+            if since is None:
+                print(f"Unrecognised time: '{text}'. Use an age such as 30m, 2h or 1d, or an ISO date-time.\n")
+                return
+        elif operation is None and CalculationFactory.lookup_opcode(option) is not None:
+            operation = option
+        else:
+            print(f"Unknown history filter: '{word}'.")
+            print("Usage: history [operation] [since <time>] [--last N]\n")
+            return
+
+    try:
+        entries = store.query(operation=operation, since=since, limit=limit)
+    except sqlite3.Error as e:
+        print(f"Error: could not read the persistent history: {e}\n")
+        return
+    if not entries:
+        print("No saved calculations match.\n")
+        return
+    print("Saved History:")
+    for idx, entry in enumerate(entries, start=1):
+        print(f"{idx}. {entry}")
+    if len(entries) == limit:
+        print(f"Showing the newest {limit} matches; use --last N to see more.")
+    print()
+
+
+def display_stats(stats: SessionStats) -> None:
+    """
+    Displays the running statistics of the session's results, one row per operation and
+    a total row. The statistics are kept up to date as calculations are made, so this
+    takes the same time however long the history is.
+
+    Parameters:
+        stats (SessionStats): The session's running statistics.
+    """
+    if not stats:
+        print("No calculations performed yet.")
+        return
+    print("Session Statistics:")
+    print(f"    {'operation':<10}{'count':>7}{'sum':>14}{'mean':>14}{'variance':>14}{'min':>14}{'max':>14}")
+
+    def row(name: str, values: RunningStats) -> None:
+        print(f"    {name:<10}{values.count:>7}{values.total:>14.6g}{values.mean:>14.6g}"
+              f"{values.variance:>14.6g}{values.minimum:>14.6g}{values.maximum:>14.6g}")
+
+    for operation in sorted(stats.by_operation):
+        row(operation, stats.by_operation[operation])
+    row("all", stats.overall)
 
 
-def calculator() -> None:
+def display_cache_stats() -> None:
+    """
+    Displays the hit, miss and eviction counters of the CalculationFactory result cache.
+    """
+    stats = CalculationFactory.cache_stats()
+    if stats is None:
+        print("Result cache is disabled.")
+        return
+    lookups = stats.hits + stats.misses
+    hit_rate = stats.hits / lookups if lookups else 0.0
+    print("Result Cache:")
+    print(f"    entries   : {stats.size}/{stats.maxsize}")
+    print(f"    hits      : {stats.hits}")
+    print(f"    misses    : {stats.misses}")
+    print(f"    evictions : {stats.evictions}")
+    print(f"    hit rate  : {hit_rate:.1%}")
+
+
+def display_hot_calculations(count: int = HOT_LIST_SIZE) -> None:
+    """
+    Displays the calculations requested most often, as counted by the heavy-hitter
+    tracker of the CalculationFactory.
+
+    Parameters:
+        count (int): The number of calculations to list.
+    """
+    tracker = CalculationFactory.tracker()
+    if tracker is None:
+        print("Heavy-hitter tracking is disabled.")
+        return
+    hitters = tracker.top(count)
+    if not hitters:
+        print("No calculations performed yet.")
+        return
+    print(f"Hot Calculations (of {tracker.total} requests):")
+    for idx, hitter in enumerate(hitters, start=1):
+        requests = f"{hitter.count} requests"
+        if hitter.error:
+            requests += f" (at least {hitter.count - hitter.error})"
+        print(f"    {idx}. {hitter.operation} {hitter.a} {hitter.b} : {requests}")
+
+
+def run_batch_command(arguments: List[str]) -> None:
+    """
+    Handles the 'batch <file> [output]' command by streaming a calculation file through
+    the batch processor and printing a summary.
+
+    Parameters:
+        arguments (List[str]): The words following 'batch' on the command line.
+    """
+    if not 1 <= len(arguments) <= 2:
+        print("Usage: batch <file> [output]\n")
+        return
+    try:
+        summary = process_file(*arguments)
+    except (OSError, ValueError, csv.Error) as e:
+        print(f"Cannot process batch file: {e}\n")
+        return
+    print(f"Processed {summary.rows} rows ({summary.errors} errors). Results written to {summary.output_path}\n")
+
+
+def calculator(history_capacity: int = DEFAULT_HISTORY_CAPACITY, history_db: Optional[str] = None,
+               history_wal: Optional[str] = None, hot_file: Optional[str] = None,
+               history_wal_retain: int = DEFAULT_RETAIN) -> None:
     """
     Professional REPL calculator that performs addition, subtraction,
     multiplication, and division using Calculation classes.
 
     This function demonstrates both LBYL and EAFP programming paradigms.
+
+    Parameters:
+        history_capacity (int): Number of calculations kept in memory; older ones are
+            moved to a temporary file on disk and read back when the history is shown.
+        history_db (Optional[str]): SQLite file that keeps every calculation across
+            sessions for 'history <filters>' queries, or None to keep nothing.
+        history_wal (Optional[str]): Directory of a write-ahead log that every calculation
+            is appended to. Its calculations are replayed into the history at start-up, so
+            the history survives a crash. None disables the log.
+        hot_file (Optional[str]): File holding the most frequent calculations. They are
+            loaded into the result cache at start-up and saved again on exit, as counted
+            by the tracker (see CalculationFactory.configure_tracker). None disables it.
+        history_wal_retain (int): Newest calculations the write-ahead log keeps when it
+            compacts its full segments.
     """
-    # Initialize an empty list to keep track of calculation history
-    history: List[Calculation] = []
+    # Enables command history and editing features. Imported here rather than at module
+    # level so non-interactive users of this package (e.g. stream mode) never load it.
+    import readline  # noqa: F401
+
+    # Keep track of the calculation history with a bounded amount of memory
+    history = History(history_capacity)
+
+    # Running totals of the results, updated with every calculation for the 'stats' command
+    stats = SessionStats()
+
+    # Every successful calculation is also recorded in the persistent store, if enabled
+    store = None
+    if history_db:
+        try:
+            store = HistoryStore(history_db)
+        except sqlite3.Error as e:
+            print(f"Error: could not open the persistent history: {e}\n")
+
+    # Rebuild the history of earlier sessions from the write-ahead log, if enabled
+    wal = WriteAheadLog(history_wal, retain=history_wal_retain) if history_wal else None
+    if wal is not None:
+        for calculation in wal.replay():
+            history.append(calculation)
+            stats.add(CalculationFactory.type_name_of(calculation), calculation.result)
+
+    # Start with the results of the most frequent calculations already cached
+    if hot_file:
+        try:
+            restore_hot_set(hot_file)
+        except (OSError, ValueError) as e:
+            print(f"Could not load the hot calculation set: {e}")
 
     # Welcome message to the user
     print("Welcome to the Professional Calculator REPL!")
     print("Type 'help' for instructions or 'exit' to quit.\n")
+    if history:
+        print(f"Restored {len(history)} calculations from the write-ahead log.\n")
 
-    # Continuously prompt the user for input until they decide to exit
-    while True:
-        try:
-            # Prompt the user to enter an operation and two numbers
-            user_input: str = input(">> ").strip()
-
-            # LBYL (Look Before You Leap)
-            # -----------------------------------
-            # Before attempting to process the input, we check if it's empty.
-            # This prevents unnecessary processing and potential errors.
-            if not user_input:
-                # Input is empty, so we skip processing and prompt again.
-                continue # pragma: no cover
-
-            # Handle special commands
-            command = user_input.lower()
-
-            # LBYL is used here to check if the user input matches any special commands.
-            if command == "help":
-                display_help()
-                continue
-            elif command == "history":
-                display_history(history)
-                continue
-            elif command == "exit":
-                print("Exiting calculator. Goodbye!\n")
-                sys.exit(0)  # Exit the program gracefully
-
-            # EAFP (Easier to Ask Forgiveness than Permission)
-            # -----------------------------------
-            # Instead of checking if the input is correctly formatted (which can be complex),
-            # we attempt to parse it and handle any exceptions that arise.
+    # Continuously prompt the user for input until they decide to exit. Leaving the loop
+    # always closes the persistent store and the log, so calculations still queued are written.
+    try:
+        while True:
             try:
-                # Attempt to split the user input into operation and operands
-                operation, num1_str, num2_str = user_input.split()
-                # Convert the operand strings to floats
-                num1: float = float(num1_str)
-                num2: float = float(num2_str)
-            except ValueError:
-                # If splitting or conversion fails, we catch the exception.
-                # This approach trusts the user input and handles exceptions if something goes wrong.
-                # This is characteristic of EAFP.
-                print("Invalid input. Please follow the format: <operation> <num1> <num2>")
-                print("Type 'help' for more information.\n")
-                continue  # Prompt the user again
-
-            # Attempt to create a Calculation instance using the factory
+                # Prompt the user to enter an operation and two numbers
+                user_input: str = input(">> ").strip()
+
+                # LBYL (Look Before You Leap)
+                # -----------------------------------
+                # Before attempting to process the input, we check if it's empty.
+                # This prevents unnecessary processing and potential errors.
+                if not user_input:
+                    # Input is empty, so we skip processing and prompt again.
+                    continue # pragma: no cover
+
+                # Handle special commands
+                command = user_input.lower()
+
+                # LBYL is used here to check if the user input matches any special commands.
+                if command == "help":
+                    display_help()
+                    continue
+                elif command == "history":
+                    display_history(history)
+                    continue
+                elif command == "stats":
+                    display_stats(stats)
+                    continue
+                elif command == "cache":
+                    display_cache_stats()
+                    continue
+                elif command == "hot":
+                    display_hot_calculations()
+                    continue
+                elif command.split()[0] == "history":
+                    arguments = user_input.split()[1:]
+                    if arguments[0].lower() in ("page", "tail"):
+                        run_history_view(history, arguments)
+                    else:
+                        run_history_query(store, arguments)
+                    continue
+                elif command.split()[0] == "batch":
+                    run_batch_command(user_input.split()[1:])
+                    continue
+                elif command == "exit":
+                    print("Exiting calculator. Goodbye!\n")
+                    sys.exit(0)  # Exit the program gracefully
+
+                # The operation and both operands are parsed in a single pass. A malformed line
+                # comes back as a ParseError value that says what is wrong and where, so no
+                # exception is needed to detect it.
+                parsed = parse_line(user_input)
+                if isinstance(parsed, ParseError):
+                    print("Invalid input. Please follow the format: <operation> <num1> <num2>")
+                    print(parsed.describe(user_input))
+                    print("Type 'help' for more information.\n")
+                    continue  # Prompt the user again
+                operation, num1, num2 = parsed.operation, parsed.a, parsed.b
+
+                # Attempt to create a Calculation instance using the factory
+                try:
+                    calculation = CalculationFactory.create_calculation(operation, num1, num2)
+                except ValueError as ve:
+                    # Handle unsupported operations
+                    print(ve)
+                    print("Type 'help' to see the list of supported operations.\n")
+                    continue  # Prompt the user again
+
+                # Attempt to execute the calculation. The result is cached on the calculation,
+                # so displaying it now and in the history later never re-executes it.
+                try:
+                    result = calculation.result
+                except ZeroDivisionError:
+                    # Handle division by zero specifically
+                    print("Cannot divide by zero.")
+                    print("Please enter a non-zero divisor.\n")
+                    continue  # Prompt the user again
+                except Exception as e:
+                    # Handle any other unforeseen exceptions
+                    print(f"An error occurred during calculation: {e}")
+                    print("Please try again.\n")
+                    continue  # Prompt the user again
+
+                # Prepare the result string for display
+                result_str: str = f"{calculation}"
+                print(f"Result: {result_str}\n")
+
+                # Append the calculation object to history
+                history.append(calculation)
+                stats.add(CalculationFactory.type_name_of(calculation), result)
+                if store is not None:
+                    try:
+                        store.record(calculation)
+                    except sqlite3.Error as e:
+                        print(f"Error: could not save to the persistent history: {e}\n")
+                if wal is not None:
+                    wal.append(calculation)
+
+            except KeyboardInterrupt:
+                # EAFP example for handling unexpected interruption
+                # Instead of checking if the user pressed Ctrl+C before each input,
+                # we handle the KeyboardInterrupt exception.
+                print("\nKeyboard interrupt detected. Exiting calculator. Goodbye!")
+                sys.exit(0)
+            except EOFError:
+                # EAFP example for handling EOF (Ctrl+D)
+                # Similar to KeyboardInterrupt, we handle the EOFError exception.
+                print("\nEOF detected. Exiting calculator. Goodbye!")
+                sys.exit(0)
+    finally:
+        if store is not None:
             try:
-                calculation = CalculationFactory.create_calculation(operation, num1, num2)
-            except ValueError as ve:
-                # Handle unsupported operations
-                print(ve)
-                print("Type 'help' to see the list of supported operations.\n")
-                continue  # Prompt the user again
-
-            # Attempt to execute the calculation
+                store.close()
+            except sqlite3.Error as e:
+                print(f"Error: could not save to the persistent history: {e}")
+        if wal is not None:
+            wal.close()
+        if hot_file:
             try:
-                result = calculation.execute()
-            except ZeroDivisionError:
-                # Handle division by zero specifically
-                print("Cannot divide by zero.")
-                print("Please enter a non-zero divisor.\n")
-                continue  # Prompt the user again
-            except Exception as e:
-                # Handle any other unforeseen exceptions
-                print(f"An error occurred during calculation: {e}")
-                print("Please try again.\n")
-                continue  # Prompt the user again
-
-            # Prepare the result string for display
-            result_str: str = f"{calculation}"
-            print(f"Result: {result_str}\n")
-
-            # Append the calculation object to history
-            history.append(calculation)
-
-        except KeyboardInterrupt:
-            # EAFP example for handling unexpected interruption
-            # Instead of checking if the user pressed Ctrl+C before each input,
-            # we handle the KeyboardInterrupt exception.
-            print("\nKeyboard interrupt detected. Exiting calculator. Goodbye!")
-            sys.exit(0)
-        except EOFError:
-            # EAFP example for handling EOF (Ctrl+D)
-            # Similar to KeyboardInterrupt, we handle the EOFError exception.
-            print("\nEOF detected. Exiting calculator. Goodbye!")
-            sys.exit(0)
+                save_hot_set(hot_file)
+            except OSError as e:
+                print(f"Could not save the hot calculation set: {e}")
 
 
 # If this script is run directly, start the calculator REPL
@@ -0,0 +1,148 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Columnar Batch Operations - Assignment 4
+Stdlib-only batch kernels for hosts where NumPy is not installed
+"""
+
+# columnar.py
+
+"""
+This module provides the same batch API as the vectorized `Operation.batch_*` methods,
+implemented with nothing but the standard library. Operand columns are `array.array('d')`
+objects, memoryviews or plain sequences and each operation runs as a single tight
+loop over the whole column, so no Calculation object is ever created per row.
+
+`Operation.batch_*` delegates here automatically when NumPy cannot be imported, which lets
+callers use one API everywhere and leave the choice of backend to the host.
+"""
+
+import operator
+from array import array
+from itertools import repeat
+from math import inf, isfinite, nan
+from typing import Any, Iterable, Tuple
+
+from app.operation import BatchResult
+
+
+class ColumnarOperation:
+    """
+    Batch versions of the `Operation` methods built on `array.array('d')` columns.
+
+    Every method accepts two operands, each either a column (array('d'), memoryview,
+    list, tuple) or a scalar that is broadcast against the other column. Results are
+    returned as a `BatchResult` whose `values` is an `array('d')` and whose `errors` is an
+    `array('B')` holding 1 for every row the scalar method would have refused.
+    """
+
+    @staticmethod
+    def batch_addition(a: Any, b: Any) -> BatchResult:
+        """Adds two columns element by element."""
+        xs, ys, size = _columns(a, b)
+        return BatchResult(array('d', map(operator.add, xs, ys)), _no_errors(size))
+
+    @staticmethod
+    def batch_subtraction(a: Any, b: Any) -> BatchResult:
+        """Subtracts the second column from the first, element by element."""
+        xs, ys, size = _columns(a, b)
+        return BatchResult(array('d', map(operator.sub, xs, ys)), _no_errors(size))
+
+    @staticmethod
+    def batch_multiplication(a: Any, b: Any) -> BatchResult:
+        """Multiplies two columns element by element."""
+        xs, ys, size = _columns(a, b)
+        return BatchResult(array('d', map(operator.mul, xs, ys)), _no_errors(size))
+
+    @staticmethod
+    def batch_division(a: Any, b: Any) -> BatchResult:
+        """
+        Divides the first column by the second. Zero divisors are flagged in `errors`
+        and hold NaN instead of raising.
+        """
+        xs, ys, _ = _columns(a, b)
+        ys = list(ys)
+        values = array('d', [x / y if y else nan for x, y in zip(xs, ys)])
+        return BatchResult(values, array('B', [not y for y in ys]))
+
+    @staticmethod
+    def batch_power(a: Any, b: Any) -> BatchResult:
+        """
+        Raises the first column to the power of the second. A zero base with a negative
+        exponent and a negative finite base with a non-integer exponent are flagged in
+        `errors`; results too large for a float become +/-inf, as with NumPy.
+        """
+        xs, ys, _ = _columns(a, b)
+        values = array('d')
+        errors = array('B')
+        for x, y in zip(xs, ys):
+            if (x == 0 and y < 0) or (x < 0 and isfinite(x) and isfinite(y) and y != int(y)):
+                values.append(nan)
+                errors.append(1)
+            else:
+                values.append(_power(x, y))
+                errors.append(0)
+        return BatchResult(values, errors)
+
+    @staticmethod
+    def batch_modulus(a: Any, b: Any) -> BatchResult:
+        """
+        Calculates the remainder of the first column divided by the second using Python's
+        `%`, so the sign of each remainder follows the divisor. Zero divisors are flagged
+        in `errors` and hold NaN instead of raising.
+        """
+        xs, ys, _ = _columns(a, b)
+        ys = list(ys)
+        values = array('d', [x % y if y else nan for x, y in zip(xs, ys)])
+        return BatchResult(values, array('B', [not y for y in ys]))
+
+
+# -----------------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------------
+
+def _columns(a: Any, b: Any) -> Tuple[Iterable[float], Iterable[float], int]:
+    """
+    Returns two iterables of equal length and that length, repeating a scalar operand
+    to match the other column.
+
+    **Raises:**
+    - `ValueError`: If both operands are columns of different lengths.
+    """
+    a_is_scalar = isinstance(a, (int, float))
+    b_is_scalar = isinstance(b, (int, float))
+    if a_is_scalar and b_is_scalar:
+        return (float(a),), (float(b),), 1
+    if a_is_scalar:
+        ys = _column(b)
+        return repeat(float(a), len(ys)), ys, len(ys)
+    if b_is_scalar:
+        xs = _column(a)
+        return xs, repeat(float(b), len(xs)), len(xs)
+    xs, ys = _column(a), _column(b)
+    if len(xs) != len(ys):
+        raise ValueError(f"Operand columns have different lengths: {len(xs)} and {len(ys)}.")
+    return xs, ys, len(xs)
+
+
+def _column(operand: Any) -> Any:
+    """
+    Returns a float64 memoryview or a sequence as it is; memoryviews of any other item
+    type are converted value by value, as NumPy does.
+    """
+    if isinstance(operand, memoryview) and operand.format != 'd':
+        return array('d', operand.tolist())
+    return operand
+
+
+def _no_errors(size: int) -> array:
+    """Returns an error column with no flagged rows."""
+    return array('B', bytes(size))
+
+
+def _power(x: float, y: float) -> float:
+    """Computes `x ** y`, returning +/-inf where Python would raise OverflowError."""
+    try:
+        return x ** y
+    except OverflowError:
+        return -inf if x < 0 and y % 2 == 1 else inf
@@ -0,0 +1,129 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Calculation History
+Bounded in-memory history that spills older entries to disk
+"""
+
+# history.py
+
+"""
+This module keeps the calculation history of a session with a fixed memory budget.
+
+The newest `capacity` calculations live in a ring buffer. When the buffer is full, the
+oldest entry is evicted to an append-only segment file on disk, so memory use stays
+capped however long the session runs, while the full history stays reachable:
+
+- `len(history)` counts every entry, on disk and in memory.
+- Iterating reads the disk entries one page at a time, then yields the buffer.
+- `history[i]` and `history.page(start, count)` read only the records they need.
+
+The segment uses the binary request format of app.binary (an 8-byte header followed by
+one fixed-width `opcode, a, b` record per entry), so any entry can be found with a
+single seek, and a spilled segment can be fed straight to `main.py batch`. Entries read
+back from disk are rebuilt from their operation and operands.
+"""
+
+import tempfile
+from typing import BinaryIO, Iterator, List, Optional
+
+from app.binary import HEADER_SIZE, REQUEST_MAGIC, REQUEST_RECORD
+from app.calculation import Calculation, CalculationFactory
+
+# Number of calculations kept in memory by default.
+DEFAULT_HISTORY_CAPACITY = 1000
+
+# Number of disk records read at a time while iterating.
+SPILL_PAGE_RECORDS = 256
+
+
+class History:
+    """
+    A calculation history with at most `capacity` entries in memory.
+
+    **Parameters:**
+    - `capacity (int)`: Number of newest calculations kept in memory.
+    - `spill_path (Optional[str])`: File that receives evicted entries. By default an
+      anonymous temporary file is used, which is removed when the history is closed.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_HISTORY_CAPACITY, spill_path: Optional[str] = None) -> None:
+        if capacity <= 0:
+            raise ValueError("History capacity must be positive.")
+        self.capacity: int = capacity
+        self.spill_path: Optional[str] = spill_path
+        self._buffer: List[Optional[Calculation]] = [None] * capacity
+        self._start = 0  # Buffer index of the oldest in-memory entry.
+        self._size = 0
+        self._spilled = 0
+        self._segment: Optional[BinaryIO] = None
+
+    def __len__(self) -> int:
+        return self._spilled + self._size
+
+    @property
+    def spilled(self) -> int:
+        """The number of entries that have been moved to disk."""
+        return self._spilled
+
+    def append(self, calculation: Calculation) -> None:
+        """Adds a calculation, spilling the oldest in-memory entry to disk if the buffer is full."""
+        if self._size < self.capacity:
+            self._buffer[(self._start + self._size) % self.capacity] = calculation
+            self._size += 1
+            return
+        self._spill(self._buffer[self._start])
+        self._buffer[self._start] = calculation
+        self._start = (self._start + 1) % self.capacity
+
+    def __getitem__(self, index: int) -> Calculation:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("history index out of range")
+        return self.page(index, 1)[0]
+
+    def __iter__(self) -> Iterator[Calculation]:
+        for start in range(0, self._spilled, SPILL_PAGE_RECORDS):
+            yield from self._read(start, min(start + SPILL_PAGE_RECORDS, self._spilled))
+        for offset in range(self._size):
+            yield self._buffer[(self._start + offset) % self.capacity]
+
+    def page(self, start: int, count: int) -> List[Calculation]:
+        """Returns up to `count` entries starting at entry `start` (0 is the oldest)."""
+        stop = min(start + count, len(self))
+        start = max(start, 0)
+        entries = self._read(start, min(stop, self._spilled)) if start < self._spilled else []
+        for index in range(max(start, self._spilled), stop):
+            entries.append(self._buffer[(self._start + index - self._spilled) % self.capacity])
+        return entries
+
+    def close(self) -> None:
+        """Closes the segment file. In-memory entries stay available; disk entries do not."""
+        if self._segment is not None:
+            self._segment.close()
+            self._segment = None
+
+    def __enter__(self) -> "History":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _spill(self, calculation: Calculation) -> None:
+        """Appends one evicted calculation to the segment file, creating it on first use."""
+        if self._segment is None:
+            self._segment = open(self.spill_path, 'w+b') if self.spill_path else tempfile.TemporaryFile()
+            self._segment.write(REQUEST_MAGIC)
+        self._segment.write(REQUEST_RECORD.pack(CalculationFactory.opcode_of(calculation),
+                                                calculation.a, calculation.b))
+        self._spilled += 1
+
+    def _read(self, start: int, stop: int) -> List[Calculation]:
+        """Reads disk entries `start` to `stop` with one seek and one read."""
+        segment = self._segment
+        segment.seek(HEADER_SIZE + start * REQUEST_RECORD.size)
+        data = segment.read((stop - start) * REQUEST_RECORD.size)
+        segment.seek(0, 2)  # Later spills append at the end.
+        calculation_class = CalculationFactory.calculation_class
+        return [calculation_class(opcode)(a, b) for opcode, a, b in REQUEST_RECORD.iter_unpack(data)]
@@ -0,0 +1,88 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Hot Calculation Set
+Saves the most frequent calculations and pre-warms the result cache with them
+"""
+
+# hotset.py
+
+"""
+This module carries the heavy-hitter tracker of `CalculationFactory` from one process to
+the next, so a freshly started calculator does not begin with a cold result cache.
+
+- `save_hot_set` writes the tracked calculations and their counts to a small JSON file,
+  most frequent first. The file is written next to its destination and renamed into
+  place, so a reader never sees half of it.
+- `restore_hot_set` reads that file back, seeds the tracker with the saved counts (so
+  long-standing favourites are not forgotten after a restart) and pre-computes the
+  results of the saved calculations into the result cache.
+"""
+
+import json
+import os
+from typing import List
+
+from app.calculation import CalculationFactory, HeavyHitter, ResultCache
+
+HOT_SET_VERSION = 1
+
+
+def save_hot_set(path: str) -> int:
+    """
+    Writes the calculations counted by the heavy-hitter tracker to `path`.
+
+    **Returns:**
+    - `int`: The number of calculations saved (0 when tracking is disabled).
+    """
+    tracker = CalculationFactory.tracker()
+    hitters = tracker.top() if tracker is not None else []
+    document = {'version': HOT_SET_VERSION, 'calculations': [list(hitter) for hitter in hitters]}
+    temporary = f"{path}.tmp"
+    with open(temporary, 'w', encoding='utf-8') as outfile:
+        json.dump(document, outfile)
+    os.replace(temporary, path)
+    return len(hitters)
+
+
+def load_hot_set(path: str) -> List[HeavyHitter]:
+    """
+    Reads a file written by `save_hot_set`, most frequent calculation first.
+
+    **Raises:**
+    - `OSError`: If the file cannot be read.
+    - `ValueError`: If the file is not a hot set.
+    """
+    with open(path, encoding='utf-8') as infile:
+        document = json.load(infile)
+    try:
+        version = document['version']
+    except (KeyError, TypeError) as error:
+        raise ValueError(f"{path} is not a hot set file.") from error
+    if version != HOT_SET_VERSION:
+        raise ValueError(f"Unsupported hot set version: {version}.")
+    try:
+        return [HeavyHitter(str(operation), float(a), float(b), int(count), int(error))
+                for operation, a, b, count, error in document['calculations']]
+    except (KeyError, TypeError, ValueError) as error:
+        raise ValueError(f"{path} is not a hot set file.") from error
+
+
+def restore_hot_set(path: str) -> int:
+    """
+    Seeds the heavy-hitter tracker and pre-warms the result cache from a saved hot set.
+    A missing file is not an error: there is simply nothing to restore yet.
+
+    **Returns:**
+    - `int`: The number of calculations placed in the result cache.
+    """
+    try:
+        hitters = load_hot_set(path)
+    except FileNotFoundError:
+        return 0
+    tracker = CalculationFactory.tracker()
+    if tracker is not None:
+        for hitter in reversed(hitters[:tracker.capacity]):
+            key = ResultCache.make_key(hitter.operation, hitter.a, hitter.b)
+            tracker.add(key, hitter.operation, hitter.a, hitter.b, hitter.count)
+    return CalculationFactory.prewarm(hitters)
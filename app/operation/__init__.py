@@ -7,6 +7,56 @@ Added modulus and power operations to existing calculator framework
 
 # operations.py
 
+from array import array
+from functools import wraps
+from typing import Any, Callable, NamedTuple, Tuple
+
+# NumPy is an optional dependency. The scalar methods below never need it; the batch
+# methods use it to run a whole column of operand pairs as a single vectorized kernel
+# and fall back to the stdlib kernels in app.columnar when it is not installed.
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only on hosts without NumPy
+    np = None
+
+
+class BatchResult(NamedTuple):
+    """
+    The result of a batch operation: one value per operand pair plus a per-element error mask.
+
+    **Fields:**
+    - `values (array('d'))`: The computed values. Elements flagged in `errors` hold NaN.
+    - `errors (array('B'))`: 1 wherever the scalar method would have refused the operand
+      pair (for example a zero divisor) and 0 elsewhere, instead of raising for the
+      whole batch.
+
+    Both backends return these same column types, so callers never depend on whether
+    NumPy is installed. NumPy callers can view them without copying through
+    `np.frombuffer`.
+    """
+    values: Any
+    errors: Any
+
+
+def batch_backend() -> str:
+    """Returns the name of the backend used by the `Operation.batch_*` methods: 'numpy' or 'stdlib'."""
+    return 'stdlib' if np is None else 'numpy'
+
+
+def _stdlib_fallback(method: Callable[[Any, Any], BatchResult]) -> Callable[[Any, Any], BatchResult]:
+    """
+    Routes a batch method to the same-named `ColumnarOperation` kernel when NumPy is not
+    installed, so callers get the same batch API on every host.
+    """
+    @wraps(method)
+    def wrapper(a: Any, b: Any) -> BatchResult:
+        if np is None:
+            from app.columnar import ColumnarOperation  # Imported lazily: app.columnar imports this module.
+            return getattr(ColumnarOperation, method.__name__)(a, b)
+        return method(a, b)
+    return wrapper
+
+
 class Operation:
     """
     The Operation class encapsulates basic arithmetic operations as static methods.
@@ -197,4 +247,166 @@ class Operation:
         if b == 0:
             # Checks if the divisor is zero to prevent undefined modulus operation.
             raise ValueError("Modulus by zero is not allowed.")
-        return a % b  # Calculates `a` modulo `b` and returns the remainder.
\ No newline at end of file
+        return a % b  # Calculates `a` modulo `b` and returns the remainder.
+
+    # -------------------------------------------------------------------------------
+    # Batch (vectorized) operations
+    # -------------------------------------------------------------------------------
+    # Each batch method takes NumPy arrays, any buffer-protocol object (array.array('d'),
+    # memoryview) or plain sequences, broadcasts scalars against arrays
+    # and evaluates the whole column in one vectorized kernel. Invalid operand pairs do not
+    # raise; they are reported through `BatchResult.errors` and hold NaN in the values.
+    # Without NumPy the same calls are served by app.columnar.ColumnarOperation.
+
+    @staticmethod
+    @_stdlib_fallback
+    def batch_addition(a: Any, b: Any) -> BatchResult:
+        """
+        Adds two columns of numbers element by element.
+
+        **Parameters:**
+        - `a`: The first operands (array, buffer or scalar).
+        - `b`: The second operands (array, buffer or scalar).
+
+        **Returns:**
+        - `BatchResult`: The element-wise sums and an error column of zeros.
+
+        **Example:**
+        >>> Operation.batch_addition([1.0, 2.0], 10.0).values.tolist()
+        [11.0, 12.0]
+        """
+        x, y = _as_float_arrays(a, b)
+        values, errors, out, _ = _result_columns(x, y)
+        with np.errstate(over='ignore'):
+            np.add(x, y, out=out)
+        return BatchResult(values, errors)
+
+    @staticmethod
+    @_stdlib_fallback
+    def batch_subtraction(a: Any, b: Any) -> BatchResult:
+        """
+        Subtracts the second column of numbers from the first, element by element.
+
+        **Returns:**
+        - `BatchResult`: The element-wise differences and an error column of zeros.
+        """
+        x, y = _as_float_arrays(a, b)
+        values, errors, out, _ = _result_columns(x, y)
+        with np.errstate(over='ignore'):
+            np.subtract(x, y, out=out)
+        return BatchResult(values, errors)
+
+    @staticmethod
+    @_stdlib_fallback
+    def batch_multiplication(a: Any, b: Any) -> BatchResult:
+        """
+        Multiplies two columns of numbers element by element.
+
+        **Returns:**
+        - `BatchResult`: The element-wise products and an error column of zeros.
+        """
+        x, y = _as_float_arrays(a, b)
+        values, errors, out, _ = _result_columns(x, y)
+        with np.errstate(over='ignore'):
+            np.multiply(x, y, out=out)
+        return BatchResult(values, errors)
+
+    @staticmethod
+    @_stdlib_fallback
+    def batch_division(a: Any, b: Any) -> BatchResult:
+        """
+        Divides the first column of numbers by the second, element by element.
+
+        **Returns:**
+        - `BatchResult`: The element-wise quotients. Rows with a zero divisor are flagged
+          in `errors` (and hold NaN) instead of raising `ValueError` for the whole batch.
+
+        **Example:**
+        >>> result = Operation.batch_division([10.0, 1.0], [2.0, 0.0])
+        >>> result.errors.tolist()
+        [0, 1]
+        """
+        x, y = _as_float_arrays(a, b)
+        values, errors, out, flags = _result_columns(x, y)
+        flags[...] = y == 0
+        _masked_kernel(np.true_divide, x, y, flags, out)
+        return BatchResult(values, errors)
+
+    @staticmethod
+    @_stdlib_fallback
+    def batch_power(a: Any, b: Any) -> BatchResult:
+        """
+        Raises each element of the first column to the power of the matching element of the second.
+
+        **Returns:**
+        - `BatchResult`: The element-wise powers. Rows that `Operation.power` cannot turn
+          into a real float are flagged in `errors`: a zero base with a negative exponent
+          (a division by zero) and a negative finite base with a non-integer exponent
+          (which would produce a complex number).
+
+        **Note:** NumPy's vectorized `power` may differ from Python's `**` in the last bit 
+        (1 ulp) for some operands, which would make batch results depend on the backend. 
+        Powers are therefore always computed with `**` by the stdlib kernel; NumPy only 
+        broadcasts the operands.
+        """
+        from app.columnar import ColumnarOperation  # Imported lazily: app.columnar imports this module.
+        x, y = np.broadcast_arrays(*_as_float_arrays(a, b))
+        return ColumnarOperation.batch_power(x.ravel().tolist(), y.ravel().tolist())
+
+    @staticmethod
+    @_stdlib_fallback
+    def batch_modulus(a: Any, b: Any) -> BatchResult:
+        """
+        Calculates the element-wise remainder of the first column divided by the second.
+
+        The sign of each remainder follows the divisor, exactly like Python's `%` operator
+        (`-7 % 3 == 2` and `7 % -3 == -2`).
+
+        **Returns:**
+        - `BatchResult`: The element-wise remainders. Rows with a zero divisor are flagged
+          in `errors` (and hold NaN) instead of raising `ValueError` for the whole batch.
+        """
+        x, y = _as_float_arrays(a, b)
+        values, errors, out, flags = _result_columns(x, y)
+        flags[...] = y == 0
+        _masked_kernel(np.remainder, x, y, flags, out)
+        return BatchResult(values, errors)
+
+
+# -----------------------------------------------------------------------------------
+# Batch helpers
+# -----------------------------------------------------------------------------------
+
+def _as_float_arrays(a: Any, b: Any) -> Tuple[Any, Any]:
+    """
+    Converts both operands to float64 NumPy arrays. Buffer-protocol objects that already
+    hold float64 data (NumPy arrays, array.array('d'), memoryviews) are viewed in place, not copied.
+    """
+    return np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64)
+
+
+def _result_columns(x: Any, y: Any) -> Tuple[array, array, Any, Any]:
+    """
+    Allocates the `array('d')` values and `array('B')` errors of a batch result for the
+    broadcast shape of both operands, plus NumPy views of them for the kernels to write
+    into, so results come out in the stdlib column types without an extra copy.
+
+    **Returns:**
+    - A tuple `(values, errors, values_view, errors_view)`.
+    """
+    shape = np.broadcast_shapes(x.shape, y.shape)
+    size = int(np.prod(shape))
+    values, errors = array('d', bytes(8 * size)), array('B', bytes(size))
+    return (values, errors, np.frombuffer(values, dtype=np.float64).reshape(shape),
+            np.frombuffer(errors, dtype=np.bool_).reshape(shape))
+
+
+def _masked_kernel(kernel: Any, x: Any, y: Any, errors: Any, out: Any) -> None:
+    """
+    Runs a binary NumPy kernel into `out` only where `errors` is False and leaves NaN
+    everywhere else, so a bad row never triggers a floating-point warning or poisons its
+    neighbours.
+    """
+    out.fill(np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        kernel(x, y, out=out, where=~errors)
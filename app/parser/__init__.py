@@ -0,0 +1,188 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Calculation Line Parser
+Single-pass tokenizer for '<operation> <num1> <num2>' lines
+"""
+
+# parser.py
+
+"""
+This module parses calculation lines of the form `<operation> <num1> <num2>`.
+
+`parse_line` recognises a well-formed line with one compiled regular expression, which
+finds the operation and both operands in a single pass over the line. Because the
+pattern only accepts text that `float()` also accepts, converting the operands can never
+fail, so no exception is raised or caught for a bad line. Lines the pattern rejects are
+handed to a slower diagnostic pass that reports *what* is wrong and *where* (a 0-based
+column). The REPL and server mode parse their input this way.
+
+`parse_lines` (stream mode) and `parse_rows` (CSV batches) only need each line's
+columns or error message, not its position, and are throughput bound. In CPython the
+regular expression engine costs several times more per character than `str.split()` and
+`float()`, so these keep the plain split-and-convert loop (see
+`benchmarks/bench_parser.py`).
+
+**Accepted numbers:** integers and decimals (`10`, `-2.5`, `.5`, `5.`), scientific
+notation (`1e-3`, `2.5E+10`), underscores between digits (`1_000_000`), and `inf`,
+`infinity` and `nan` in any case, each with an optional sign. Like `float()`, non-ASCII
+digits are accepted, and fields are separated by any whitespace `str.split()` splits on.
+
+**Operations** are resolved to their `CalculationFactory` opcodes, and the operation
+names are interned so every parsed line with the same operation shares one string.
+"""
+
+import re
+import sys
+from typing import List, NamedTuple, Optional, Tuple, Union
+
+from app.calculation import CalculationFactory
+
+INVALID_FORMAT = "Invalid input. Please follow the format: <operation> <num1> <num2>"
+
+_DIGITS = r'\d+(?:_\d+)*'
+_NUMBER = (
+    rf'[+-]?(?:(?:{_DIGITS}(?:\.(?:{_DIGITS})?)?|\.{_DIGITS})(?:[eE][+-]?{_DIGITS})?'
+    r'|[iI][nN][fF](?:[iI][nN][iI][tT][yY])?|[nN][aA][nN])'
+)
+
+# Without re.ASCII, \s and \d match exactly the whitespace `str.split()` splits on and the
+# digits `float()` accepts.
+_LINE = re.compile(rf'\s*(\S+)\s+({_NUMBER})\s+({_NUMBER})\s*')
+_NUMBER_PREFIX = re.compile(_NUMBER)
+_NUMBER_FIELD = re.compile(rf'\s*({_NUMBER})\s*')
+_TOKEN = re.compile(r'\S+')
+
+
+class ParsedLine(NamedTuple):
+    """
+    A syntactically valid calculation line.
+
+    `opcode` is None when the operation is not a registered calculation type; the
+    caller decides how to report that.
+    """
+    operation: str
+    opcode: Optional[int]
+    a: float
+    b: float
+
+
+class ParseError(NamedTuple):
+    """A line that could not be parsed: what is wrong and the 0-based column where it is."""
+    message: str
+    position: int
+
+    def describe(self, line: str) -> str:
+        """Returns the line followed by a caret under the error position and the message."""
+        return f"{line.rstrip()}\n{' ' * self.position}^ {self.message}"
+
+
+def parse_number(text: str) -> Optional[float]:
+    """Returns the value of a number field (surrounding whitespace allowed), or None if it is not a number."""
+    match = _NUMBER_FIELD.fullmatch(text)
+    return float(match.group(1)) if match else None
+
+
+def parse_line(line: str) -> Union[ParsedLine, ParseError, None]:
+    """
+    Parses one `<operation> <num1> <num2>` line.
+
+    **Returns:**
+    - `ParsedLine` for a well-formed line, `ParseError` for a malformed one, or None for
+      a blank line.
+    """
+    match = _LINE.fullmatch(line)
+    if match is not None:
+        name, a, b = match.groups()
+        name = sys.intern(name)  # Every line with the same operation shares one string.
+        return ParsedLine(name, CalculationFactory.lookup_opcode(name), float(a), float(b))
+    return _diagnose(line)
+
+
+def _diagnose(line: str) -> Optional[ParseError]:
+    """
+    The slow path for lines the single-pass pattern rejected: locates the first problem.
+
+    Fields are checked in order: the number of fields first, then each operand. The
+    first operand character the number grammar cannot accept is reported.
+    """
+    tokens = list(_TOKEN.finditer(line))
+    if not tokens:
+        return None
+    if len(tokens) < 3:
+        return ParseError(f"Expected 3 fields (<operation> <num1> <num2>), found {len(tokens)}.",
+                          tokens[-1].end())
+    if len(tokens) > 3:
+        return ParseError(f"Unexpected field '{tokens[3].group()}'.", tokens[3].start())
+    # The line has three fields but did not match, so one of the operands is not a number.
+    operand = tokens[1] if _NUMBER_PREFIX.fullmatch(tokens[1].group()) is None else tokens[2]
+    prefix = _NUMBER_PREFIX.match(operand.group())
+    return ParseError(f"Invalid number '{operand.group()}'.", operand.start() + (prefix.end() if prefix else 0))
+
+
+def parse_lines(lines: List[str]) -> Tuple[List[int], List[float], List[float], List[Optional[str]]]:
+    """
+    Parses calculation lines into opcode and operand columns.
+
+    A malformed line costs one caught `ValueError`; checking the syntax up front with
+    `parse_line` would slow down every well-formed line instead.
+
+    **Returns:**
+    - A tuple `(opcodes, a_values, b_values, slots)`. `slots` has one entry per
+      non-blank line: None for a line that went into the columns, or the error message
+      to report in its place.
+    """
+    opcodes: List[int] = []
+    a_values: List[float] = []
+    b_values: List[float] = []
+    slots: List[Optional[str]] = []
+    lookup = CalculationFactory.lookup_opcode
+    for line in lines:
+        try:
+            name, a_text, b_text = line.split()
+            a, b = float(a_text), float(b_text)
+        except ValueError:
+            if line.strip():  # Blank lines produce no output.
+                slots.append(INVALID_FORMAT)
+            continue
+        opcode = lookup(name)
+        if opcode is None:
+            slots.append(f"Unsupported calculation type: '{name}'.")
+            continue
+        opcodes.append(opcode)
+        a_values.append(a)
+        b_values.append(b)
+        slots.append(None)
+    return opcodes, a_values, b_values, slots
+
+
+def parse_rows(rows: List[List[str]]) -> Tuple[List[int], List[float], List[float], List[Optional[str]]]:
+    """
+    Parses rows that are already split into fields (for example by the csv module) into columns.
+
+    Fields may have surrounding whitespace. Unlike `parse_lines`, every row gets a slot.
+
+    **Returns:**
+    - A tuple `(opcodes, a_values, b_values, slots)`, as for `parse_lines`.
+    """
+    opcodes: List[int] = []
+    a_values: List[float] = []
+    b_values: List[float] = []
+    slots: List[Optional[str]] = []
+    lookup = CalculationFactory.lookup_opcode
+    for row in rows:
+        try:
+            name, a_text, b_text = row
+            a, b = float(a_text), float(b_text)
+        except ValueError:
+            slots.append(INVALID_FORMAT)
+            continue
+        opcode = lookup(name.strip())
+        if opcode is None:
+            slots.append(f"Unsupported calculation type: '{name.strip()}'.")
+            continue
+        opcodes.append(opcode)
+        a_values.append(a)
+        b_values.append(b)
+        slots.append(None)
+    return opcodes, a_values, b_values, slots
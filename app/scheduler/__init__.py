@@ -0,0 +1,109 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Micro-Batching Scheduler
+Collects calculations from concurrent requests and runs them as one vectorized batch
+"""
+
+# scheduler.py
+
+"""
+This module lets an asyncio server calculate the requests of many connections together.
+
+When thousands of clients each send one calculation, calculating every request on its
+own pays the Python dispatch cost once per request. A `MicroBatcher` instead collects
+the calculations submitted during a short window into shared opcode and operand columns.
+When the window closes, or as soon as `max_items` rows are waiting, the rows run as one
+`CalculationBatch`, which groups them by operation and runs each group through its
+vectorized `Operation` kernel. Every submitter then receives the results of its own rows.
+
+No request waits longer than the window plus the time to run one batch. A window of 0
+still batches every request that arrives in the same pass of the event loop, without
+adding any delay.
+"""
+
+import asyncio
+from array import array
+from typing import Iterable, List, Optional, Tuple
+
+from app.calculation import CalculationBatch
+
+# Longest time a calculation waits for others to join its batch, in seconds.
+DEFAULT_BATCH_WINDOW = 0.001
+
+# Rows that close a batch early.
+DEFAULT_BATCH_ITEMS = 4096
+
+
+class MicroBatcher:
+    """
+    Runs calculations submitted within a time window as one batch.
+
+    **Parameters:**
+    - `window (float)`: Seconds the first calculation of a batch waits for others.
+    - `max_items (int)`: Waiting rows that run the batch without waiting for the window.
+    """
+
+    def __init__(self, window: float = DEFAULT_BATCH_WINDOW, max_items: int = DEFAULT_BATCH_ITEMS) -> None:
+        if window < 0:
+            raise ValueError("Batch window cannot be negative.")
+        if max_items < 1:
+            raise ValueError("Batches must allow at least one item.")
+        self.window: float = window
+        self.max_items: int = max_items
+        self.batches: int = 0
+        self.rows: int = 0
+        self._opcodes = array('B')
+        self._a = array('d')
+        self._b = array('d')
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def __len__(self) -> int:
+        """The number of rows waiting for the next batch."""
+        return len(self._opcodes)
+
+    def submit(self, opcodes: Iterable[int], a_values: Iterable[float],
+               b_values: Iterable[float]) -> "asyncio.Future[Tuple[array, array]]":
+        """
+        Adds calculations to the next batch.
+
+        **Parameters:**
+        - `opcodes`: The opcode of each calculation (see `CalculationFactory.opcode`).
+        - `a_values`, `b_values`: The operands of each calculation.
+
+        **Returns:**
+        - A future of the `(results, status)` columns of the submitted rows, as
+          `array('d')` and `array('B')` (see `CalculationBatch`).
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        start = len(self._opcodes)
+        self._opcodes.extend(opcodes)
+        self._a.extend(a_values)
+        self._b.extend(b_values)
+        if not len(self._opcodes) == len(self._a) == len(self._b):
+            del self._opcodes[start:], self._a[start:], self._b[start:]
+            raise ValueError("Batch columns must all have the same length.")
+        self._waiters.append((start, len(self._opcodes), future))
+        if len(self._opcodes) >= self.max_items:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self.flush)
+        return future
+
+    def flush(self) -> None:
+        """Runs the waiting rows now and hands each submitter its results."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._waiters:
+            return
+        batch = CalculationBatch(self._opcodes, self._a, self._b).execute()
+        waiters = self._waiters
+        self._opcodes, self._a, self._b, self._waiters = array('B'), array('d'), array('d'), []
+        self.batches += 1
+        self.rows += len(batch)
+        for start, stop, future in waiters:
+            if not future.done():
+                future.set_result((batch.results[start:stop], batch.status[start:stop]))
@@ -0,0 +1,746 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Calculation Server
+asyncio server answering calculation lines over TCP or a Unix socket
+"""
+
+# server.py
+
+"""
+This module serves calculations to many clients from one process, so a client no longer
+needs a calculator process of its own.
+
+The server accepts connections on TCP or a Unix domain socket and speaks the REPL's line
+protocol. Every request is one line and gets one response:
+
+- `<operation> <num1> <num2>`: the result (as stream mode prints it), or
+  `Error: <message>` when the line cannot be calculated.
+- `history`: the line `History: N`, followed by the connection's N calculations, one
+  per line as the REPL shows them.
+- `batch N`: a batch frame. The next N lines are calculations, answered together by the
+  line `Batch: N` followed by their N results in order. Inside a frame every line is a
+  calculation, so a blank line is answered with an error rather than skipped.
+- `metrics`: the line `Metrics: N`, followed by N `<name> <value>` lines with the
+  server's connection count and queue depths (see `CalculationServer.metrics`).
+- `exit` or `quit`: the server closes the connection.
+
+Blank lines are ignored. Each connection has its own session history (a bounded
+app.history.History), and requests are answered through `CalculationFactory`, so
+repeated calculations from any client are served from the shared result cache.
+
+Clients may pipeline: send many requests without waiting for the responses, which
+always come back in request order. The server reads whatever the client has sent in one
+chunk, answers every complete line in it, and sends all of those responses with a
+single write, so a client that sends a thousand lines at once costs a few system calls
+rather than a thousand round trips.
+
+With a `MicroBatcher` (`serve --batch-window`), calculations are not run as each
+connection reads them. The calculations of all connections are collected over the
+window and run together as vectorized batches (see app.scheduler). Each connection then
+sends its responses, in order, as soon as its own rows are done. Calculations run this
+way skip the factory's result cache, since a batch kernel is cheaper than a cache lookup
+per row.
+
+**Binary protocol.** A connection that starts with the 8 bytes `CALCBIN1` speaks a
+length-prefixed binary protocol instead, which skips text parsing and formatting. Every
+request frame is a 4-byte little-endian record count N followed by three packed columns:
+the N `a` operands and the N `b` operands (little-endian float64), then the N one-byte
+opcodes (see `CalculationFactory.opcode`). The response frame has the same layout: the
+count N, the N float64 results, then the N one-byte `CalculationStatus` codes (NaN
+results for failed rows). Frames are decoded by copying the columns straight out of a
+memoryview of the received bytes into `array` buffers, calculated as one
+`CalculationBatch`, and encoded from the batch's result and status columns, so no
+string or per-row Python object is created. Binary calculations are not recorded in
+a session history. A frame of more than `MAX_FRAME_RECORDS` rows closes the
+connection.
+
+**Backpressure.** Work is admitted in slices: a connection takes at most `client_limit`
+request lines, binary rows, or calculations of a `batch N` frame at a time. It reads nothing more until that slice is
+answered, so a client that sends faster than it is served fills its own socket buffers
+and is slowed down by TCP. A slice runs only once it fits into the global queue of
+`queue_limit` calculations in progress over all connections. While the queue is full,
+connections wait their turn in arrival order without reading. If a slice waits longer
+than `admission_timeout`, it is shed: each of its calculations is answered with
+`Error: Server is overloaded; try again later.` (status `OVERLOADED` in binary frames)
+without being calculated. Connections beyond `max_connections` get that error line
+and are closed at once. The per-client limit keeps one busy client from holding more
+than its share of the queue.
+
+All connections share one event loop. A request is parsed, calculated and answered
+without any thread hand-off, and responses go out over sockets with Nagle's algorithm
+disabled (asyncio's default for TCP), so small responses are sent immediately.
+"""
+
+import asyncio
+import os
+import signal
+import struct
+import sys
+from array import array
+from collections import deque
+from itertools import repeat
+from math import nan
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from app.calculation import Calculation, CalculationBatch, CalculationFactory, CalculationStatus
+from app.history import History
+from app.parser import ParsedLine, ParseError, parse_line
+from app.scheduler import DEFAULT_BATCH_ITEMS, MicroBatcher
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# Number of calculations each connection keeps in memory; older ones move to disk.
+DEFAULT_SESSION_HISTORY = 1000
+
+# Longest request line accepted, in bytes.
+MAX_LINE_BYTES = 1 << 16
+
+# Most bytes read from a connection at once; every complete line in them is answered
+# before the responses are written.
+READ_CHUNK_BYTES = 1 << 16
+
+# Most calculations one batch frame may carry.
+MAX_BATCH_SIZE = 10_000
+
+# First bytes of a connection that speaks the binary protocol.
+BINARY_MAGIC = b'CALCBIN1'
+
+# Binary frames: a record count, then per record two float64 operands and an opcode in
+# requests, or a float64 result and a status in responses.
+FRAME_HEADER = struct.Struct('<I')
+REQUEST_ROW_BYTES = 17
+RESULT_ROW_BYTES = 9
+
+# Most calculations one binary frame may carry (a 17 MiB request).
+MAX_FRAME_RECORDS = 1 << 20
+
+# Calculations in progress over all connections, and for any one connection.
+DEFAULT_QUEUE_LIMIT = 1 << 16
+DEFAULT_CLIENT_LIMIT = 1024
+
+# Seconds a slice of calculations waits for room in a full queue before it is shed.
+DEFAULT_ADMISSION_TIMEOUT = 1.0
+
+# Connections served at once; further connections are turned away.
+DEFAULT_MAX_CONNECTIONS = 10_000
+
+OVERLOADED_RESPONSE = f"Error: {CalculationStatus.OVERLOADED.message}\n"
+
+_CLOSE_COMMANDS = frozenset({'exit', 'quit'})
+
+# Stand in for a session's history and metrics responses until the calculations before
+# them are done.
+_HISTORY = object()
+_METRICS = object()
+
+# A piece of a response: finished text, a calculation still to run, or a marker above.
+Part = Union[str, ParsedLine, object]
+
+
+class Session:
+    """
+    The state of one client connection: its history and request count.
+
+    **Parameters:**
+    - `history_capacity (int)`: Calculations of this session kept in memory.
+    - `metrics (Optional[Callable])`: Returns the values listed by the `metrics`
+      request; without it, `metrics` is not a request this session answers.
+    """
+
+    def __init__(self, history_capacity: int = DEFAULT_SESSION_HISTORY,
+                 metrics: Optional[Callable[[], Dict[str, int]]] = None) -> None:
+        self.history: History = History(history_capacity)
+        self.requests: int = 0
+        self._metrics = metrics
+        self._batch: List[Part] = []  # Parts of the open batch frame, after its header line.
+        self._batch_left: int = 0  # Lines the open batch frame still expects.
+
+    @property
+    def in_batch(self) -> bool:
+        """True while a batch frame is waiting for more of its lines."""
+        return self._batch_left > 0
+
+    def respond(self, line: str) -> Optional[str]:
+        """
+        Returns the response to one request line, ending in a newline, or None when the
+        line has no response of its own: a blank line, or a line of an unfinished batch
+        frame.
+        """
+        parts: List[Part] = []
+        self.collect(line, parts)
+        return self.render(parts) if parts else None
+
+    def collect(self, line: str, parts: List[Part]) -> None:
+        """
+        Appends the parts of the response to one request line to `parts`, without
+        calculating anything yet.
+
+        A part is a finished piece of text, a `ParsedLine` still to be calculated, or
+        the marker for this session's history or the server metrics. `render` turns the parts into text.
+        """
+        if self._batch_left:
+            self._batch_line(line, parts)
+            return
+        parsed = parse_line(line)
+        if parsed is None:
+            return
+        if isinstance(parsed, ParseError):
+            words = line.split()
+            command = words[0].lower()
+            if command == 'batch':
+                self._open_batch(words, parts)
+                return
+            self.requests += 1
+            if command == 'history' and len(words) == 1:
+                parts.append(_HISTORY)
+            elif command == 'metrics' and len(words) == 1 and self._metrics is not None:
+                parts.append(_METRICS)
+            else:
+                parts.append(f"Error: {parsed.message}\n")
+            return
+        self.requests += 1
+        parts.append(self._calculation_part(parsed))
+
+    def render(self, parts: List[Part], outcomes: Optional[Iterator[Tuple[int, float]]] = None) -> str:
+        """
+        Returns the text of collected parts, recording successful calculations in the
+        history in request order.
+
+        **Parameters:**
+        - `parts`: Parts appended by `collect`.
+        - `outcomes`: The `(status, value)` of every calculation part, in order, when
+          they were calculated elsewhere. When None, each one is calculated here through
+          `CalculationFactory` and its result cache.
+        """
+        text = []
+        for part in parts:
+            if part.__class__ is str:
+                text.append(part)
+            elif part is _HISTORY:
+                text.append(self._history_response())
+            elif part is _METRICS:
+                metrics = self._metrics()
+                text.append(f"Metrics: {len(metrics)}\n")
+                text.extend(f"{name} {value}\n" for name, value in metrics.items())
+            elif outcomes is None:
+                calculation = CalculationFactory.create_calculation(part.operation, part.a, part.b)
+                status, value = calculation.try_execute()
+                text.append(self._record(calculation, status, value))
+            else:
+                status, value = next(outcomes)
+                calculation = CalculationFactory.calculation_class(part.opcode)(part.a, part.b)
+                text.append(self._record(calculation, status, value))
+        return ''.join(text)
+
+    def close(self) -> None:
+        """Releases the session history."""
+        self.history.close()
+
+    def _record(self, calculation: Calculation, status: int, value: float) -> str:
+        """Records a successful calculation and returns its result or error line."""
+        if status:
+            return f"Error: {CalculationStatus(status).message}\n"
+        self.history.append(calculation)
+        return f"{value!r}\n"
+
+    @staticmethod
+    def _calculation_part(parsed: ParsedLine) -> Part:
+        """The part for a parsed calculation: itself, or an error for an unknown operation."""
+        if parsed.opcode is None:
+            return f"Error: Unsupported calculation type: '{parsed.operation}'.\n"
+        return parsed
+
+    def _open_batch(self, words: List[str], parts: List[Part]) -> None:
+        """Starts a batch frame from its `batch N` header; adds an error for a bad header."""
+        size = int(words[1]) if len(words) == 2 and words[1].isdigit() else -1
+        if not 0 <= size <= MAX_BATCH_SIZE:
+            self.requests += 1
+            parts.append(f"Error: Expected 'batch <count>' with a count from 0 to {MAX_BATCH_SIZE}.\n")
+        elif size:
+            self._batch_left = size
+        else:
+            parts.append("Batch: 0\n")
+
+    def _batch_line(self, line: str, parts: List[Part]) -> None:
+        """Collects one calculation of the open batch frame; adds the frame once it is complete."""
+        self.requests += 1
+        parsed = parse_line(line)
+        if parsed is None:
+            self._batch.append("Error: Empty line in batch.\n")
+        elif isinstance(parsed, ParseError):
+            self._batch.append(f"Error: {parsed.message}\n")
+        else:
+            self._batch.append(self._calculation_part(parsed))
+        self._batch_left -= 1
+        if not self._batch_left:
+            parts.append(f"Batch: {len(self._batch)}\n")
+            parts.extend(self._batch)
+            self._batch = []
+
+    def _history_response(self) -> str:
+        """The `History: N` line followed by one line per calculation of the session."""
+        lines = [f"History: {len(self.history)}\n"]
+        lines.extend(f"{idx}. {calculation}\n" for idx, calculation in enumerate(self.history, start=1))
+        return ''.join(lines)
+
+
+def is_close_command(line: str) -> bool:
+    """True when a request line asks the server to close the connection."""
+    return line.strip().lower() in _CLOSE_COMMANDS
+
+
+def pack_request(opcodes: Iterable[int], a_values: Iterable[float], b_values: Iterable[float]) -> bytes:
+    """
+    Packs calculations into one binary request frame.
+
+    **Parameters:**
+    - `opcodes`: The opcode of each calculation (see `CalculationFactory.opcode`).
+    - `a_values`, `b_values`: The operands of each calculation.
+    """
+    opcodes, a, b = array('B', opcodes), array('d', a_values), array('d', b_values)
+    if not len(opcodes) == len(a) == len(b):
+        raise ValueError("Frame columns must all have the same length.")
+    if sys.byteorder == 'big':  # pragma: no cover
+        a.byteswap()
+        b.byteswap()
+    return b''.join((FRAME_HEADER.pack(len(opcodes)), a.tobytes(), b.tobytes(), opcodes.tobytes()))
+
+
+def unpack_request(body: memoryview, count: int) -> CalculationBatch:
+    """Decodes the columns of a request frame of `count` rows into a batch."""
+    a, b, opcodes = array('d'), array('d'), array('B')
+    a.frombytes(body[:8 * count])
+    b.frombytes(body[8 * count:16 * count])
+    opcodes.frombytes(body[16 * count:17 * count])
+    if sys.byteorder == 'big':  # pragma: no cover
+        a.byteswap()
+        b.byteswap()
+    return CalculationBatch(opcodes, a, b)
+
+
+def pack_results(results: array, status: array) -> bytes:
+    """Encodes the result and status columns of an executed batch as one response frame."""
+    if sys.byteorder == 'big':  # pragma: no cover
+        results = array('d', results)
+        results.byteswap()
+    return b''.join((FRAME_HEADER.pack(len(results)), results.tobytes(), status.tobytes()))
+
+
+def unpack_results(body: bytes, count: int) -> Tuple[array, array]:
+    """
+    Decodes the body of a response frame of `count` rows.
+
+    **Returns:**
+    - A tuple `(results, status)` of `array('d')` and `array('B')` columns.
+    """
+    results, status = array('d'), array('B')
+    with memoryview(body) as view:
+        results.frombytes(view[:8 * count])
+        status.frombytes(view[8 * count:9 * count])
+    if sys.byteorder == 'big':  # pragma: no cover
+        results.byteswap()
+    return results, status
+
+
+class AdmissionControl:
+    """
+    Bounds the calculations in progress over all connections.
+
+    A slice of calculations is admitted once it fits under `queue_limit`. Slices that do
+    not fit wait in arrival order, so a small slice cannot overtake a large one that
+    came first, and are shed when `timeout` passes first.
+
+    **Parameters:**
+    - `queue_limit (int)`: Calculations in progress at once.
+    - `client_limit (int)`: The largest slice one connection may ask for.
+    - `timeout (float)`: Seconds a slice waits for room before it is shed.
+    """
+
+    def __init__(self, queue_limit: int = DEFAULT_QUEUE_LIMIT, client_limit: int = DEFAULT_CLIENT_LIMIT,
+                 timeout: float = DEFAULT_ADMISSION_TIMEOUT) -> None:
+        if not 1 <= client_limit <= queue_limit:
+            raise ValueError("The client limit must be between 1 and the queue limit.")
+        if timeout < 0:
+            raise ValueError("Admission timeout cannot be negative.")
+        self.queue_limit: int = queue_limit
+        self.client_limit: int = client_limit
+        self.timeout: float = timeout
+        self.queued: int = 0
+        self.shed: int = 0
+        self._waiters: Deque[Tuple[int, asyncio.Future]] = deque()
+
+    @property
+    def waiting(self) -> int:
+        """The number of slices waiting for room."""
+        return sum(not future.done() for _, future in self._waiters)
+
+    async def admit(self, rows: int) -> bool:
+        """
+        Waits until `rows` more calculations fit in the queue and counts them in.
+
+        **Returns:**
+        - `bool`: True once admitted; False if the rows were shed instead.
+        """
+        if not self._waiters and self.queued + rows <= self.queue_limit:
+            self.queued += rows
+            return True
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append((rows, future))
+        try:
+            await asyncio.wait_for(future, self.timeout)
+            return True
+        except asyncio.TimeoutError:
+            self.shed += rows
+            return False
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.queued -= rows  # Admitted just as the connection was cancelled.
+            raise
+        finally:
+            self._wake()
+
+    def release(self, rows: int) -> None:
+        """Counts out calculations that are done and lets waiting slices in."""
+        self.queued -= rows
+        self._wake()
+
+    def _wake(self) -> None:
+        """Admits waiting slices, oldest first, while they fit."""
+        waiters = self._waiters
+        while waiters:
+            rows, future = waiters[0]
+            if future.done():
+                waiters.popleft()
+            elif self.queued + rows <= self.queue_limit:
+                waiters.popleft()
+                self.queued += rows
+                future.set_result(None)
+            else:
+                break
+
+
+class CalculationServer:
+    """
+    An asyncio server that answers calculation lines for many concurrent clients.
+
+    **Parameters:**
+    - `history_capacity (int)`: Calculations kept in memory per connection.
+    - `scheduler (Optional[MicroBatcher])`: Calculates the requests of all connections
+      in shared batches. Without one, each connection calculates its own requests
+      through the `CalculationFactory` result cache as soon as they are read.
+    - `admission (Optional[AdmissionControl])`: Bounds the calculations in progress;
+      one with the default limits is used when not given.
+    - `max_connections (int)`: Connections served at once.
+    """
+
+    def __init__(self, history_capacity: int = DEFAULT_SESSION_HISTORY,
+                 scheduler: Optional[MicroBatcher] = None, admission: Optional[AdmissionControl] = None,
+                 max_connections: int = DEFAULT_MAX_CONNECTIONS) -> None:
+        self.history_capacity: int = history_capacity
+        self.scheduler: Optional[MicroBatcher] = scheduler
+        self.admission: AdmissionControl = admission or AdmissionControl()
+        self.max_connections: int = max_connections
+        self.connections: int = 0
+        self.rejected: int = 0
+        self.requests: int = 0
+        self._servers: List[asyncio.AbstractServer] = []
+
+    async def start_tcp(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> asyncio.AbstractServer:
+        """Starts listening on a TCP address (port 0 picks a free port)."""
+        server = await asyncio.start_server(self.handle, host, port, limit=MAX_LINE_BYTES)
+        self._servers.append(server)
+        return server
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        """Starts listening on a Unix domain socket, replacing a stale socket file."""
+        if os.path.exists(path):
+            os.unlink(path)
+        server = await asyncio.start_unix_server(self.handle, path, limit=MAX_LINE_BYTES)
+        self._servers.append(server)
+        return server
+
+    def metrics(self) -> Dict[str, int]:
+        """
+        Returns the server's load: open and turned-away connections, requests answered,
+        calculations in progress (`queued`) against `queue_limit`, slices waiting for
+        room, calculations shed, and rows waiting for the next scheduler batch.
+        """
+        admission = self.admission
+        return {
+            'connections': self.connections,
+            'rejected_connections': self.rejected,
+            'requests': self.requests,
+            'queued': admission.queued,
+            'queue_limit': admission.queue_limit,
+            'client_limit': admission.client_limit,
+            'waiting': admission.waiting,
+            'shed': admission.shed,
+            'batch_queue': len(self.scheduler) if self.scheduler is not None else 0,
+        }
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serves one connection, in the protocol its first bytes select, until it is closed."""
+        if self.connections >= self.max_connections:
+            self.rejected += 1
+            writer.write(OVERLOADED_RESPONSE.encode())
+            writer.close()
+            return
+        self.connections += 1
+        try:
+            data = await reader.read(READ_CHUNK_BYTES)
+            while data and len(data) < len(BINARY_MAGIC) and BINARY_MAGIC.startswith(data):
+                more = await reader.read(READ_CHUNK_BYTES)
+                if not more:
+                    break
+                data += more
+            if data.startswith(BINARY_MAGIC):
+                await self._serve_binary(reader, writer, data[len(BINARY_MAGIC):])
+            else:
+                await self._serve_text(reader, writer, data)
+        except ConnectionError:
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def _serve_text(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, data: bytes) -> None:
+        """
+        Answers request lines until the client closes the connection or sends `exit`.
+
+        Each read takes everything the client has sent so far, up to `READ_CHUNK_BYTES`.
+        Its complete lines are answered in slices of up to `client_limit` lines, the
+        responses of each slice sent together with one write, before the connection is
+        read again.
+        """
+        session = Session(self.history_capacity, self.metrics)
+        pending = b''
+        limit = self.admission.client_limit
+        try:
+            while True:
+                if data:
+                    *lines, pending = (pending + data).split(b'\n')
+                else:
+                    lines, pending = [pending] if pending else [], b''
+                closing = False
+                for start in range(0, len(lines), limit):
+                    if start:
+                        await asyncio.sleep(0)  # Let other connections in between slices.
+                    parts, closing = self._collect(session, lines[start:start + limit])
+                    await self._send(writer, (await self._render(session, parts)).encode())
+                    if closing:
+                        break
+                if len(pending) > MAX_LINE_BYTES and not closing:
+                    await self._send(writer, f"Error: Line longer than {MAX_LINE_BYTES} bytes.\n".encode())
+                    closing = True
+                if closing or not data:
+                    break
+                data = await reader.read(READ_CHUNK_BYTES)
+        finally:
+            session.close()
+
+    async def _serve_binary(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, data: bytes) -> None:
+        """
+        Answers binary request frames until the client closes the connection.
+
+        Every complete frame received so far is answered, and the response frames are
+        sent together with one write. Frames are calculated in slices of up to
+        `client_limit` rows. The rest of a frame whose header has arrived is read in one
+        piece.
+        """
+        while True:
+            batches = []
+            offset = 0
+            with memoryview(data) as view:
+                while len(data) - offset >= FRAME_HEADER.size:
+                    (count,) = FRAME_HEADER.unpack_from(view, offset)
+                    if count > MAX_FRAME_RECORDS:
+                        break
+                    end = offset + FRAME_HEADER.size + count * REQUEST_ROW_BYTES
+                    if end > len(data):
+                        break
+                    batches.append(unpack_request(view[offset + FRAME_HEADER.size:end], count))
+                    self.requests += count
+                    offset = end
+            data = data[offset:]
+            responses = [pack_results(*await self._calculate(batch)) for batch in batches]
+            await self._send(writer, b''.join(responses))
+            if len(data) < FRAME_HEADER.size:
+                more = await reader.read(READ_CHUNK_BYTES)
+            else:
+                (count,) = FRAME_HEADER.unpack_from(data)
+                if count > MAX_FRAME_RECORDS:
+                    break
+                try:
+                    more = await reader.readexactly(FRAME_HEADER.size + count * REQUEST_ROW_BYTES - len(data))
+                except asyncio.IncompleteReadError:
+                    break
+            if not more:
+                break
+            data += more
+
+    def _collect(self, session: Session, lines: List[bytes]) -> Tuple[List[Part], bool]:
+        """
+        Collects the response parts of request lines in order.
+
+        **Returns:**
+        - A tuple `(parts, closing)`: the parts (see `Session.collect`), and whether the
+          connection should be closed after sending them.
+        """
+        parts: List[Part] = []
+        closing = False
+        requests = session.requests
+        for data in lines:
+            if len(data) > MAX_LINE_BYTES:
+                parts.append(f"Error: Line longer than {MAX_LINE_BYTES} bytes.\n")
+                closing = True
+                break
+            line = data.decode('utf-8', errors='replace')
+            if not session.in_batch and is_close_command(line):
+                closing = True
+                break
+            session.collect(line, parts)
+        self.requests += session.requests - requests
+        return parts, closing
+
+    async def _render(self, session: Session, parts: List[Part]) -> str:
+        """
+        Calculates collected parts and returns their text. The calculations are admitted
+        in slices of up to `client_limit`, so a batch frame larger than the queue is
+        answered slice by slice rather than waiting for room it can never get.
+        """
+        limit = self.admission.client_limit
+        text = []
+        start = count = 0
+        for index, part in enumerate(parts):
+            if part.__class__ is ParsedLine:
+                if count == limit:
+                    text.append(await self._render_slice(session, parts[start:index]))
+                    await asyncio.sleep(0)  # Let other connections in between slices.
+                    start, count = index, 0
+                count += 1
+        text.append(await self._render_slice(session, parts[start:] if start else parts))
+        return ''.join(text)
+
+    async def _render_slice(self, session: Session, parts: List[Part]) -> str:
+        """
+        Calculates the collected parts of one slice and returns their text. The slice is
+        admitted first; shed calculations are answered with the overload error.
+        """
+        calculations = [part for part in parts if part.__class__ is ParsedLine]
+        if not calculations:
+            return session.render(parts)
+        if not await self.admission.admit(len(calculations)):
+            return session.render(parts, repeat((CalculationStatus.OVERLOADED, nan)))
+        try:
+            if self.scheduler is None:
+                return session.render(parts)
+            results, status = await self.scheduler.submit([part.opcode for part in calculations],
+                                                          [part.a for part in calculations],
+                                                          [part.b for part in calculations])
+        finally:
+            self.admission.release(len(calculations))
+        return session.render(parts, zip(status, results))
+
+    async def _calculate(self, batch: CalculationBatch) -> Tuple[array, array]:
+        """
+        Calculates the rows of a binary frame in admitted slices of up to `client_limit`
+        rows, through the scheduler when there is one.
+
+        **Returns:**
+        - A tuple `(results, status)` of `array('d')` and `array('B')` columns; shed rows
+          are NaN with status `OVERLOADED`.
+        """
+        limit = self.admission.client_limit
+        results, status = array('d'), array('B')
+        for start in range(0, len(batch), limit):
+            if start:
+                await asyncio.sleep(0)  # Let other connections in between slices.
+            rows = slice(start, start + limit)
+            opcodes, a_values, b_values = batch.opcodes[rows], batch.a[rows], batch.b[rows]
+            if not await self.admission.admit(len(opcodes)):
+                results.extend(array('d', [nan]) * len(opcodes))
+                status.extend(array('B', [CalculationStatus.OVERLOADED]) * len(opcodes))
+                continue
+            try:
+                if self.scheduler is None:
+                    part = CalculationBatch(opcodes, a_values, b_values).execute()
+                    part_results, part_status = part.results, part.status
+                else:
+                    part_results, part_status = await self.scheduler.submit(opcodes, a_values, b_values)
+            finally:
+                self.admission.release(len(opcodes))
+            results.extend(part_results)
+            status.extend(part_status)
+        return results, status
+
+    @staticmethod
+    async def _send(writer: asyncio.StreamWriter, response: bytes) -> None:
+        """Writes a response and waits until the transport's buffer has room again."""
+        if response:
+            writer.write(response)
+            await writer.drain()
+
+    async def serve_forever(self) -> None:
+        """Serves every started listener until the task is cancelled."""
+        await asyncio.gather(*(server.serve_forever() for server in self._servers))
+
+    async def close(self) -> None:
+        """Stops listening. Connections already open are closed by their handlers."""
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers.clear()
+
+
+async def serve(host: Optional[str] = None, port: Optional[int] = None, unix_path: Optional[str] = None,
+                history_capacity: int = DEFAULT_SESSION_HISTORY, batch_window: Optional[float] = None,
+                batch_items: int = DEFAULT_BATCH_ITEMS, queue_limit: int = DEFAULT_QUEUE_LIMIT,
+                client_limit: int = DEFAULT_CLIENT_LIMIT, admission_timeout: float = DEFAULT_ADMISSION_TIMEOUT,
+                max_connections: int = DEFAULT_MAX_CONNECTIONS) -> None:
+    """
+    Runs a calculation server until SIGINT or SIGTERM.
+
+    **Parameters:**
+    - `host`, `port`: The TCP address to listen on. TCP is used when either is given or
+      when no Unix socket is.
+    - `unix_path (Optional[str])`: A Unix domain socket to listen on.
+    - `history_capacity (int)`: Calculations kept in memory per connection.
+    - `batch_window (Optional[float])`: When given, requests of all connections are
+      calculated together in batches collected for up to this many seconds (see
+      app.scheduler).
+    - `batch_items (int)`: Waiting calculations that start a batch before its window ends.
+    - `queue_limit`, `client_limit`, `admission_timeout`: Bound the calculations in
+      progress over all connections and per connection (see `AdmissionControl`).
+    - `max_connections (int)`: Connections served at once.
+    """
+    scheduler = MicroBatcher(batch_window, batch_items) if batch_window is not None else None
+    admission = AdmissionControl(queue_limit, client_limit, admission_timeout)
+    server = CalculationServer(history_capacity, scheduler, admission, max_connections)
+    addresses = []
+    if unix_path:
+        await server.start_unix(unix_path)
+        addresses.append(unix_path)
+    if host is not None or port is not None or not unix_path:
+        tcp = await server.start_tcp(host or DEFAULT_HOST, DEFAULT_PORT if port is None else port)
+        addresses.extend('%s:%d' % socket.getsockname()[:2] for socket in tcp.sockets)
+    print(f"Serving calculations on {', '.join(addresses)}", flush=True)
+
+    task = asyncio.ensure_future(server.serve_forever())
+    loop = asyncio.get_running_loop()
+    signals = (signal.SIGINT, signal.SIGTERM) if sys.platform != 'win32' else ()
+    for signum in signals:
+        loop.add_signal_handler(signum, task.cancel)
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    finally:
+        for signum in signals:
+            loop.remove_signal_handler(signum)
+        await server.close()
+        if unix_path and os.path.exists(unix_path):
+            os.unlink(unix_path)
+    shed = f" ({server.admission.shed} calculations shed)" if server.admission.shed else ""
+    print(f"Server stopped after {server.requests} requests{shed}.", flush=True)
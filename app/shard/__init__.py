@@ -0,0 +1,168 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Sharded Line File Processing
+Splits large calculation files into byte ranges processed by parallel workers
+"""
+
+# shard.py
+
+"""
+This module calculates very large files of `<operation> <num1> <num2>` lines (the
+stream mode grammar) with several processes reading at once.
+
+1. `shard_ranges` splits the file into one byte range per worker. Every boundary is
+   moved forward to the start of a line, so no line is ever split between workers.
+2. Each worker maps only its own range with `mmap`, decodes it one window at a time,
+   calculates each window with `app.stream.process_lines` and writes the results to
+   its own part file.
+3. The part files are appended to the output in range order. The copy is done by the
+   kernel with `os.sendfile`, so the results never pass back through the parent process.
+
+The output is identical to running the file through stream mode: one result (or
+`Error: <message>`) line per non-blank input line, in input order.
+"""
+
+import mmap
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, List, Optional, Tuple
+
+from app.batch import BatchSummary, check_output_path
+from app.stream import process_lines
+
+# Number of bytes each worker decodes and calculates at a time.
+DEFAULT_WINDOW_BYTES = 1 << 22
+
+ERROR_PREFIX = "Error: "
+
+
+def default_output_path(input_path: str) -> str:
+    """Returns the output file used when none is given: `jobs.txt` -> `jobs.results.txt`."""
+    root, ext = os.path.splitext(input_path)
+    return f"{root}.results{ext or '.txt'}"
+
+
+def shard_ranges(path: str, shards: int) -> List[Tuple[int, int]]:
+    """
+    Splits a file into at most `shards` non-empty `(start, stop)` byte ranges.
+
+    The ranges are close to equal in size, cover the whole file, and each one starts at
+    the beginning of a line.
+    """
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    with open(path, 'rb') as infile, mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        bounds = [0]
+        for shard in range(1, max(shards, 1)):
+            target = max(size * shard // shards, bounds[-1])
+            # The boundary goes just past the first newline at or after target - 1, so a
+            # target that already sits at the start of a line is kept.
+            newline = mapped.find(b'\n', max(target - 1, 0))
+            bounds.append(size if newline < 0 else newline + 1)
+        bounds.append(size)
+    return [(start, stop) for start, stop in zip(bounds, bounds[1:]) if start < stop]
+
+
+def process_range(input_path: str, start: int, stop: int, part_path: str,
+                  window: int = DEFAULT_WINDOW_BYTES) -> Tuple[int, int]:
+    """
+    Calculates the lines in bytes `start` to `stop` of a file and writes the results to `part_path`.
+
+    Only the range itself is mapped. It is decoded one window of about `window` bytes at
+    a time, each window ending on a line boundary, so memory use stays bounded.
+
+    **Returns:**
+    - `(lines, errors)`: The number of result lines written and how many were errors.
+    """
+    # mmap offsets must be a multiple of the allocation granularity.
+    offset = start - start % mmap.ALLOCATIONGRANULARITY
+    lines = errors = 0
+    with open(input_path, 'rb') as infile, \
+            mmap.mmap(infile.fileno(), stop - offset, access=mmap.ACCESS_READ, offset=offset) as mapped, \
+            open(part_path, 'w', encoding='utf-8', newline='\n') as outfile:
+        position, end = start - offset, stop - offset
+        while position < end:
+            window_end = min(position + window, end)
+            if window_end < end:
+                newline = mapped.rfind(b'\n', position, window_end)
+                if newline < 0:
+                    # A single line longer than the window: extend to its end.
+                    newline = mapped.find(b'\n', window_end, end)
+                window_end = end if newline < 0 else newline + 1
+            # Only '\n' ends a line, as in stream mode; str.splitlines would also split on
+            # characters such as '\x0c', '\x1c' and '\u2028'.
+            output = process_lines(mapped[position:window_end].decode('utf-8').split('\n'))
+            if output:
+                outfile.write('\n'.join(output))
+                outfile.write('\n')
+                lines += len(output)
+                errors += sum(1 for line in output if line.startswith(ERROR_PREFIX))
+            position = window_end
+    return lines, errors
+
+
+def _append_file(outfile: BinaryIO, part_path: str) -> None:
+    """
+    Appends a part file to an unbuffered output file.
+
+    `os.sendfile` copies the bytes inside the kernel. Platforms where it cannot copy
+    between regular files fall back to a `shutil.copyfileobj` copy of the remainder.
+    """
+    with open(part_path, 'rb') as part:
+        size = os.fstat(part.fileno()).st_size
+        copied = 0
+        try:
+            while copied < size:
+                sent = os.sendfile(outfile.fileno(), part.fileno(), copied, size - copied)
+                if sent == 0:
+                    break
+                copied += sent
+        except (AttributeError, OSError):
+            pass
+        if copied < size:
+            part.seek(copied)
+            shutil.copyfileobj(part, outfile)
+
+
+def process_sharded(input_path: str, output_path: Optional[str] = None, jobs: Optional[int] = None,
+                    window: int = DEFAULT_WINDOW_BYTES) -> BatchSummary:
+    """
+    Calculates every line of a large file with `jobs` processes, each reading its own byte range.
+
+    **Parameters:**
+    - `input_path (str)`: The file of `<operation> <num1> <num2>` lines.
+    - `output_path (Optional[str])`: Where to write results (default: `<input>.results.<ext>`).
+    - `jobs (Optional[int])`: Number of worker processes (default: one per CPU). `1`
+      calculates in the current process.
+    - `window (int)`: Number of bytes each worker decodes and calculates at a time.
+
+    **Returns:**
+    - `BatchSummary`: The number of result lines, how many were errors, and the output path.
+
+    **Raises:**
+    - `OSError`: If the input file cannot be read or the output file cannot be written.
+    - `ValueError`: If the output file is the input file, or the input is not UTF-8 text.
+    """
+    output_path = output_path or default_output_path(input_path)
+    check_output_path(input_path, output_path)
+    jobs = jobs or os.cpu_count() or 1
+    ranges = shard_ranges(input_path, jobs)
+    # Part files live next to the output so the final copy stays on one file system.
+    with tempfile.TemporaryDirectory(prefix='.shards-', dir=os.path.dirname(os.path.abspath(output_path))) as parts:
+        part_paths = [os.path.join(parts, f'{index:06d}.part') for index in range(len(ranges))]
+        if jobs > 1 and len(ranges) > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                futures = [executor.submit(process_range, input_path, start, stop, part_path, window)
+                           for (start, stop), part_path in zip(ranges, part_paths)]
+                totals = [future.result() for future in futures]
+        else:
+            totals = [process_range(input_path, start, stop, part_path, window)
+                      for (start, stop), part_path in zip(ranges, part_paths)]
+        with open(output_path, 'wb', buffering=0) as outfile:
+            for part_path in part_paths:
+                _append_file(outfile, part_path)
+    return BatchSummary(sum(lines for lines, _ in totals), sum(errors for _, errors in totals), output_path)
@@ -0,0 +1,99 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Running Statistics
+Constant-time session totals kept up to date as calculations are made
+"""
+
+# stats.py
+
+"""
+This module keeps summary statistics of calculation results up to date one value at a
+time, so a summary of the whole session is available without walking the history.
+
+- Sums use Neumaier's compensated summation: the rounding error of every addition is
+  kept in a second float and added back at the end, so adding many values of very
+  different sizes loses no more precision than adding them exactly and rounding once.
+- Mean and variance use Welford's algorithm, which updates them from each new value
+  and avoids the cancellation of the `sum(x * x) - sum(x) ** 2 / n` formula.
+"""
+
+from math import inf, isfinite, nan, sqrt
+from typing import Dict
+
+
+class RunningStats:
+    """
+    Count, sum, mean, variance, minimum and maximum of a stream of values, each updated
+    in constant time per value.
+    """
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.minimum: float = inf
+        self.maximum: float = -inf
+        self._sum = 0.0
+        self._compensation = 0.0  # Rounding error lost by the additions to _sum so far.
+        self._mean = 0.0
+        self._m2 = 0.0  # Sum of squared differences from the current mean.
+
+    def add(self, value: float) -> None:
+        """Adds one value."""
+        self.count += 1
+        total = self._sum + value
+        if isfinite(total):
+            if abs(self._sum) >= abs(value):
+                self._compensation += (self._sum - total) + value
+            else:
+                self._compensation += (value - total) + self._sum
+        self._sum = total
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (value - self._mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    @property
+    def total(self) -> float:
+        """The sum of the values."""
+        return self._sum + self._compensation
+
+    @property
+    def mean(self) -> float:
+        """The arithmetic mean of the values, or NaN if there are none."""
+        return self._mean if self.count else nan
+
+    @property
+    def variance(self) -> float:
+        """The population variance of the values, or NaN if there are none."""
+        return self._m2 / self.count if self.count else nan
+
+    @property
+    def stdev(self) -> float:
+        """The population standard deviation of the values, or NaN if there are none."""
+        return sqrt(self.variance) if self.count else nan
+
+
+class SessionStats:
+    """
+    Running statistics of calculation results, for every operation and for all of them.
+    Results that are not real numbers (the complex power of a negative base) are left
+    out, since they have no place on the number line these statistics summarise.
+    """
+
+    def __init__(self) -> None:
+        self.overall: RunningStats = RunningStats()
+        self.by_operation: Dict[str, RunningStats] = {}
+
+    def add(self, operation: str, result: float) -> None:
+        """Adds the result of one calculation of the given type, unless it is complex."""
+        if isinstance(result, complex):
+            return
+        self.overall.add(result)
+        stats = self.by_operation.get(operation)
+        if stats is None:
+            stats = self.by_operation[operation] = RunningStats()
+        stats.add(result)
+
+    def __len__(self) -> int:
+        return self.overall.count
@@ -0,0 +1,235 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Persistent History Store
+SQLite-backed calculation history shared across calculator sessions
+"""
+
+# store.py
+
+"""
+This module keeps calculation history in a local SQLite database, so it survives
+between calculator sessions and can be queried without loading it into memory.
+
+- The database runs in WAL (write-ahead logging) mode with `synchronous=NORMAL`, so a
+  commit appends to the log instead of rewriting pages and waiting for the disk twice.
+- `record` only queues a row. Queued rows are written together with one `executemany`
+  in one transaction every `batch_size` calculations, before any query, and on close,
+  so recording a calculation costs microseconds.
+- Rows are indexed by `(operation, created)` and by `created`, so "the last 100
+  divisions" and "everything since 9am" are answered by index range scans, newest
+  first, that stop after the requested number of rows.
+- SQLite stores a NaN parameter as NULL, so NaN operands and results are written as the
+  text `'nan'` and read back as `float('nan')`. A result that is not a real number (the
+  complex power of a negative base) is stored as NULL, like a failed calculation.
+"""
+
+import re
+import sqlite3
+import time
+from datetime import datetime
+from typing import Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from app.calculation import Calculation, CalculationFactory
+
+# Number of recorded calculations written to the database per transaction.
+DEFAULT_BATCH_SIZE = 64
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    id        INTEGER PRIMARY KEY,
+    created   REAL NOT NULL,
+    operation TEXT NOT NULL,
+    a         REAL NOT NULL,
+    b         REAL NOT NULL,
+    result    REAL
+);
+CREATE INDEX IF NOT EXISTS history_operation ON history (operation, created);
+CREATE INDEX IF NOT EXISTS history_created ON history (created);
+"""
+
+# Stored in place of NaN, which SQLite would otherwise turn into NULL.
+_NAN = 'nan'
+
+# An operand or result as written to the database: a float, or _NAN.
+_Stored = Union[float, str]
+
+_INSERT = 'INSERT INTO history (created, operation, a, b, result) VALUES (?, ?, ?, ?, ?)'
+
+# Errors raised when SQLite refuses a row itself, which retrying can never fix.
+_ROW_ERRORS = (sqlite3.InterfaceError, sqlite3.IntegrityError, sqlite3.ProgrammingError)
+
+_RELATIVE_TIME = re.compile(r'(\d+(?:\.\d+)?)([smhd])')
+_SECONDS_PER_UNIT = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+class HistoryEntry(NamedTuple):
+    """One stored calculation. `created` is a Unix timestamp."""
+    id: int
+    created: float
+    operation: str
+    a: float
+    b: float
+    result: Optional[float]
+
+    def calculation(self) -> Calculation:
+        """Rebuilds the Calculation object this entry was recorded from."""
+        return CalculationFactory.calculation_class(CalculationFactory.opcode(self.operation))(self.a, self.b)
+
+    def __str__(self) -> str:
+        stamp = datetime.fromtimestamp(self.created).strftime('%Y-%m-%d %H:%M:%S')
+        return f"[{stamp}] {self.calculation()}"
+
+
+def _encode(value: Optional[float]) -> Optional[_Stored]:
+    """Returns `value` as it is written to the database."""
+    if isinstance(value, complex):
+        return None
+    return _NAN if value != value else value
+
+
+def _entry(row: Tuple) -> HistoryEntry:
+    """Builds a HistoryEntry from a database row, decoding stored NaNs."""
+    id, created, operation, a, b, result = row
+    return HistoryEntry(id, created, operation, float(a), float(b), None if result is None else float(result))
+
+
+def parse_time(text: str, now: Optional[float] = None) -> Optional[float]:
+    """
+    Parses a point in time for `history since <time>` into a Unix timestamp.
+
+    Accepts an ISO date or date-time in local time (`2025-09-28`, `2025-09-28T14:30`,
+    `2025-09-28 14:30:00`) or an age such as `90s`, `15m`, `2h` or `1d`. Returns None
+    for anything else.
+    """
+    match = _RELATIVE_TIME.fullmatch(text)
+    if match:
+        now = time.time() if now is None else now
+        return now - float(match.group(1)) * _SECONDS_PER_UNIT[match.group(2)]
+    try:
+        return datetime.fromisoformat(text).timestamp()
+    except ValueError:
+        return None
+
+
+class HistoryStore:
+    """
+    Calculation history persisted in an SQLite database.
+
+    **Parameters:**
+    - `path (str)`: The database file (created if missing), or `':memory:'`.
+    - `batch_size (int)`: Number of recorded calculations written per transaction.
+    """
+
+    def __init__(self, path: str, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        self.path: str = path
+        self.batch_size: int = max(batch_size, 1)
+        self._pending: List[Tuple[float, str, _Stored, _Stored, Optional[_Stored]]] = []
+        self._connection = sqlite3.connect(path)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.executescript(_SCHEMA)
+
+    def record(self, calculation: Calculation, created: Optional[float] = None) -> None:
+        """Queues a calculation (with its result) to be written with the next batch."""
+        self._pending.append((
+            time.time() if created is None else created,
+            CalculationFactory.type_name_of(calculation),
+            _encode(calculation.a),
+            _encode(calculation.b),
+            _encode(calculation.result),
+        ))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes every queued calculation in one transaction.
+
+        **Raises:**
+        - `sqlite3.Error`: If the calculations cannot be written. When SQLite refuses a
+          row itself, the other rows are written one at a time and the refused ones are
+          dropped before the error is raised, so they cannot fail every later flush.
+        """
+        if not self._pending:
+            return
+        try:
+            with self._connection:
+                self._connection.executemany(_INSERT, self._pending)
+        except _ROW_ERRORS:
+            for row in self._pending:
+                try:
+                    with self._connection:
+                        self._connection.execute(_INSERT, row)
+                except _ROW_ERRORS:
+                    pass
+            self._pending.clear()
+            raise
+        self._pending.clear()
+
+    def count(self, operation: Optional[str] = None) -> int:
+        """Returns the number of stored calculations, optionally of one operation."""
+        self.flush()
+        if operation is None:
+            return self._connection.execute('SELECT COUNT(*) FROM history').fetchone()[0]
+        return self._connection.execute(
+            'SELECT COUNT(*) FROM history WHERE operation = ?', (operation.lower(),)
+        ).fetchone()[0]
+
+    def last(self, limit: int, operation: Optional[str] = None) -> List[HistoryEntry]:
+        """Returns the newest `limit` calculations, optionally of one operation, oldest first."""
+        return self.query(operation=operation, limit=limit)
+
+    def since(self, created: float, operation: Optional[str] = None,
+              limit: Optional[int] = None) -> List[HistoryEntry]:
+        """Returns the calculations recorded at or after `created`, oldest first."""
+        return self.query(operation=operation, since=created, limit=limit)
+
+    def query(self, operation: Optional[str] = None, since: Optional[float] = None,
+              limit: Optional[int] = None) -> List[HistoryEntry]:
+        """
+        Returns stored calculations matching every given filter, oldest first.
+
+        The newest rows are read first through an index and the page is reversed, so
+        only `limit` rows are ever read.
+        """
+        self.flush()
+        conditions: List[str] = []
+        parameters: List[Union[str, float, int]] = []
+        if operation is not None:
+            conditions.append('operation = ?')
+            parameters.append(operation.lower())
+        if since is not None:
+            conditions.append('created >= ?')
+            parameters.append(since)
+        sql = 'SELECT id, created, operation, a, b, result FROM history'
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+        sql += ' ORDER BY created DESC, id DESC'
+        if limit is not None:
+            sql += ' LIMIT ?'
+            parameters.append(limit)
+        rows = self._connection.execute(sql, parameters).fetchall()
+        return [_entry(row) for row in reversed(rows)]
+
+    def entries(self) -> Iterator[HistoryEntry]:
+        """Yields every stored calculation, oldest first, without loading them all at once."""
+        self.flush()
+        cursor = self._connection.execute(
+            'SELECT id, created, operation, a, b, result FROM history ORDER BY created, id'
+        )
+        for row in cursor:
+            yield _entry(row)
+
+    def close(self) -> None:
+        """Writes any queued calculations and closes the database, even if writing fails."""
+        try:
+            self.flush()
+        finally:
+            self._connection.close()
+
+    def __enter__(self) -> "HistoryStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
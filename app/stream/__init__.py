@@ -0,0 +1,91 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Non-Interactive Stream Mode
+Processes piped calculation lines without the REPL prompts
+"""
+
+# stream.py
+
+"""
+This module runs the calculator over a stream of `<operation> <num1> <num2>` lines,
+such as a file piped into `python main.py`. It is the non-interactive counterpart of
+the REPL in app.calculator:
+
+- No prompts, no welcome banner and no help text are printed.
+- Input is read in large buffered chunks rather than one `input()` call per line.
+- Lines are split straight into opcode and operand columns by `app.parser.parse_lines`.
+- Each chunk is executed as one `CalculationBatch`, so rows are grouped by operation
+  and run through the vectorized kernels instead of one Calculation object per line.
+- Exactly one output line is written per non-blank input line, in input order: the
+  result value, or `Error: <message>` for a line that could not be calculated.
+- Calculations are only retained when the caller passes a history list.
+"""
+
+import sys
+from typing import List, Optional, TextIO
+
+from app.calculation import Calculation, CalculationFactory, CalculationStatus
+from app.parser import parse_lines
+
+# Approximate number of bytes read from the input per chunk.
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def process_lines(lines: List[str], history: Optional[List[Calculation]] = None) -> List[str]:
+    """
+    Calculates a chunk of lines as one batch and returns one output line per non-blank input line.
+
+    **Parameters:**
+    - `lines (List[str])`: The input lines.
+    - `history (Optional[List[Calculation]])`: When given, every successful calculation is 
+      appended to it as a Calculation object.
+    """
+    opcodes, a_values, b_values, slots = parse_lines(lines)
+    batch = CalculationFactory.create_many(opcodes, a_values, b_values).execute()
+    results, status = batch.results, batch.status
+    output: List[str] = []
+    row = 0
+    for slot in slots:
+        if slot is not None:
+            output.append(f"Error: {slot}")
+            continue
+        code = status[row]
+        if code:
+            output.append(f"Error: {CalculationStatus(code).message}")
+        else:
+            output.append(repr(results[row]))
+            if history is not None:
+                history.append(batch.calculation(row))
+        row += 1
+    return output
+
+
+def run_stream(infile: Optional[TextIO] = None, outfile: Optional[TextIO] = None,
+               history: Optional[List[Calculation]] = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Reads calculation lines from `infile` until EOF and writes one result per line to `outfile`.
+
+    **Parameters:**
+    - `infile`: The input stream (defaults to `sys.stdin`).
+    - `outfile`: The output stream (defaults to `sys.stdout`).
+    - `history`: Optional list that receives every successful calculation.
+    - `chunk_size (int)`: Approximate number of bytes read and calculated per chunk.
+
+    **Returns:**
+    - `int`: The number of output lines written.
+    """
+    infile = sys.stdin if infile is None else infile
+    outfile = sys.stdout if outfile is None else outfile
+    written = 0
+    while True:
+        lines = infile.readlines(chunk_size)
+        if not lines:
+            break
+        output = process_lines(lines, history)
+        if output:
+            outfile.write('\n'.join(output))
+            outfile.write('\n')
+            written += len(output)
+    outfile.flush()
+    return written
@@ -0,0 +1,313 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Write-Ahead Log
+Crash-safe append-only log of executed calculations with group commit
+"""
+
+# wal.py
+
+"""
+This module records every executed calculation in an append-only log on disk, so a
+long-running calculator can rebuild its history after a crash.
+
+**Segments** are files named `<number>.wal` in the log directory:
+- A 16-byte header: `b'CALCWAL1'` followed by the little-endian number of the oldest
+  segment whose records the file holds (`'<Q'`). A segment written by `append` holds
+  only its own records; a compacted segment holds those of every segment it replaced.
+- One 21-byte record per calculation: the 17-byte request record of app.binary (opcode
+  and two float64 operands) followed by its CRC-32 (`'<I'`).
+
+**Group commit.** Records are collected in memory and written with one `write` and one
+`fdatasync` when `group_records` are waiting or `group_interval` seconds after the first
+of them, whichever comes first. A crash loses at most that one group, and the cost of
+syncing is shared by every record in it.
+
+**Replay** reads the segments in order and stops reading a segment at the first record
+whose checksum does not match, which is where a write was cut short by the crash.
+
+**Compaction.** Appends move to a new segment every `segment_records` records. Once more
+than `max_segments` full segments exist, a background thread rewrites them into one
+segment holding the newest `retain` of their valid records, reading the segments newest
+first and stopping once it has enough, so it never holds more than `retain` records and
+one segment in memory. Full segments are never written again, so appends and commits
+carry on while it runs. The new segment is synced and renamed over the newest one it
+replaces before the others are deleted; its header says which segments it covers, so
+after a crash at any point replay skips the old copies.
+"""
+
+import os
+import struct
+import threading
+import zlib
+from typing import Iterator, List, Optional
+
+from app.binary import REQUEST_RECORD
+from app.calculation import Calculation, CalculationFactory
+
+WAL_MAGIC = b'CALCWAL1'
+WAL_HEADER = struct.Struct('<8sQ')
+WAL_CHECKSUM = struct.Struct('<I')
+WAL_RECORD = struct.Struct(REQUEST_RECORD.format + 'I')
+WAL_RECORD_SIZE = WAL_RECORD.size
+
+# Records written and synced together, and the longest a record waits to be synced.
+DEFAULT_GROUP_RECORDS = 64
+DEFAULT_GROUP_INTERVAL = 0.01
+
+# Records per segment, and full segments kept before they are compacted into one.
+DEFAULT_SEGMENT_RECORDS = 1 << 16
+DEFAULT_MAX_SEGMENTS = 4
+
+# Newest records of the full segments that compaction keeps.
+DEFAULT_RETAIN = DEFAULT_SEGMENT_RECORDS
+
+_SUFFIX = '.wal'
+
+# fdatasync skips the metadata update fsync would also wait for; it is not on every OS.
+_sync = getattr(os, 'fdatasync', os.fsync)
+
+
+def encode_record(calculation: Calculation) -> bytes:
+    """Returns the checksummed log record of a calculation."""
+    payload = REQUEST_RECORD.pack(CalculationFactory.opcode_of(calculation), calculation.a, calculation.b)
+    return payload + WAL_CHECKSUM.pack(zlib.crc32(payload))
+
+
+def read_records(path: str) -> bytes:
+    """
+    Returns the records of one segment file, up to the first record that is incomplete,
+    fails its checksum or names an unknown opcode.
+    """
+    with open(path, 'rb') as segment:
+        data = segment.read()
+    opcodes = len(CalculationFactory.opcode_table())
+    end = WAL_HEADER.size
+    payload_size = REQUEST_RECORD.size
+    for offset in range(WAL_HEADER.size, len(data) - WAL_RECORD_SIZE + 1, WAL_RECORD_SIZE):
+        payload = data[offset:offset + payload_size]
+        checksum, = WAL_CHECKSUM.unpack_from(data, offset + payload_size)
+        if zlib.crc32(payload) != checksum or payload[0] >= opcodes:
+            break
+        end = offset + WAL_RECORD_SIZE
+    return data[WAL_HEADER.size:end]
+
+
+def read_segment(path: str) -> List[Calculation]:
+    """
+    Returns the calculations in one segment file, oldest first, up to the first record
+    that is incomplete or fails its checksum.
+    """
+    calculation_class = CalculationFactory.calculation_class
+    return [calculation_class(opcode)(a, b) for opcode, a, b, _ in WAL_RECORD.iter_unpack(read_records(path))]
+
+
+def _fsync_directory(directory: str) -> None:
+    """Makes file creations and renames in a directory durable, where the OS allows it."""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return  # pragma: no cover
+    descriptor = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+class WriteAheadLog:
+    """
+    An append-only, checksummed log of executed calculations.
+
+    **Parameters:**
+    - `directory (str)`: Directory holding the segment files (created if missing).
+    - `group_records (int)`: Records written and synced together.
+    - `group_interval (float)`: Seconds a record may wait before its group is synced.
+    - `segment_records (int)`: Records per segment file.
+    - `max_segments (int)`: Full segments kept before they are compacted into one.
+    - `retain (int)`: Newest records of the full segments kept by compaction.
+    """
+
+    def __init__(self, directory: str, group_records: int = DEFAULT_GROUP_RECORDS,
+                 group_interval: float = DEFAULT_GROUP_INTERVAL,
+                 segment_records: int = DEFAULT_SEGMENT_RECORDS,
+                 max_segments: int = DEFAULT_MAX_SEGMENTS, retain: int = DEFAULT_RETAIN) -> None:
+        self.directory: str = directory
+        self.group_records: int = max(group_records, 1)
+        self.group_interval: float = group_interval
+        self.segment_records: int = max(segment_records, 1)
+        self.max_segments: int = max(max_segments, 1)
+        self.retain: int = max(retain, 0)
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.RLock()
+        # Held while segments are compacted or replayed, never while committing.
+        self._compaction_lock = threading.Lock()
+        self._compactor: Optional[threading.Thread] = None
+        self._pending = bytearray()
+        self._pending_records = 0
+        self._timer: Optional[threading.Timer] = None
+        self._descriptor: Optional[int] = None
+        self._segment_records = 0
+        self._sealed: List[int] = self._recover()
+        self._next_number = self._sealed[-1] + 1 if self._sealed else 1
+
+    def segment_path(self, number: int) -> str:
+        """Returns the path of segment `number`."""
+        return os.path.join(self.directory, f"{number:08d}{_SUFFIX}")
+
+    def append(self, calculation: Calculation) -> None:
+        """Queues a calculation; it is durable once its group has been committed."""
+        record = encode_record(calculation)
+        with self._lock:
+            self._pending += record
+            self._pending_records += 1
+            if self._pending_records >= self.group_records:
+                self.commit()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.group_interval, self.commit)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def commit(self) -> None:
+        """Writes and syncs every queued record, starting a new segment when one fills up."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            view = memoryview(bytes(self._pending))
+            self._pending.clear()
+            while self._pending_records:
+                if self._descriptor is None:
+                    self._open_segment()
+                count = min(self._pending_records, self.segment_records - self._segment_records)
+                chunk = view[:count * WAL_RECORD_SIZE]
+                while chunk:
+                    chunk = chunk[os.write(self._descriptor, chunk):]
+                _sync(self._descriptor)
+                view = view[count * WAL_RECORD_SIZE:]
+                self._pending_records -= count
+                self._segment_records += count
+                if self._segment_records == self.segment_records:
+                    self._seal_segment()
+
+    def replay(self) -> Iterator[Calculation]:
+        """Yields every committed calculation in the log, oldest first."""
+        with self._compaction_lock:
+            with self._lock:
+                self.commit()
+                numbers = list(self._sealed)
+                if self._descriptor is not None:
+                    numbers.append(self._next_number - 1)
+            segments = [read_records(self.segment_path(number)) for number in numbers]
+        calculation_class = CalculationFactory.calculation_class
+        for records in segments:
+            for opcode, a, b, _ in WAL_RECORD.iter_unpack(records):
+                yield calculation_class(opcode)(a, b)
+
+    def compact(self) -> None:
+        """
+        Rewrites every full segment into one that holds only the newest `retain` of their
+        valid records. Appends and commits go on meanwhile, and the log stays readable if
+        this is interrupted.
+        """
+        with self._compaction_lock:
+            with self._lock:
+                sealed = list(self._sealed)
+            if not sealed:
+                return
+            first, last = sealed[0], sealed[-1]
+            size = self.retain * WAL_RECORD_SIZE
+            if len(sealed) == 1 and os.path.getsize(self.segment_path(last)) - WAL_HEADER.size <= size:
+                return
+            kept: List[bytes] = []
+            total = 0
+            for number in reversed(sealed):
+                if total >= size:
+                    break
+                records = read_records(self.segment_path(number))
+                kept.append(records)
+                total += len(records)
+            data = b''.join(reversed(kept))
+            temporary = self.segment_path(last) + '.tmp'
+            with open(temporary, 'wb') as segment:
+                segment.write(WAL_HEADER.pack(WAL_MAGIC, first))
+                segment.write(data[max(len(data) - size, 0):])
+                segment.flush()
+                _sync(segment.fileno())
+            os.replace(temporary, self.segment_path(last))
+            _fsync_directory(self.directory)
+            for number in sealed[:-1]:
+                os.remove(self.segment_path(number))
+            with self._lock:
+                self._sealed[:len(sealed)] = [last]
+
+    def close(self) -> None:
+        """
+        Commits every queued record, closes the active segment and finishes any
+        compaction that is due.
+        """
+        with self._lock:
+            self.commit()
+            if self._descriptor is not None:
+                os.close(self._descriptor)
+                self._descriptor = None
+            compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+        if len(self._sealed) > self.max_segments:
+            self.compact()
+
+    def __enter__(self) -> "WriteAheadLog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _recover(self) -> List[int]:
+        """
+        Returns the numbers of the segments on disk, oldest first, after deleting the ones
+        a later compacted segment already covers and any unfinished compaction output.
+        """
+        covering = {}
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.endswith(_SUFFIX + '.tmp'):
+                os.remove(path)
+                continue
+            stem, suffix = os.path.splitext(name)
+            if suffix != _SUFFIX or not stem.isdigit():
+                continue
+            with open(path, 'rb') as segment:
+                header = segment.read(WAL_HEADER.size)
+            if len(header) < WAL_HEADER.size:
+                continue
+            magic, first = WAL_HEADER.unpack(header)
+            if magic == WAL_MAGIC:
+                covering[int(stem)] = first
+        numbers = sorted(covering)
+        live: List[int] = []
+        for number in reversed(numbers):
+            if live and covering[live[-1]] <= number:
+                os.remove(self.segment_path(number))  # Already copied into a compacted segment.
+                continue
+            live.append(number)
+        return live[::-1]
+
+    def _open_segment(self) -> None:
+        """Creates the next segment file and makes it the one appends go to."""
+        number = self._next_number
+        self._next_number += 1
+        self._descriptor = os.open(self.segment_path(number), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        os.write(self._descriptor, WAL_HEADER.pack(WAL_MAGIC, number))
+        _fsync_directory(self.directory)
+        self._segment_records = 0
+
+    def _seal_segment(self) -> None:
+        """
+        Closes the full active segment and, once too many full segments exist, starts
+        compacting them in the background unless a compaction is already running.
+        """
+        os.close(self._descriptor)
+        self._descriptor = None
+        self._sealed.append(self._next_number - 1)
+        if len(self._sealed) > self.max_segments and (self._compactor is None or not self._compactor.is_alive()):
+            self._compactor = threading.Thread(target=self.compact, name='wal-compaction', daemon=True)
+            self._compactor.start()
@@ -0,0 +1,69 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: History Memory Benchmark
+Measures the bytes used per calculator history entry
+"""
+
+# benchmarks/bench_history_memory.py
+
+"""
+Compares the memory used by one history entry (a Calculation object with its operands)
+for the slot-based Calculation hierarchy against an equivalent dict-based class that
+mirrors the previous layout.
+
+Run from the repository root:
+
+    python benchmarks/bench_history_memory.py --entries 200000
+"""
+
+import argparse
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.calculation import AddCalculation  # noqa: E402
+from app.operation import Operation  # noqa: E402
+
+
+class DictAddCalculation:
+    """The previous layout: the same attributes stored in a per-instance __dict__."""
+
+    def __init__(self, a: float, b: float) -> None:
+        self.a = a
+        self.b = b
+        self._result = None
+        self._str = None
+
+    def execute(self) -> float:
+        return Operation.addition(self.a, self.b)
+
+
+def bytes_per_entry(calculation_class, entries: int) -> float:
+    """Builds `entries` calculations in a history list and returns the traced bytes per entry."""
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    history = [calculation_class(float(i), float(i) + 0.5) for i in range(entries)]
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del history
+    return used / entries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--entries', type=int, default=200_000, help='history entries to allocate')
+    args = parser.parse_args()
+
+    before = bytes_per_entry(DictAddCalculation, args.entries)
+    after = bytes_per_entry(AddCalculation, args.entries)
+    print(f"History entries:          {args.entries}")
+    print(f"Before (__dict__) bytes:  {before:8.1f} per entry")
+    print(f"After (__slots__) bytes:  {after:8.1f} per entry")
+    print(f"Saved:                    {before - after:8.1f} per entry ({1 - after / before:.0%})")
+
+
+if __name__ == '__main__':
+    main()
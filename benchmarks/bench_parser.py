@@ -0,0 +1,116 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Line Parser Benchmark
+Measures calculation lines parsed per second
+"""
+
+# benchmarks/bench_parser.py
+
+"""
+Measures the parsers in app.parser against the approach the REPL used before them:
+`line.split()` unpacked into three names, two `float()` calls and a caught ValueError.
+
+- `parse_lines` (stream mode) must produce the same columns (opcodes, operands and one
+  error slot per line) at least as fast, so it keeps that loop.
+- `parse_line` (REPL and server mode) also reports the column of every error without
+  raising. It is bound by the regular expression engine, so it is measured on its own.
+
+The input mixes well-formed lines with a share of malformed ones, since raising and
+catching an exception is what makes bad lines expensive for the split()/float() approach.
+
+Run from the repository root:
+
+    python benchmarks/bench_parser.py --lines 500000 --invalid 0.05
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.calculation import CalculationFactory  # noqa: E402
+from app.parser import INVALID_FORMAT, parse_line, parse_lines  # noqa: E402
+
+OPERATIONS = ['add', 'subtract', 'multiply', 'divide', 'power', 'modulus']
+INVALID_LINES = ['add ten five', 'add 5', 'divide 1 2 3', 'power 2 x']
+
+
+def split_float_columns(lines):
+    """The previous approach: split, unpack, float() and catch ValueError for bad lines."""
+    opcodes, a_values, b_values, slots = [], [], [], []
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            operation, num1_str, num2_str = line.split()
+            num1, num2 = float(num1_str), float(num2_str)
+        except ValueError:
+            slots.append(INVALID_FORMAT)
+            continue
+        opcode = CalculationFactory.lookup_opcode(operation)
+        if opcode is None:
+            slots.append(f"Unsupported calculation type: '{operation}'.")
+            continue
+        opcodes.append(opcode)
+        a_values.append(num1)
+        b_values.append(num2)
+        slots.append(None)
+    return opcodes, a_values, b_values, slots
+
+
+def make_lines(count: int, invalid: float) -> list:
+    """Builds `count` lines, about `invalid` of them malformed."""
+    rng = random.Random(0)
+    lines = []
+    for _ in range(count):
+        if rng.random() < invalid:
+            lines.append(rng.choice(INVALID_LINES))
+        else:
+            lines.append(f"{rng.choice(OPERATIONS)} {rng.uniform(-1e3, 1e3):.6g} {rng.uniform(1, 10):.4g}")
+    return lines
+
+
+def lines_per_second(functions, lines, repeat: int) -> list:
+    """
+    Returns the best lines-per-second rate of each function over `repeat` rounds. The
+    functions take turns within each round so background load affects them alike.
+    """
+    best = [float('inf')] * len(functions)
+    for _ in range(repeat):
+        for index, function in enumerate(functions):
+            started = time.perf_counter()
+            function(lines)
+            best[index] = min(best[index], time.perf_counter() - started)
+    return [len(lines) / elapsed for elapsed in best]
+
+
+def parse_each_line(lines) -> list:
+    """Parses every line on its own, with error positions."""
+    return [parse_line(line) for line in lines]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--lines', type=int, default=500_000, help='lines to parse')
+    parser.add_argument('--invalid', type=float, default=0.05, help='share of malformed lines')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per approach (best is reported)')
+    args = parser.parse_args()
+
+    lines = make_lines(args.lines, args.invalid)
+    assert split_float_columns(lines) == parse_lines(lines)
+
+    before, after, per_line = lines_per_second(
+        [split_float_columns, parse_lines, parse_each_line], lines, args.repeat
+    )
+    print(f"Lines:                       {args.lines} ({args.invalid:.0%} malformed)")
+    print(f"split()/float() columns:     {before:12,.0f} lines/s")
+    print(f"parse_lines columns:         {after:12,.0f} lines/s ({after / before:.2f}x)")
+    print(f"parse_line (with positions): {per_line:12,.0f} lines/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Calculation Server Benchmark
+Measures request latency and throughput of the calculation server
+"""
+
+# benchmarks/bench_server.py
+
+"""
+Starts `python main.py serve` in a subprocess and connects many concurrent clients to
+it. Every client sends its requests in one of three ways and the latency of every
+request is recorded:
+
+- `--mode single`: one request at a time, waiting for each response.
+- `--mode pipeline`: `--depth` requests written at once, then their responses read.
+- `--mode batch`: `--depth` requests sent as one batch frame.
+- `--mode binary`: `--depth` requests sent as one frame of the binary protocol.
+
+`--batch-window MS` starts the server with its micro-batching scheduler (see
+app/scheduler), so the requests of all clients are calculated together.
+
+For comparison, a few requests are also answered the previous way: one new
+`python main.py --stream` process per client.
+
+Run from the repository root:
+
+    python benchmarks/bench_server.py --clients 1000 --requests 20
+    python benchmarks/bench_server.py --clients 10 --requests 10000 --mode pipeline --depth 1000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OPERATIONS = ['add', 'subtract', 'multiply', 'divide', 'power', 'modulus']
+
+sys.path.insert(0, ROOT)
+from app.calculation import CalculationFactory  # noqa: E402
+from app.server import BINARY_MAGIC, FRAME_HEADER, pack_request  # noqa: E402
+
+
+async def client(port: int, requests: int, seed: int, latencies: list, mode: str, depth: int) -> None:
+    """Sends `requests` calculation lines in windows of `depth` and records each request's round trip."""
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    window = 1 if mode == 'single' else depth
+    if mode == 'binary':
+        writer.write(BINARY_MAGIC)
+    for first in range(0, requests, window):
+        size = min(window, requests - first)
+        rows = [(rng.choice(OPERATIONS), rng.randint(1, 99), rng.randint(1, 9)) for _ in range(size)]
+        if mode == 'binary':
+            frame = pack_request([CalculationFactory.opcode(name) for name, _, _ in rows],
+                                 [a for _, a, _ in rows], [b for _, _, b in rows])
+            started = time.perf_counter()
+            writer.write(frame)
+            await reader.readexactly(FRAME_HEADER.size + 9 * size)
+        else:
+            lines = [f"{name} {a} {b}\n" for name, a, b in rows]
+            if mode == 'batch':
+                lines.insert(0, f"batch {size}\n")
+            started = time.perf_counter()
+            writer.write(''.join(lines).encode())
+            for _ in lines:
+                await reader.readline()
+        latencies.extend([time.perf_counter() - started] * size)
+    if mode != 'binary':
+        writer.write(b"exit\n")
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run_clients(port: int, clients: int, requests: int, mode: str, depth: int) -> tuple:
+    """Runs every client concurrently; returns the latencies and the elapsed time."""
+    latencies: list = []
+    started = time.perf_counter()
+    await asyncio.gather(*(client(port, requests, seed, latencies, mode, depth) for seed in range(clients)))
+    return latencies, time.perf_counter() - started
+
+
+def process_per_client(count: int) -> float:
+    """Returns the mean seconds to answer one request with a new calculator process."""
+    started = time.perf_counter()
+    for _ in range(count):
+        subprocess.run([sys.executable, 'main.py', '--stream', '--hot-file', ''], input=b"add 1 2\n",
+                       cwd=ROOT, capture_output=True, check=True)
+    return (time.perf_counter() - started) / count
+
+
+def percentile(values: list, fraction: float) -> float:
+    """Returns the value below which `fraction` of the sorted values fall."""
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--clients', type=int, default=1000, help='concurrent connections')
+    parser.add_argument('--requests', type=int, default=20, help='requests per connection')
+    parser.add_argument('--mode', choices=['single', 'pipeline', 'batch', 'binary'], default='single',
+                        help='how each client sends its requests')
+    parser.add_argument('--depth', type=int, default=100, help='requests per pipeline window, batch frame or binary frame')
+    parser.add_argument('--batch-window', metavar='MS', help='server batching window in milliseconds (default: off)')
+    parser.add_argument('--processes', type=int, default=10, help='process-per-client requests for comparison')
+    args = parser.parse_args()
+
+    command = [sys.executable, 'main.py', '--hot-file', '', 'serve', '--port', '0']
+    if args.batch_window is not None:
+        command += ['--batch-window', args.batch_window]
+    server = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.PIPE, text=True)
+    try:
+        port = int(server.stdout.readline().rsplit(':', 1)[1])
+        latencies, elapsed = asyncio.run(run_clients(port, args.clients, args.requests, args.mode, args.depth))
+    finally:
+        server.terminate()
+        server.wait()
+    latencies.sort()
+    spawn = process_per_client(args.processes)
+
+    print(f"Clients:            {args.clients} x {args.requests} requests ({args.mode})")
+    print(f"Throughput:         {len(latencies) / elapsed:12,.0f} requests/s")
+    print(f"Latency p50:        {percentile(latencies, 0.50) * 1e3:12.3f} ms")
+    print(f"Latency p99:        {percentile(latencies, 0.99) * 1e3:12.3f} ms")
+    print(f"Process per client: {spawn * 1e3:12.3f} ms per request")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,19 +1,193 @@
-# This line is importing the "calculator" function from another file.
-# Imagine that "calculator" is like a tool or recipe that we've already written somewhere else,
-# and now we are telling the computer, "Go and find that calculator tool for us."
-# The "app" part is like a folder, and inside that folder, there's another file called "calculator.py",
-# which has the tool (function) called "calculator" that we need.
+# This file is the entry point of the calculator application.
+#
+# It decides how the calculator should run:
+# - When a person is typing at a terminal, it starts the interactive REPL ("calculator").
+# - When input is piped in (for example `cat jobs.txt | python main.py`), it switches to
+#   stream mode, which prints one result per line with no prompts or banners.
+# The "--stream" and "--interactive" flags force one mode or the other.
+#
+# The "batch" subcommand calculates every row of a CSV/TSV file and writes the results
+# to another file:  python main.py batch jobs.csv -o results.csv --jobs 8
+# Binary request files (see app/binary) are recognised by their header and processed
+# through a memory map instead.
+#
+# The "lines" subcommand calculates a large file of "<operation> <num1> <num2>" lines
+# with several processes, each reading its own part of the file:
+#   python main.py lines jobs.txt -o results.txt --jobs 8
+#
+# The "archive" subcommand exports the persistent REPL history (see --history-db) to a
+# compressed columnar file (see app/archive):  python main.py archive history.calcarc
+#
+# The "serve" subcommand answers "<operation> <num1> <num2>" lines for many clients at
+# once over TCP or a Unix socket (see app/server):  python main.py serve --port 8765
+# With --batch-window, the requests of all clients are calculated together in batches
+# (see app/scheduler):  python main.py serve --batch-window 1 --batch-items 4096
+import argparse
+import asyncio
+import csv
+import os
+import sys
+
+from app.archive import CODECS, DEFAULT_BLOCK_ROWS, export_history
+from app.batch import process_file
+from app.binary import is_binary_file, process_binary_file
+from app.calculation import CalculationFactory
 from app.calculator import calculator
+from app.history import DEFAULT_HISTORY_CAPACITY
+from app.hotset import restore_hot_set, save_hot_set
+from app.scheduler import DEFAULT_BATCH_ITEMS
+from app.server import (DEFAULT_ADMISSION_TIMEOUT, DEFAULT_CLIENT_LIMIT, DEFAULT_HOST, DEFAULT_MAX_CONNECTIONS,
+                        DEFAULT_PORT, DEFAULT_QUEUE_LIMIT, DEFAULT_SESSION_HISTORY, serve)
+from app.shard import process_sharded
+from app.store import HistoryStore
+from app.stream import run_stream
+from app.wal import DEFAULT_RETAIN
+
+# SQLite file that keeps the REPL's calculations across sessions.
+DEFAULT_HISTORY_DB = os.path.join(os.path.expanduser('~'), '.calculator_history.db')
+
+
+def positive_int(text: str) -> int:
+    """argparse type for options that must be a positive integer."""
+    value = int(text)
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, not {value}")
+    return value
+
+
+def non_negative_float(text: str) -> float:
+    """argparse type for options that must be zero or a positive number."""
+    value = float(text)
+    if not value >= 0:
+        raise argparse.ArgumentTypeError(f"must be zero or a positive number, not {value}")
+    return value
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the command-line argument parser."""
+    parser = argparse.ArgumentParser(description="Professional calculator.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--stream', action='store_true',
+                      help="read '<operation> <num1> <num2>' lines from stdin and print one result per line")
+    mode.add_argument('--interactive', action='store_true',
+                      help="start the interactive REPL even when stdin is not a terminal")
+    parser.add_argument('--history-size', type=positive_int, default=DEFAULT_HISTORY_CAPACITY,
+                        help="calculations kept in memory by the REPL; older ones move to disk "
+                             f"(default: {DEFAULT_HISTORY_CAPACITY})")
+    parser.add_argument('--history-db', default=DEFAULT_HISTORY_DB, metavar='PATH',
+                        help="SQLite file that keeps REPL calculations across sessions; "
+                             "an empty string disables it (default: ~/.calculator_history.db)")
+    parser.add_argument('--hot-file', metavar='PATH',
+                        help="count calculations and save the most frequent to this file on exit; they are "
+                             "cached at start-up when --cache-size is given (default: off)")
+    parser.add_argument('--cache-size', type=positive_int, metavar='N',
+                        help="cache the results of the N most recently used calculations (default: off)")
+    parser.add_argument('--wal', metavar='DIR',
+                        help="write-ahead log directory; every REPL calculation is logged and "
+                             "the history is rebuilt from it at start-up, so it survives a crash")
+    parser.add_argument('--wal-retain', type=positive_int, default=DEFAULT_RETAIN, metavar='N',
+                        help=f"newest calculations the write-ahead log keeps when it compacts (default: {DEFAULT_RETAIN})")
+    subcommands = parser.add_subparsers(dest='command')
+    batch = subcommands.add_parser('batch', help="calculate every row of a CSV/TSV file")
+    batch.add_argument('input', help="file of 'operation,num1,num2' rows (.tsv files are tab-delimited) "
+                                     "or a binary request file")
+    batch.add_argument('-o', '--output', help="result file (default: <input>.results.<ext>)")
+    batch.add_argument('--delimiter', help="field delimiter (default: from the file extension)")
+    batch.add_argument('--header', action='store_true', help="skip the first row of the input")
+    batch.add_argument('-j', '--jobs', type=int, default=1, help="number of worker processes (default: 1)")
+    lines = subcommands.add_parser('lines', help="calculate every line of a large '<operation> <num1> <num2>' file")
+    lines.add_argument('input', help="file of '<operation> <num1> <num2>' lines")
+    lines.add_argument('-o', '--output', help="result file (default: <input>.results.<ext>)")
+    lines.add_argument('-j', '--jobs', type=int, help="number of worker processes (default: one per CPU)")
+    archive = subcommands.add_parser('archive', help="export the --history-db history to a compressed columnar file")
+    archive.add_argument('output', help="archive file to create")
+    archive.add_argument('--codec', choices=CODECS, default='zlib', help="compression codec (default: zlib)")
+    archive.add_argument('--block-rows', type=positive_int, default=DEFAULT_BLOCK_ROWS,
+                         help=f"rows per compressed block (default: {DEFAULT_BLOCK_ROWS})")
+    server = subcommands.add_parser('serve', help="answer calculation lines over TCP or a Unix socket")
+    server.add_argument('--host', help=f"TCP address to listen on (default: {DEFAULT_HOST})")
+    server.add_argument('--port', type=int, help=f"TCP port to listen on (default: {DEFAULT_PORT})")
+    server.add_argument('--unix', metavar='PATH',
+                        help="Unix domain socket to listen on (TCP too only if --host or --port is given)")
+    server.add_argument('--session-history', type=positive_int, default=DEFAULT_SESSION_HISTORY,
+                        help=f"calculations kept in memory per connection (default: {DEFAULT_SESSION_HISTORY})")
+    server.add_argument('--batch-window', type=non_negative_float, metavar='MS',
+                        help="calculate the requests of all clients together in batches collected for up to "
+                             "MS milliseconds (0 batches requests that arrive together; default: off)")
+    server.add_argument('--batch-items', type=positive_int, default=DEFAULT_BATCH_ITEMS,
+                        help=f"waiting calculations that run a batch before its window ends (default: {DEFAULT_BATCH_ITEMS})")
+    server.add_argument('--queue-limit', type=positive_int, default=DEFAULT_QUEUE_LIMIT,
+                        help=f"calculations in progress over all connections (default: {DEFAULT_QUEUE_LIMIT})")
+    server.add_argument('--client-limit', type=positive_int, default=DEFAULT_CLIENT_LIMIT,
+                        help=f"calculations in progress per connection (default: {DEFAULT_CLIENT_LIMIT})")
+    server.add_argument('--admission-timeout', type=non_negative_float, default=DEFAULT_ADMISSION_TIMEOUT * 1000,
+                        metavar='MS', help="wait for room in a full queue before answering requests with an "
+                                           f"overload error (default: {DEFAULT_ADMISSION_TIMEOUT * 1000:g})")
+    server.add_argument('--max-connections', type=positive_int, default=DEFAULT_MAX_CONNECTIONS,
+                        help=f"connections served at once (default: {DEFAULT_MAX_CONNECTIONS})")
+    return parser
+
+
+def main(argv=None) -> None:
+    """Parses the command line and runs the calculator in the selected mode."""
+    args = build_parser().parse_args(argv)
+    if args.cache_size:
+        CalculationFactory.configure_cache(args.cache_size)
+    if args.hot_file:
+        CalculationFactory.configure_tracker()
+    if args.command == 'batch':
+        try:
+            if is_binary_file(args.input):
+                summary = process_binary_file(args.input, args.output)
+            else:
+                summary = process_file(args.input, args.output, args.delimiter, args.header, jobs=args.jobs)
+        except (OSError, ValueError, csv.Error) as error:
+            sys.exit(f"Cannot process batch file: {error}")
+        print(f"Processed {summary.rows} rows ({summary.errors} errors). Results written to {summary.output_path}")
+        return
+    if args.command == 'lines':
+        try:
+            summary = process_sharded(args.input, args.output, args.jobs)
+        except (OSError, ValueError) as error:
+            sys.exit(f"Cannot process lines file: {error}")
+        print(f"Processed {summary.rows} lines ({summary.errors} errors). Results written to {summary.output_path}")
+        return
+    if args.command == 'archive':
+        try:
+            with HistoryStore(args.history_db) as store:
+                rows = export_history(store, args.output, args.block_rows, args.codec)
+        except ValueError as error:
+            sys.exit(f"Cannot write archive: {error}")
+        print(f"Archived {rows} calculations to {args.output}")
+        return
+    if args.command == 'serve':
+        if args.client_limit > args.queue_limit:
+            sys.exit("--client-limit cannot be larger than --queue-limit.")
+        if args.hot_file:
+            try:
+                restore_hot_set(args.hot_file)
+            except (OSError, ValueError) as error:
+                print(f"Could not load the hot calculation set: {error}")
+        try:
+            batch_window = args.batch_window / 1000 if args.batch_window is not None else None
+            asyncio.run(serve(args.host, args.port, args.unix, args.session_history, batch_window, args.batch_items,
+                              args.queue_limit, args.client_limit, args.admission_timeout / 1000,
+                              args.max_connections))
+        finally:
+            if args.hot_file:
+                try:
+                    save_hot_set(args.hot_file)
+                except OSError as error:
+                    print(f"Could not save the hot calculation set: {error}")
+        return
+    # Stream mode turns on automatically when stdin is a pipe or a file, not a person.
+    if args.stream or (not args.interactive and not sys.stdin.isatty()):
+        run_stream()
+    else:
+        calculator(args.history_size, args.history_db, args.wal, args.hot_file, args.wal_retain)
 
-# This part of the code is super important! It checks if this file is being run directly by the computer.
-# Let me explain: when we write Python programs, sometimes we want to run them directly,
-# and other times we just want to use parts of the program inside other programs.
-# The "__name__" is a special word in Python. It tells us if we are running the program directly.
-# "__main__" is what Python calls this program when we run it directly.
 
-# So, what this line means is: "If you're running this program directly (not as part of another program), 
-# then go ahead and start the calculator."
+# This part checks if this file is being run directly (not imported by another program).
+# If it is, we start the calculator in whichever mode the command line asks for.
 if __name__ == "__main__":
-    # Now, we use the calculator tool we got earlier. This will start the calculator, which is a program 
-    # that keeps running and doing math based on what we tell it.
-    calculator()
+    main()
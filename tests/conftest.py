@@ -17,4 +17,14 @@ def ensure_calculations_registered():
     """Automatically ensure all calculations are registered before each test."""
     # This fixture runs automatically before each test
     # The import here ensures the PowerCalculation and ModulusCalculation decorators execute
-    pass
\ No newline at end of file
+    pass
+
+
+@pytest.fixture(autouse=True)
+def fresh_result_cache():
+    """Start every test with the result cache and the tracker disabled, as they are by default."""
+    CalculationFactory.configure_cache(0)
+    CalculationFactory.configure_tracker(0)
+    yield
+    CalculationFactory.configure_cache(0)
+    CalculationFactory.configure_tracker(0)
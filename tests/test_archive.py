@@ -0,0 +1,284 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Columnar History Archive Unit Tests
+Tests block compression, min/max block skipping and lazy row access
+"""
+
+# tests/test_archive.py
+
+"""
+Unit tests for the app.archive module using pytest.
+
+Every row written must come back unchanged, and a query must return exactly the rows a
+full scan would, whichever blocks it skips on the way.
+"""
+
+import math
+
+import pytest
+
+from app import archive
+from app.archive import ArchiveReader, ArchiveWriter, export_history, write_archive
+from app.calculation import (AddCalculation, CalculationFactory, DivideCalculation, ModulusCalculation,
+                             PowerCalculation)
+from app.store import HistoryStore
+
+
+def make_rows(count):
+    """Builds `count` (calculation, created) pairs cycling through three operations."""
+    classes = [AddCalculation, DivideCalculation, PowerCalculation]
+    return [(classes[i % 3](float(i), float(i % 4)), 1000.0 + i) for i in range(count)]
+
+
+@pytest.fixture
+def archived(tmp_path):
+    """An archive of 50 rows in blocks of 8, and the rows written to it."""
+    rows = make_rows(50)
+    path = str(tmp_path / "history.calcarc")
+    write_archive(path, rows, block_rows=8)
+    with ArchiveReader(path) as reader:
+        yield reader, rows
+
+
+def test_archive_round_trip(archived):
+    """
+    Test that every row is read back with its operands, result and time.
+
+    AAA Pattern:
+    - Arrange: Write 50 rows in blocks of 8.
+    - Act: Read every row back.
+    - Assert: Verify the block count and every column of every row.
+    """
+    # Arrange
+    reader, rows = archived
+
+    # Act
+    read = list(reader)
+
+    # Assert
+    assert len(reader) == 50
+    assert len(reader.blocks) == 7
+    for row, (calculation, created) in zip(read, rows):
+        rebuilt = row.calculation()
+        assert (type(rebuilt), rebuilt.a, rebuilt.b) == (type(calculation), calculation.a, calculation.b)
+        assert row.created == created
+        expected = calculation.try_execute().value
+        assert row.result == expected or (math.isnan(row.result) and math.isnan(expected))
+
+
+def test_archive_random_access(archived):
+    """
+    Test that indexing rebuilds the Calculation of one row, counting negatives from the end.
+    """
+    # Arrange
+    reader, rows = archived
+
+    # Act
+    middle = reader[20]
+    last = reader.row(-1)
+
+    # Assert
+    assert str(middle) == str(rows[20][0])
+    assert last.index == 49 and last.a == 49.0
+    with pytest.raises(IndexError):
+        reader.row(50)
+
+
+def test_archive_query_skips_blocks(archived, monkeypatch):
+    """
+    Test that a range query decodes only the blocks whose statistics can match.
+    """
+    # Arrange
+    reader, rows = archived
+    decoded = set()
+    original = reader._column
+    monkeypatch.setattr(reader, '_column', lambda block, column: decoded.add(block) or original(block, column))
+
+    # Act
+    matches = list(reader.query(created=(1017.0, 1022.0)))
+
+    # Assert
+    assert [row.index for row in matches] == list(range(17, 23))
+    assert decoded == {2}
+
+
+@pytest.mark.parametrize("filters", [
+    {'operation': 'divide'},
+    {'operation': 'Power', 'a': (10.0, None)},
+    {'a': (None, 5.0), 'b': (1.0, 2.0)},
+    {'result': (0.0, 10.0)},
+    {'operation': 'modulus'},
+])
+def test_archive_query_matches_full_scan(archived, filters):
+    """
+    Test that filtered queries return the same rows as filtering a full scan.
+    """
+    # Arrange
+    reader, _ = archived
+    names = {AddCalculation: 'add', DivideCalculation: 'divide', PowerCalculation: 'power'}
+
+    def keep(row):
+        if 'operation' in filters and names[type(row.calculation())] != filters['operation'].lower():
+            return False
+        for field in ('a', 'b', 'result'):
+            low, high = filters.get(field, (None, None))
+            value = getattr(row, field)
+            if (low is not None or high is not None) and math.isnan(value):
+                return False
+            if (low is not None and value < low) or (high is not None and value > high):
+                return False
+        return True
+
+    # Act
+    matches = list(reader.query(**filters))
+
+    # Assert
+    assert [row.index for row in matches] == [row.index for row in reader if keep(row)]
+
+
+def test_archive_indexes_every_one_byte_opcode(tmp_path, monkeypatch):
+    """
+    Test that blocks of calculation types registered past opcode 63 are written, and
+    found or skipped by their opcode mask like any other.
+
+    AAA Pattern:
+    - Arrange: Register calculation types up to opcode 255 and archive rows of the last
+      one, of 'add', and of both together, one block each.
+    - Act: Query by the last type, and by a range that only the mixed block's statistics
+      overlap.
+    - Assert: Verify each block's mask and that only matching rows come back.
+    """
+    # Arrange
+    monkeypatch.setattr(CalculationFactory, '_calculations', dict(CalculationFactory._calculations))
+    monkeypatch.setattr(CalculationFactory, '_opcodes', dict(CalculationFactory._opcodes))
+    monkeypatch.setattr(CalculationFactory, '_opcode_classes', list(CalculationFactory._opcode_classes))
+    for index in range(CalculationFactory.registered_count(), 256):
+        CalculationFactory.register_calculation(f'extra{index}')(type(f'Extra{index}', (AddCalculation,), {}))
+    path = str(tmp_path / "history.calcarc")
+    with ArchiveWriter(path, block_rows=2) as writer:
+        for opcode, a in ((255, 1.0), (255, 2.0), (0, 3.0), (0, 4.0), (255, 1.0), (0, 9.0)):
+            writer.append_row(opcode, a, 1.0, a + 1.0, 1.0)
+
+    # Act
+    with ArchiveReader(path) as reader:
+        masks = [block.opcode_mask for block in reader.blocks]
+        extra = list(reader.query(operation='extra255'))
+        between = list(reader.query(a=(5.0, 8.0)))
+
+    # Assert
+    assert masks == [1 << 255, 1, 1 << 255 | 1]
+    assert [(row.index, row.opcode) for row in extra] == [(0, 255), (1, 255), (4, 255)]
+    assert between == []
+
+
+def test_archive_nan_only_block_never_matches(tmp_path):
+    """
+    Test that a block whose result column is all NaN is skipped by result ranges.
+    """
+    # Arrange
+    path = str(tmp_path / "errors.calcarc")
+    write_archive(path, [(ModulusCalculation(1.0, 0.0), 1.0), (DivideCalculation(1.0, 0.0), 2.0)])
+
+    # Act
+    with ArchiveReader(path) as reader:
+        matches = list(reader.query(result=(None, None)))
+        everything = list(reader.query())
+
+    # Assert
+    assert matches == []
+    assert len(everything) == 2 and math.isnan(everything[0].result)
+
+
+def test_archive_compresses_timestamps(tmp_path):
+    """
+    Test that a column of evenly spaced timestamps is stored byte-shuffled and tiny.
+    """
+    # Arrange
+    path = str(tmp_path / "history.calcarc")
+
+    # Act
+    with ArchiveWriter(path, block_rows=4096) as writer:
+        for i in range(4096):
+            writer.append(AddCalculation(float(i % 7), 1.0), 1.75e9 + i * 0.5)
+    with ArchiveReader(path) as reader:
+        block = reader.blocks[0]
+
+    # Assert
+    assert block.shuffled >> 4 & 1
+    assert block.columns[4][1] < 4096 * 8 / 20
+
+
+def test_archive_writer_defaults_and_errors(tmp_path):
+    """
+    Test the current-time default, closing twice and the codec checks.
+    """
+    # Arrange
+    path = str(tmp_path / "history.calcarc")
+
+    # Act
+    writer = ArchiveWriter(path)
+    writer.append(AddCalculation(1.0, 2.0))
+    writer.close()
+    writer.close()
+
+    # Assert
+    with ArchiveReader(path) as reader:
+        assert reader.row(0).created > 0
+    with pytest.raises(ValueError, match="Unknown archive codec"):
+        ArchiveWriter(path, codec='lz4')
+
+
+def test_archive_zstd_requires_package(tmp_path, monkeypatch):
+    """
+    Test that zstd archives are refused clearly when the zstandard package is missing.
+    """
+    # Arrange
+    monkeypatch.setattr(archive, 'zstandard', None)
+    path = tmp_path / "history.calcarc"
+    write_archive(str(path), make_rows(3))
+    data = bytearray(path.read_bytes())
+    data[8] = 1  # The codec byte of the header.
+    path.write_bytes(bytes(data))
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="requires the 'zstandard' package"):
+        ArchiveWriter(str(tmp_path / "new.calcarc"), codec='zstd')
+    with pytest.raises(ValueError, match="requires the 'zstandard' package"):
+        ArchiveReader(str(path))
+
+
+def test_archive_reader_rejects_other_files(tmp_path):
+    """
+    Test that a file that is not an archive is refused.
+    """
+    # Arrange
+    path = tmp_path / "notes.txt"
+    path.write_text("add 1 2\n" * 10)
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="is not a calculation archive"):
+        ArchiveReader(str(path))
+
+
+def test_export_history(tmp_path):
+    """
+    Test that a persistent history store is exported oldest first.
+    """
+    # Arrange
+    store = HistoryStore(':memory:')
+    store.record(DivideCalculation(9.0, 3.0), created=20.0)
+    store.record(AddCalculation(1.0, 2.0), created=10.0)
+    path = str(tmp_path / "history.calcarc")
+
+    # Act
+    rows = export_history(store, path)
+
+    # Assert
+    assert rows == 2
+    with ArchiveReader(path) as reader:
+        assert [str(calculation) for calculation in (reader[0], reader[1])] == [
+            "AddCalculation: 1.0 Add 2.0 = 3.0",
+            "DivideCalculation: 9.0 Divide 3.0 = 3.0",
+        ]
+        assert reader.row(1).created == 20.0
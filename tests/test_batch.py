@@ -0,0 +1,251 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Batch File Processing Unit Tests
+Tests streaming CSV/TSV calculation files through the batch pipeline
+"""
+
+# tests/test_batch.py
+
+"""
+Unit tests for the app.batch module using pytest.
+
+The batch processor must keep output rows in input order, report bad rows inline,
+and stream the file chunk by chunk rather than loading it whole.
+"""
+
+from io import StringIO
+
+import pytest
+
+from app.batch import (
+    check_output_path,
+    chunk_rows,
+    default_output_path,
+    delimiter_for,
+    process_file,
+    read_rows,
+)
+
+
+def test_process_file_writes_results_in_order(tmp_path):
+    """
+    Test that every input row produces one output row, in order, with inline errors.
+
+    AAA Pattern:
+    - Arrange: Write a CSV file mixing valid and invalid rows.
+    - Act: Process the file.
+    - Assert: Verify the output rows and the summary totals.
+    """
+    # Arrange
+    source = tmp_path / "jobs.csv"
+    source.write_text("add,10,5\ndivide,1,0\nlogarithm,2,3\npower,2,10\nadd,ten,5\nmodulus,-7,3\n\nadd,1\n")
+
+    # Act
+    summary = process_file(str(source))
+
+    # Assert
+    output = (tmp_path / "jobs.results.csv").read_text().splitlines()
+    assert output == [
+        "operation,a,b,result,status",
+        "add,10,5,15.0,OK",
+        "divide,1,0,,Cannot divide by zero.",
+        "logarithm,2,3,,Unsupported calculation type: 'logarithm'.",
+        "power,2,10,1024.0,OK",
+        "add,ten,5,,Invalid input. Please follow the format: <operation> <num1> <num2>",
+        "modulus,-7,3,2.0,OK",
+        "add,1,,,Invalid input. Please follow the format: <operation> <num1> <num2>",
+    ]
+    assert summary == (7, 4, str(tmp_path / "jobs.results.csv"))
+
+
+def test_process_file_tsv_with_header(tmp_path):
+    """
+    Test tab-delimited input and output with a header row skipped.
+    """
+    # Arrange
+    source = tmp_path / "jobs.tsv"
+    source.write_text("operation\ta\tb\nmultiply\t7\t8\n")
+    target = tmp_path / "results.tsv"
+
+    # Act
+    process_file(str(source), str(target), skip_header=True)
+
+    # Assert
+    assert target.read_text().splitlines() == ["operation\ta\tb\tresult\tstatus", "multiply\t7\t8\t56.0\tOK"]
+
+
+def test_process_file_streams_in_chunks(tmp_path, monkeypatch):
+    """
+    Test that a file larger than one chunk is processed chunk by chunk, keeping order.
+    """
+    # Arrange
+    source = tmp_path / "big.csv"
+    source.write_text(''.join(f"add,{i},1\n" for i in range(250)))
+    sizes = []
+    import app.batch
+    original = app.batch.calculate_chunk
+    monkeypatch.setattr(app.batch, 'calculate_chunk', lambda rows: sizes.append(len(rows)) or original(rows))
+
+    # Act
+    summary = process_file(str(source), chunk_rows_size=100)
+
+    # Assert
+    assert sizes == [100, 100, 50]
+    assert summary.rows == 250
+    results = (tmp_path / "big.results.csv").read_text().splitlines()[1:]
+    assert [line.split(',')[3] for line in results] == [repr(float(i + 1)) for i in range(250)]
+
+
+def test_read_rows_is_lazy():
+    """
+    Test that rows are read one at a time and blank rows are skipped.
+    """
+    # Arrange
+    source = StringIO("add,1,2\n,,\nsubtract,3,1\n")
+
+    # Act
+    rows = read_rows(source)
+
+    # Assert
+    assert next(rows) == ['add', '1', '2']
+    assert list(rows) == [['subtract', '3', '1']]
+
+
+def test_chunk_rows_and_path_helpers():
+    """
+    Test chunking and the delimiter/output path helpers.
+    """
+    # Act & Assert
+    assert list(chunk_rows(iter([[1], [2], [3]]), 2)) == [[[1], [2]], [[3]]]
+    assert delimiter_for("a.TSV") == '\t'
+    assert delimiter_for("a.csv") == ','
+    assert default_output_path("jobs") == "jobs.results.csv"
+
+
+def test_process_file_missing_input(tmp_path):
+    """
+    Test that a missing input file raises FileNotFoundError.
+    """
+    # Act & Assert
+    with pytest.raises(FileNotFoundError):
+        process_file(str(tmp_path / "missing.csv"))
+    assert not (tmp_path / "missing.results.csv").exists()
+
+
+def test_process_file_refuses_to_overwrite_its_input(tmp_path):
+    """
+    Test that the output path cannot name the input file, directly or through a link.
+    """
+    # Arrange
+    source = tmp_path / "jobs.csv"
+    source.write_text("add,1,2\n")
+    link = tmp_path / "link.csv"
+    link.symlink_to(source)
+
+    # Act & Assert
+    for output in (source, tmp_path / "." / "jobs.csv", link):
+        with pytest.raises(ValueError, match="is the input file"):
+            process_file(str(source), str(output))
+    assert source.read_text() == "add,1,2\n"
+    check_output_path(str(source), str(tmp_path / "new.csv"))
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_process_file_reports_undecodable_input(tmp_path, jobs):
+    """
+    Test that an input file that is not valid text raises ValueError, serially or in workers.
+    """
+    # Arrange
+    source = tmp_path / "jobs.csv"
+    source.write_bytes(b"add,1,2\n\xff\xfe,1,2\n")
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        process_file(str(source), str(tmp_path / "out.csv"), jobs=jobs)
+
+
+# -----------------------------------------------------------------------------------
+# Test Parallel Execution
+# -----------------------------------------------------------------------------------
+
+from app.batch import AdaptiveChunkSize, _calculate_range_timed, calculate_chunks_parallel, calculate_range
+
+
+def test_process_file_parallel_matches_serial(tmp_path):
+    """
+    Test that running with several worker processes writes exactly the serial output.
+
+    AAA Pattern:
+    - Arrange: Write a file large enough to span many small chunks.
+    - Act: Process it serially and with two jobs.
+    - Assert: Verify both output files are identical.
+    """
+    # Arrange
+    source = tmp_path / "jobs.csv"
+    operations = ['add', 'subtract', 'multiply', 'divide', 'power', 'modulus']
+    source.write_text(''.join(f"{operations[i % 6]},{i},{i % 7}\n" for i in range(3000)))
+    serial = tmp_path / "serial.csv"
+    parallel = tmp_path / "parallel.csv"
+
+    # Act
+    process_file(str(source), str(serial), skip_header=True)
+    summary = process_file(str(source), str(parallel), skip_header=True, chunk_rows_size=64, jobs=2)
+
+    # Assert
+    assert summary.rows == 2999
+    assert parallel.read_text() == serial.read_text()
+
+
+def test_calculate_chunks_parallel_reorders_and_adapts(tmp_path):
+    """
+    Test that chunks come back in input order and the chunk size is tuned from measured latency.
+    """
+    # Arrange
+    source = tmp_path / "jobs.csv"
+    source.write_text(''.join(f"add,{i},1\n" for i in range(500)))
+    sizer = AdaptiveChunkSize(initial=64, target_seconds=10.0, minimum=64, maximum=128)
+
+    # Act
+    chunks = list(calculate_chunks_parallel(str(source), jobs=2, sizer=sizer))
+
+    # Assert
+    assert [row[3] for chunk in chunks for row in chunk] == [repr(float(i + 1)) for i in range(500)]
+    assert sizer.size == 128  # Fast chunks grow towards the maximum.
+
+
+def test_calculate_range_reads_only_its_bytes(tmp_path):
+    """
+    Test the worker side of a parallel run in-process: only the given byte range is calculated.
+    """
+    # Arrange
+    source = tmp_path / "jobs.tsv"
+    source.write_bytes(b"add\t1\t2\n\ndivide\t1\t0\nmultiply\t3\t4\n")
+
+    # Act
+    first = calculate_range(str(source), 0, 9, '\t')
+    rest, elapsed = _calculate_range_timed(str(source), 9, source.stat().st_size, '\t')
+
+    # Assert
+    assert first == [['add', '1', '2', '3.0', 'OK']]
+    assert [row[0] for row in rest] == ['divide', 'multiply']
+    assert rest[1][3:] == ['12.0', 'OK']
+    assert elapsed >= 0
+
+
+def test_adaptive_chunk_size_moves_towards_target():
+    """
+    Test that slow chunks shrink the size, fast chunks grow it, and the limits are respected.
+    """
+    # Arrange
+    sizer = AdaptiveChunkSize(initial=1000, target_seconds=0.1, minimum=100, maximum=10000)
+
+    # Act & Assert
+    sizer.observe(1000, 0.4)  # 4x too slow: ideal size 250
+    assert sizer.size == 625
+    sizer.observe(625, 0.001)  # far too fast: capped at the maximum
+    assert sizer.size == 10000
+    sizer.observe(10000, 1000.0)
+    assert sizer.size == 5000
+    sizer.observe(0, 1.0)  # empty chunks carry no information
+    assert sizer.size == 5000
@@ -0,0 +1,222 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Binary Batch File Unit Tests
+Tests the fixed-width binary request/result formats and mmap processing
+"""
+
+# tests/test_binary.py
+
+"""
+Unit tests for the app.binary module using pytest.
+
+Each test runs against the active batch backend (NumPy when installed, otherwise the
+stdlib kernels); the backend-specific tests switch to the stdlib path explicitly.
+"""
+
+import math
+import struct
+
+import pytest
+
+from app.binary import (
+    HEADER_SIZE,
+    REQUEST_RECORD,
+    BinaryBatchReader,
+    is_binary_file,
+    process_binary_file,
+    read_results,
+    write_requests,
+)
+from app.calculation import CalculationBatch, CalculationFactory, CalculationStatus
+from app.operation import np
+
+ADD = CalculationFactory.opcode('add')
+DIVIDE = CalculationFactory.opcode('divide')
+POWER = CalculationFactory.opcode('power')
+
+ROWS = [(ADD, 10.0, 5.0), (DIVIDE, 1.0, 0.0), (POWER, 2.0, 10.0), (200, 1.0, 1.0), (DIVIDE, -9.0, 3.0)]
+
+
+@pytest.fixture(params=['active', 'stdlib'])
+def backend(request, monkeypatch):
+    """Runs a test once with the active backend and once with the stdlib fallback."""
+    if request.param == 'stdlib':
+        monkeypatch.setattr('app.operation.np', None)
+    return request.param
+
+
+def test_write_requests_uses_fixed_width_records(tmp_path):
+    """
+    Test that each request is an opcode byte and two little-endian float64 operands after the header.
+    """
+    # Arrange
+    path = tmp_path / "jobs.bin"
+
+    # Act
+    count = write_requests(str(path), ROWS[:1])
+
+    # Assert
+    assert count == 1
+    assert path.read_bytes() == b'CALCREQ1' + struct.pack('<Bdd', ADD, 10.0, 5.0)
+    assert REQUEST_RECORD.size == 17
+    assert is_binary_file(str(path))
+
+
+def test_reader_exposes_columns(tmp_path, backend):
+    """
+    Test that the reader exposes the opcode and operand columns of a record range.
+    """
+    # Arrange
+    path = tmp_path / "jobs.bin"
+    write_requests(str(path), ROWS)
+
+    # Act
+    with BinaryBatchReader(str(path)) as reader:
+        opcodes, a_values, b_values = reader.columns(1, 3)
+        columns = (list(opcodes), list(a_values), list(b_values))
+        del opcodes, a_values, b_values
+        records = list(reader.iter_records())
+        count = len(reader)
+
+    # Assert
+    assert columns == ([DIVIDE, POWER], [1.0, 2.0], [0.0, 10.0])
+    assert records == ROWS
+    assert count == 5
+
+
+@pytest.mark.skipif(np is None, reason="NumPy is not installed")
+def test_reader_columns_are_views_into_the_mapping(tmp_path):
+    """
+    Test that with NumPy the operand columns are views into the mapped file, not copies.
+    """
+    # Arrange
+    path = tmp_path / "jobs.bin"
+    write_requests(str(path), ROWS)
+
+    # Act
+    with BinaryBatchReader(str(path)) as reader:
+        opcodes, a_values, b_values = reader.columns()
+        owns_data = a_values.flags.owndata
+        strides = a_values.strides
+        del opcodes, a_values, b_values
+
+    # Assert
+    assert not owns_data
+    assert strides == (REQUEST_RECORD.size,)
+
+
+def test_process_binary_file(tmp_path, backend):
+    """
+    Test that every request gets a status and result record, in input order.
+    """
+    # Arrange
+    source = tmp_path / "jobs.bin"
+    write_requests(str(source), ROWS)
+
+    # Act
+    summary = process_binary_file(str(source), chunk_records=2)
+
+    # Assert
+    target = tmp_path / "jobs.results.bin"
+    results = list(read_results(str(target)))
+    assert summary == (5, 2, str(target))
+    assert [status for status, _ in results] == [
+        CalculationStatus.OK,
+        CalculationStatus.DIV_BY_ZERO,
+        CalculationStatus.OK,
+        CalculationStatus.UNSUPPORTED,
+        CalculationStatus.OK,
+    ]
+    assert [results[0][1], results[2][1], results[4][1]] == [15.0, 1024.0, -3.0]
+    assert math.isnan(results[1][1])
+    assert target.stat().st_size == HEADER_SIZE + 5 * 9
+
+
+def test_process_binary_file_refuses_to_overwrite_its_input(tmp_path):
+    """
+    Test that the result file cannot replace the mapped request file.
+    """
+    # Arrange
+    source = tmp_path / "jobs.bin"
+    write_requests(str(source), ROWS)
+    before = source.read_bytes()
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="is the input file"):
+        process_binary_file(str(source), str(tmp_path / "." / "jobs.bin"))
+    assert source.read_bytes() == before
+
+
+@pytest.mark.skipif(np is None, reason="NumPy is not installed")
+def test_batch_executes_strided_views_in_place(tmp_path):
+    """
+    Test that a CalculationBatch runs on the strided record views without copying them.
+    """
+    # Arrange
+    path = tmp_path / "jobs.bin"
+    write_requests(str(path), ROWS)
+
+    # Act
+    with BinaryBatchReader(str(path)) as reader:
+        batch = CalculationBatch(*reader.columns()).execute()
+        strided = batch.a.strides == (REQUEST_RECORD.size,)
+        failed = batch.calculation(1)
+        outcomes = [batch.outcome(row) for row in range(len(batch))]
+        del batch
+
+    # Assert
+    assert strided
+    assert repr(failed) == "DivideCalculation(a=1.0, b=0.0)"
+    assert [outcome.status for outcome in outcomes] == [0, CalculationStatus.DIV_BY_ZERO, 0,
+                                                        CalculationStatus.UNSUPPORTED, 0]
+
+
+def test_process_empty_binary_file(tmp_path):
+    """
+    Test that a request file with no records produces a header-only result file.
+    """
+    # Arrange
+    source = tmp_path / "empty.bin"
+    write_requests(str(source), [])
+
+    # Act
+    summary = process_binary_file(str(source), str(tmp_path / "out.bin"))
+
+    # Assert
+    assert summary.rows == 0
+    assert list(read_results(str(tmp_path / "out.bin"))) == []
+
+
+@pytest.mark.parametrize("content, detected", [
+    (b'', False),
+    (b'NOTBINARY', False),
+    (b'CALCREQ1' + b'\x00' * 5, True),
+])
+def test_reader_rejects_other_files(tmp_path, content, detected):
+    """
+    Test that empty, foreign and truncated files are rejected by the reader, while
+    format detection only looks at the header.
+    """
+    # Arrange
+    path = tmp_path / "jobs.bin"
+    path.write_bytes(content)
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        BinaryBatchReader(str(path))
+    assert is_binary_file(str(path)) is detected
+
+
+def test_read_results_rejects_request_files(tmp_path):
+    """
+    Test that a request file is not mistaken for a result file.
+    """
+    # Arrange
+    path = tmp_path / "jobs.bin"
+    write_requests(str(path), ROWS)
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        list(read_results(str(path)))
+    assert not is_binary_file(str(tmp_path / "missing.bin"))
@@ -831,4 +831,664 @@ def test_calculation_str_parameterized(
     calc_str = str(calc)
 
     # Assert: Verify the string representation matches the expected format
-    assert calc_str == expected_str
\ No newline at end of file
+    assert calc_str == expected_str
+
+# -----------------------------------------------------------------------------------
+# Test Result Memoization
+# -----------------------------------------------------------------------------------
+
+@patch.object(Operation, 'power', return_value=8.0)
+def test_calculation_result_is_computed_once(mock_power):
+    """
+    Test that the result, str and repeated access all share a single execution.
+
+    This test verifies that a calculation is executed at most once for its lifetime,
+    no matter how often its result or string form is requested.
+    """
+    # Arrange
+    power_calc = PowerCalculation(2.0, 3.0)
+
+    # Act
+    first = power_calc.result
+    second = power_calc.result
+    rendered = [str(power_calc) for _ in range(3)]
+
+    # Assert
+    mock_power.assert_called_once_with(2.0, 3.0)
+    assert first == second == 8.0
+    assert rendered == ["PowerCalculation: 2.0 Power 3.0 = 8.0"] * 3
+
+
+def test_calculation_result_is_lazy():
+    """
+    Test that creating a calculation does not execute it.
+    """
+    # Arrange & Act
+    with patch.object(Operation, 'addition', return_value=15.0) as mock_addition:
+        add_calc = AddCalculation(10.0, 5.0)
+
+        # Assert
+        mock_addition.assert_not_called()
+        assert add_calc.result == 15.0
+
+
+def test_calculation_failed_result_is_not_cached():
+    """
+    Test that a calculation whose execution raises keeps raising instead of caching a value.
+    """
+    # Arrange
+    divide_calc = DivideCalculation(10.0, 0.0)
+
+    # Act & Assert
+    for _ in range(2):
+        with pytest.raises(ZeroDivisionError):
+            divide_calc.result
+    with pytest.raises(ZeroDivisionError):
+        str(divide_calc)
+
+
+# -----------------------------------------------------------------------------------
+# Test Slot-Based Layout
+# -----------------------------------------------------------------------------------
+
+@pytest.mark.parametrize("calc_class", [
+    AddCalculation,
+    SubtractCalculation,
+    MultiplyCalculation,
+    DivideCalculation,
+    PowerCalculation,
+    ModulusCalculation,
+])
+def test_calculation_instances_have_no_dict(calc_class):
+    """
+    Test that every registered calculation stores its state in slots, not a per-instance __dict__.
+    """
+    # Arrange
+    calc = calc_class(9.0, 3.0)
+
+    # Act & Assert
+    assert not hasattr(calc, '__dict__')
+    with pytest.raises(AttributeError):
+        calc.unexpected_attribute = 1.0
+    assert repr(calc) == f"{calc_class.__name__}(a=9.0, b=3.0)"
+
+
+# -----------------------------------------------------------------------------------
+# Test Factory Result Cache
+# -----------------------------------------------------------------------------------
+
+from app.calculation import ResultCache
+
+
+def test_factory_cache_is_off_by_default():
+    """
+    Test that the factory only caches results once a cache is configured.
+    """
+    # Act
+    first = CalculationFactory.create_calculation('add', 1.0, 2.0)
+    second = CalculationFactory.create_calculation('add', 1.0, 2.0)
+
+    # Assert
+    assert CalculationFactory.cache_stats() is None
+    assert first is not second
+
+
+def test_factory_cache_reuses_result():
+    """
+    Test that a repeated (operation, a, b) triple returns a new calculation with the cached result.
+    """
+    # Arrange
+    CalculationFactory.configure_cache()
+    first = CalculationFactory.create_calculation('Power', 2.0, 8.0)
+
+    # Act
+    with patch.object(Operation, 'power') as mock_power:
+        second = CalculationFactory.create_calculation('power', 2.0, 8.0)
+        result = second.result
+    first.a = 3.0
+
+    # Assert
+    assert second is not first
+    assert result == 256.0
+    assert str(second) == "PowerCalculation: 2.0 Power 8.0 = 256.0"
+    mock_power.assert_not_called()
+    assert CalculationFactory.cache_stats()[:4] == (1, 1, 0, 1)
+
+
+def test_factory_cache_skips_failed_calculations():
+    """
+    Test that failing calculations are not cached and still raise when executed.
+    """
+    # Arrange
+    CalculationFactory.configure_cache()
+
+    # Act
+    calculations = [CalculationFactory.create_calculation('divide', 1.0, 0.0) for _ in range(2)]
+
+    # Assert
+    for calculation in calculations:
+        with pytest.raises(ZeroDivisionError):
+            calculation.result
+    assert CalculationFactory.cache_stats()[:4] == (0, 2, 0, 0)
+
+
+def test_factory_cache_distinguishes_signed_zero_and_matches_nan():
+    """
+    Test that -0.0 and 0.0 get separate entries while every NaN shares one entry.
+    """
+    # Arrange
+    CalculationFactory.configure_cache()
+
+    # Act
+    positive = CalculationFactory.create_calculation('power', 0.0, 3.0)
+    negative = CalculationFactory.create_calculation('power', -0.0, 3.0)
+    CalculationFactory.create_calculation('add', float('nan'), 1.0)
+    nan_second = CalculationFactory.create_calculation('add', -float('nan'), 1.0)
+    CalculationFactory.create_calculation('add', 1.0, float('nan'))
+    CalculationFactory.create_calculation('add', 1.0, -float('nan'))
+
+    # Assert
+    assert str(positive) == "PowerCalculation: 0.0 Power 3.0 = 0.0"
+    assert str(negative) == "PowerCalculation: -0.0 Power 3.0 = -0.0"
+    assert nan_second.result != nan_second.result
+    assert CalculationFactory.cache_stats()[:4] == (2, 4, 0, 4)
+
+
+def test_factory_cache_skips_non_float_operands():
+    """
+    Test that integer operands bypass the cache so 10 and 10.0 never share an entry.
+    """
+    # Arrange
+    CalculationFactory.configure_cache()
+
+    # Act
+    from_int = CalculationFactory.create_calculation('add', 10, 5)
+    from_float = CalculationFactory.create_calculation('add', 10.0, 5.0)
+
+    # Assert
+    assert str(from_int) == "AddCalculation: 10 Add 5 = 15"
+    assert str(from_float) == "AddCalculation: 10.0 Add 5.0 = 15.0"
+    assert CalculationFactory.cache_stats().misses == 1
+
+
+def test_factory_cache_can_be_disabled():
+    """
+    Test that configuring a zero-size cache disables an enabled cache again.
+    """
+    # Arrange
+    CalculationFactory.configure_cache()
+    CalculationFactory.configure_cache(0)
+
+    # Act
+    first = CalculationFactory.create_calculation('add', 1.0, 2.0)
+    second = CalculationFactory.create_calculation('add', 1.0, 2.0)
+
+    # Assert
+    assert first is not second
+    assert CalculationFactory.cache_stats() is None
+
+
+def test_result_cache_evicts_least_recently_used():
+    """
+    Test LRU eviction order and the eviction counter.
+    """
+    # Arrange
+    cache = ResultCache(maxsize=2)
+    key_a = cache.make_key('add', 1.0, 1.0)
+    key_b = cache.make_key('add', 2.0, 2.0)
+    key_c = cache.make_key('add', 3.0, 3.0)
+    cache.put(key_a, 2.0)
+    cache.put(key_b, 4.0)
+
+    # Act
+    cache.get(key_a)  # key_b becomes the least recently used entry
+    cache.put(key_c, 6.0)
+
+    # Assert
+    assert cache.get(key_b) is None
+    assert cache.get(key_a) == 2.0
+    assert len(cache) == 2
+    assert cache.stats() == (2, 1, 1, 2, 2)
+    cache.clear()
+    assert cache.stats() == (0, 0, 0, 0, 2)
+
+
+def test_result_cache_rejects_non_positive_size():
+    """
+    Test that a cache must hold at least one entry.
+    """
+    # Act & Assert
+    with pytest.raises(ValueError):
+        ResultCache(maxsize=0)
+
+
+# -----------------------------------------------------------------------------------
+# Test Heavy-Hitter Tracking and Cache Pre-Warming
+# -----------------------------------------------------------------------------------
+
+import random
+from collections import Counter
+
+from app.calculation import HeavyHitter, HeavyHitterTracker
+
+
+def test_tracker_space_saving_guarantees():
+    """
+    Test that counts bound the true frequencies and every frequent triple is kept.
+
+    AAA Pattern:
+    - Arrange: Build a skewed stream of 20,000 requests over many distinct triples.
+    - Act: Count it with a tracker of 16 counters.
+    - Assert: Verify count - error <= true count <= count, and that every triple
+      requested more than total / capacity times is tracked.
+    """
+    # Arrange
+    rng = random.Random(7)
+    stream = [float(min(int(rng.paretovariate(1.1)), 500)) for _ in range(20_000)]
+    tracker = HeavyHitterTracker(capacity=16)
+    truth = Counter(stream)
+
+    # Act
+    for a in stream:
+        tracker.add(ResultCache.make_key('add', a, 1.0), 'add', a, 1.0)
+
+    # Assert
+    top = tracker.top()
+    assert len(tracker) == 16 and tracker.total == 20_000
+    for hitter in top:
+        assert hitter.count - hitter.error <= truth[hitter.a] <= hitter.count
+    tracked = {hitter.a for hitter in top}
+    assert all(a in tracked for a, count in truth.items() if count > 20_000 / 16)
+    assert top[0].a == 1.0
+
+
+def test_tracker_weighted_counts_and_clear():
+    """
+    Test adding several requests at once, ranking and clearing.
+    """
+    # Arrange
+    tracker = HeavyHitterTracker(capacity=2)
+    keys = [ResultCache.make_key('add', float(i), 0.0) for i in range(3)]
+
+    # Act
+    tracker.add(keys[0], 'add', 0.0, 0.0, count=5)
+    tracker.add(keys[1], 'add', 1.0, 0.0, count=3)
+    tracker.add(keys[1], 'add', 1.0, 0.0, count=4)
+    tracker.add(keys[2], 'add', 2.0, 0.0)
+
+    # Assert
+    assert tracker.top() == [HeavyHitter('add', 1.0, 0.0, 7, 0), HeavyHitter('add', 2.0, 0.0, 6, 5)]
+    assert tracker.top(1) == [HeavyHitter('add', 1.0, 0.0, 7, 0)]
+    tracker.clear()
+    assert len(tracker) == 0 and tracker.top() == [] and tracker.total == 0
+    with pytest.raises(ValueError):
+        HeavyHitterTracker(capacity=0)
+
+
+def test_factory_tracks_requests():
+    """
+    Test that the factory counts float requests, with or without a result cache.
+    """
+    # Arrange
+    CalculationFactory.configure_tracker()
+
+    # Act
+    for _ in range(3):
+        CalculationFactory.create_calculation('Divide', 1.0, 3.0)
+    CalculationFactory.create_calculation('add', 1.0, 2.0)
+    CalculationFactory.create_calculation('add', 1, 2)
+
+    # Assert
+    assert CalculationFactory.tracker().top() == [
+        HeavyHitter('divide', 1.0, 3.0, 3, 0),
+        HeavyHitter('add', 1.0, 2.0, 1, 0),
+    ]
+
+
+def test_factory_tracker_can_be_disabled():
+    """
+    Test that tracking is off by default, and that a zero-size tracker disables it.
+    """
+    # Arrange
+    assert CalculationFactory.tracker() is None
+    CalculationFactory.configure_tracker()
+    CalculationFactory.configure_tracker(0)
+
+    # Act
+    calculation = CalculationFactory.create_calculation('add', 1.0, 2.0)
+
+    # Assert
+    assert CalculationFactory.tracker() is None
+    assert calculation.result == 3.0
+
+
+def test_factory_prewarm_fills_cache():
+    """
+    Test that pre-warming computes results up front, skips failures and keeps the most frequent longest.
+    """
+    # Arrange
+    CalculationFactory.configure_cache(2)
+    CalculationFactory.configure_tracker()
+    hitters = [
+        HeavyHitter('power', 2.0, 10.0, 9, 0),
+        HeavyHitter('unknown', 1.0, 1.0, 8, 0),
+        HeavyHitter('divide', 1.0, 0.0, 7, 0),
+        HeavyHitter('add', 1.0, 1.0, 1, 0),
+        HeavyHitter('add', 2.0, 2.0, 1, 0),
+    ]
+
+    # Act
+    warmed = CalculationFactory.prewarm(hitters)
+    with patch.object(Operation, 'power') as mock_power:
+        power = CalculationFactory.create_calculation('power', 2.0, 10.0)
+        result = power.result
+
+    # Assert
+    assert warmed == 2
+    assert result == 1024.0
+    mock_power.assert_not_called()
+    assert CalculationFactory.cache_stats()[:4] == (1, 0, 0, 2)
+    assert CalculationFactory.tracker().top() == [HeavyHitter('power', 2.0, 10.0, 1, 0)]
+    CalculationFactory.configure_cache(0)
+    assert CalculationFactory.prewarm(hitters) == 0
+
+
+# -----------------------------------------------------------------------------------
+# Test Opcodes and CalculationBatch
+# -----------------------------------------------------------------------------------
+
+import math
+from array import array
+
+from app.calculation import CalculationBatch
+
+
+def test_factory_opcodes_follow_registration_order():
+    """
+    Test that opcodes map one-to-one onto registered calculation classes.
+    """
+    # Arrange
+    names = ['add', 'subtract', 'multiply', 'divide', 'power', 'modulus']
+
+    # Act
+    opcodes = [CalculationFactory.opcode(name) for name in names]
+
+    # Assert
+    assert opcodes == list(range(6))
+    assert CalculationFactory.calculation_class(CalculationFactory.opcode('DIVIDE')) is DivideCalculation
+    with pytest.raises(ValueError):
+        CalculationFactory.opcode('logarithm')
+
+
+def test_factory_rejects_more_than_256_calculation_types(monkeypatch):
+    """
+    Test that registration stops once every one-byte opcode is taken.
+    """
+    # Arrange
+    monkeypatch.setattr(CalculationFactory, '_calculations', dict(CalculationFactory._calculations))
+    monkeypatch.setattr(CalculationFactory, '_opcodes', dict(CalculationFactory._opcodes))
+    monkeypatch.setattr(CalculationFactory, '_opcode_classes', list(CalculationFactory._opcode_classes))
+    for index in range(CalculationFactory.registered_count(), 256):
+        CalculationFactory.register_calculation(f'extra{index}')(type(f'Extra{index}', (AddCalculation,), {}))
+
+    # Act & Assert
+    assert CalculationFactory.opcode('extra255') == 255
+    with pytest.raises(ValueError, match="At most 256 calculation types can be registered."):
+        CalculationFactory.register_calculation('extra256')(type('Extra256', (AddCalculation,), {}))
+    assert CalculationFactory.registered_count() == 256
+    assert 'extra256' not in CalculationFactory.opcode_table()
+
+
+def test_create_many_builds_columns():
+    """
+    Test that create_many stores rows as parallel columns without building Calculation objects.
+    """
+    # Arrange & Act
+    batch = CalculationFactory.create_many(['add', 'Power', 3], [1.0, 2.0, 9.0], [2.0, 3.0, 3.0])
+
+    # Assert
+    assert isinstance(batch, CalculationBatch)
+    assert len(batch) == 3
+    assert batch.opcodes.tolist() == [0, 4, 3]
+    assert batch.a.typecode == 'd' and batch.b.typecode == 'd'
+    assert all(math.isnan(value) for value in batch.results)
+
+
+@pytest.mark.parametrize("operations", [['add', 'logarithm'], ['add', 42]])
+def test_create_many_rejects_unknown_operations(operations):
+    """
+    Test that an unknown operation name or opcode is reported with its row number.
+    """
+    # Act & Assert
+    with pytest.raises(ValueError) as exc_info:
+        CalculationFactory.create_many(operations, [1.0, 2.0], [1.0, 2.0])
+    assert "Row 1" in str(exc_info.value)
+
+
+def test_calculation_batch_rejects_ragged_columns():
+    """
+    Test that all batch columns must have the same length.
+    """
+    # Act & Assert
+    with pytest.raises(ValueError):
+        CalculationFactory.create_many(['add'], [1.0, 2.0], [1.0])
+
+
+def test_calculation_batch_execute_matches_calculations():
+    """
+    Test that executing a mixed batch gives the same results as individual calculations.
+    """
+    # Arrange
+    operations = ['add', 'divide', 'modulus', 'power', 'subtract', 'multiply', 'divide', 'modulus']
+    a_values = [1.0, 10.0, -7.0, 2.0, 5.0, 3.0, 1.0, 4.0]
+    b_values = [2.0, 4.0, 3.0, 10.0, 8.0, -2.0, 0.0, 0.0]
+    batch = CalculationFactory.create_many(operations, a_values, b_values)
+
+    # Act
+    returned = batch.execute()
+
+    # Assert
+    assert returned is batch
+    expected = [CalculationFactory.create_calculation(*row).result for row in zip(operations[:6], a_values, b_values)]
+    assert batch.results.tolist()[:6] == expected
+    assert batch.status.tolist() == [0, 0, 0, 0, 0, 0, 1, 1]
+    assert math.isnan(batch.results[6]) and math.isnan(batch.results[7])
+
+
+def test_calculation_batch_single_operation_and_empty():
+    """
+    Test the single-operation fast path and that an empty batch executes without work.
+    """
+    # Arrange
+    single = CalculationFactory.create_many(['multiply'] * 3, [1.0, 2.0, 3.0], [2.0, 2.0, 2.0])
+    empty = CalculationFactory.create_many([], [], [])
+
+    # Act
+    single.execute()
+    empty.execute()
+
+    # Assert
+    assert single.results.tolist() == [2.0, 4.0, 6.0]
+    assert len(empty) == 0
+
+
+def test_calculation_batch_stdlib_backend(monkeypatch):
+    """
+    Test that batches execute with the stdlib kernels when NumPy is not available.
+    """
+    # Arrange
+    monkeypatch.setattr('app.operation.np', None)
+    batch = CalculationFactory.create_many(['add', 'divide', 'add'], [1.0, 1.0, 2.0], [1.0, 0.0, 2.0])
+    single = CalculationFactory.create_many(['subtract'] * 2, [5.0, 6.0], [1.0, 1.0])
+
+    # Act
+    batch.execute()
+    single.execute()
+
+    # Assert
+    assert batch.results[0] == 2.0 and batch.results[2] == 4.0
+    assert batch.status.tolist() == [0, 1, 0]
+    assert single.results.tolist() == [4.0, 5.0]
+
+
+def test_calculation_batch_uses_row_by_row_fallback_for_custom_calculations(monkeypatch):
+    """
+    Test that a calculation class without a vectorized kernel still runs inside a batch.
+    """
+    # Arrange
+    class HalfCalculation(Calculation):
+        __slots__ = ()
+
+        def execute(self) -> float:
+            if self.b == 0:
+                raise ZeroDivisionError("Cannot halve by zero.")
+            return self.a / (2 * self.b)
+
+    monkeypatch.setattr(CalculationFactory, '_opcode_classes', CalculationFactory._opcode_classes + [HalfCalculation])
+    batch = CalculationFactory.create_many([6, 6, 0], [8.0, 8.0, 1.0], [2.0, 0.0, 1.0])
+
+    # Act
+    batch.execute()
+
+    # Assert
+    assert batch.results[0] == 2.0 and batch.results[2] == 2.0
+    assert batch.status.tolist() == [0, 1, 0]
+    assert repr(batch.calculation(0)) == "HalfCalculation(a=8.0, b=2.0)"
+
+
+# -----------------------------------------------------------------------------------
+# Test Error-as-Value Execution
+# -----------------------------------------------------------------------------------
+
+from app.calculation import CalculationStatus, CalculationOutcome
+
+
+@pytest.mark.parametrize("calc_class, a, b, expected_status", [
+    (AddCalculation, 1.0, 2.0, CalculationStatus.OK),
+    (DivideCalculation, 1.0, 0.0, CalculationStatus.DIV_BY_ZERO),
+    (ModulusCalculation, 1.0, 0.0, CalculationStatus.DIV_BY_ZERO),
+    (PowerCalculation, 0.0, -1.0, CalculationStatus.DIV_BY_ZERO),
+    (PowerCalculation, -8.0, 0.5, CalculationStatus.DOMAIN_ERROR),
+    (PowerCalculation, 10.0, 400.0, CalculationStatus.OVERFLOW),
+    (MultiplyCalculation, 1e300, 1e300, CalculationStatus.OVERFLOW),
+    (AddCalculation, float('inf'), 1.0, CalculationStatus.OK),
+])
+def test_try_execute_reports_status(calc_class, a, b, expected_status):
+    """
+    Test that try_execute reports each failure as a status code instead of raising.
+    """
+    # Arrange
+    calc = calc_class(a, b)
+
+    # Act
+    outcome = calc.try_execute()
+
+    # Assert
+    assert isinstance(outcome, CalculationOutcome)
+    assert outcome.status == expected_status
+    if expected_status in (CalculationStatus.DIV_BY_ZERO, CalculationStatus.DOMAIN_ERROR):
+        assert math.isnan(outcome.value)
+    else:
+        assert outcome.value == a + b if calc_class is AddCalculation else math.isinf(outcome.value)
+
+
+def test_try_execute_does_not_raise_for_zero_divisor():
+    """
+    Test that the LBYL check stops a zero divisor before any exception is created.
+    """
+    # Arrange
+    divide_calc = DivideCalculation(4.0, 0.0)
+
+    # Act
+    with patch.object(Operation, 'division') as mock_division:
+        outcome = divide_calc.try_execute()
+
+    # Assert
+    mock_division.assert_not_called()
+    assert outcome.status == CalculationStatus.DIV_BY_ZERO
+
+
+@pytest.mark.parametrize("error, expected_status", [
+    (ZeroDivisionError("boom"), CalculationStatus.DIV_BY_ZERO),
+    (ValueError("boom"), CalculationStatus.DOMAIN_ERROR),
+])
+def test_try_execute_converts_unexpected_errors(error, expected_status):
+    """
+    Test that errors raised while computing are converted to a status.
+    """
+    # Arrange
+    add_calc = AddCalculation(1.0, 2.0)
+
+    # Act
+    with patch.object(Operation, 'addition', side_effect=error):
+        outcome = add_calc.try_execute()
+
+    # Assert
+    assert outcome.status == expected_status
+
+
+def test_try_execute_flags_complex_results():
+    """
+    Test that a complex result from a custom calculation is reported as a domain error.
+    """
+    # Arrange
+    with patch.object(Operation, 'addition', return_value=1j):
+        outcome = AddCalculation(1.0, 2.0).try_execute()
+
+    # Assert
+    assert outcome.status == CalculationStatus.DOMAIN_ERROR
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_calculation_batch_status_column(monkeypatch, use_numpy):
+    """
+    Test that a batch records the precise status of every failed row without raising.
+    """
+    # Arrange
+    from app.operation import np
+    if use_numpy and np is None:
+        pytest.skip("NumPy is not installed")
+    if not use_numpy:
+        monkeypatch.setattr('app.operation.np', None)
+    batch = CalculationFactory.create_many(
+        ['divide', 'power', 'power', 'multiply', 'add', 'modulus'],
+        [1.0, 0.0, -8.0, 1e300, 2.0, 5.0],
+        [0.0, -2.0, 1.0 / 3.0, 1e300, 2.0, 3.0],
+    )
+
+    # Act
+    batch.execute()
+
+    # Assert
+    assert [batch.outcome(row).status for row in range(len(batch))] == [
+        CalculationStatus.DIV_BY_ZERO,
+        CalculationStatus.DIV_BY_ZERO,
+        CalculationStatus.DOMAIN_ERROR,
+        CalculationStatus.OVERFLOW,
+        CalculationStatus.OK,
+        CalculationStatus.OK,
+    ]
+    assert batch.outcome(3).value == math.inf
+    assert batch.outcome(4) == (CalculationStatus.OK, 4.0)
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_calculation_batch_marks_unregistered_opcodes(monkeypatch, use_numpy):
+    """
+    Test that rows with an unregistered opcode are marked UNSUPPORTED without stopping the batch.
+    """
+    # Arrange
+    from app.operation import np
+    if use_numpy and np is None:
+        pytest.skip("NumPy is not installed")
+    if not use_numpy:
+        monkeypatch.setattr('app.operation.np', None)
+    batch = CalculationBatch(array('B', [0, 200, 3]), array('d', [1.0, 1.0, 1.0]), array('d', [1.0, 1.0, 0.0]))
+
+    # Act
+    batch.execute()
+
+    # Assert
+    assert batch.status.tolist() == [CalculationStatus.OK, CalculationStatus.UNSUPPORTED, CalculationStatus.DIV_BY_ZERO]
+    assert batch.results[0] == 2.0
+    assert CalculationStatus.UNSUPPORTED.message == "Unsupported calculation type."
@@ -13,11 +13,17 @@ This test module contains unit tests for the 'app/calculator.py' module.
 Each test demonstrates good testing practices using the Arrange-Act-Assert (AAA) pattern.
 """
 
+import os
+import sqlite3
+import sys
 import pytest
 from io import StringIO
 
 # Import the functions to be tested
-from app.calculator import display_help, display_history, calculator
+from app.calculator import display_help, display_history, display_cache_stats, calculator
+from app.calculator import history_lines, page_lines
+from app.calculation import CalculationFactory
+from app.store import HistoryStore
 
 def test_display_help(capsys):
     """
@@ -53,7 +59,17 @@ Usage:
 
 Special Commands:
     help      : Display this help message.
-    history   : Show the history of calculations.
+    history   : Show the history of calculations (through a pager when it is long).
+    history page N | history tail N
+              : Show page N of the history (20 entries per page) or its last N entries.
+    history [operation] [since <time>] [--last N]
+              : Search the saved history of every session, e.g. 'history divide --last 100'
+                or 'history since 2h'. <time> is an age (30m, 2h, 1d) or an ISO date-time.
+    stats     : Show count, sum, mean, variance, min and max of the results, per operation.
+    cache     : Show result cache statistics.
+    hot       : Show the most frequently requested calculations.
+    batch <file> [output]
+              : Calculate every row of a CSV/TSV file and write the results to a file.
     exit      : Exit the calculator.
 
 Examples:
@@ -182,6 +198,25 @@ def test_calculator_invalid_input(monkeypatch, capsys):
     assert "Invalid input. Please follow the format: <operation> <num1> <num2>" in captured.out
     assert "Type 'help' for more information." in captured.out
 
+
+def test_calculator_invalid_input_points_at_error(monkeypatch, capsys):
+    """
+    Test that invalid input shows the column of the problem, and that scientific
+    notation and underscores are accepted.
+    """
+    # Arrange
+    user_input = 'add 10 5x\nmultiply 1e3 1_000\nexit\n'
+    monkeypatch.setattr('sys.stdin', StringIO(user_input))
+
+    # Act
+    with pytest.raises(SystemExit):
+        calculator()
+
+    # Assert
+    captured = capsys.readouterr()
+    assert "add 10 5x\n        ^ Invalid number '5x'.\n" in captured.out
+    assert "Result: MultiplyCalculation: 1000.0 Multiply 1000.0 = 1000000.0" in captured.out
+
 def test_calculator_addition(monkeypatch, capsys):
     """
     Test the calculator's addition operation.
@@ -378,6 +413,24 @@ def test_calculator_history(monkeypatch, capsys):
     assert "1. AddCalculation: 10.0 Add 5.0 = 15.0" in captured.out
     assert "2. SubtractCalculation: 20.0 Subtract 3.0 = 17.0" in captured.out
 
+
+def test_calculator_history_beyond_capacity(monkeypatch, capsys):
+    """
+    Test that the history command still shows entries that were moved out of memory.
+    """
+    # Arrange
+    user_input = 'add 1 1\nadd 2 2\nadd 3 3\nhistory\nexit\n'
+    monkeypatch.setattr('sys.stdin', StringIO(user_input))
+
+    # Act
+    with pytest.raises(SystemExit):
+        calculator(history_capacity=1)
+
+    # Assert
+    captured = capsys.readouterr()
+    assert "1. AddCalculation: 1.0 Add 1.0 = 2.0\n" in captured.out
+    assert "3. AddCalculation: 3.0 Add 3.0 = 6.0\n" in captured.out
+
 # New Tests to Increase Coverage
 
 def test_calculator_invalid_number_input(monkeypatch, capsys):
@@ -485,6 +538,9 @@ def test_calculator_unexpected_exception(monkeypatch, capsys):
     class MockCalculation:
         def execute(self):
             raise Exception("Mock exception during execution")
+        @property
+        def result(self):
+            return self.execute()
         def __str__(self):
             return "MockCalculation"
 
@@ -502,4 +558,497 @@ def test_calculator_unexpected_exception(monkeypatch, capsys):
     # Assert
     captured = capsys.readouterr()
     assert "An error occurred during calculation: Mock exception during execution" in captured.out
-    assert "Please try again." in captured.out
\ No newline at end of file
+    assert "Please try again." in captured.out
+
+def test_calculator_executes_each_calculation_once(monkeypatch, capsys):
+    """
+    Test that displaying a result and showing the history never re-executes a calculation.
+
+    AAA Pattern:
+    - Arrange: Count calls to Operation.power and feed a power calculation followed by two 'history' commands.
+    - Act: Call the calculator function.
+    - Assert: Verify the power operation ran exactly once and the history still shows the result.
+    """
+    # Arrange
+    from app.operation import Operation
+    calls = []
+    original_power = Operation.power
+    monkeypatch.setattr(Operation, 'power', staticmethod(lambda a, b: calls.append((a, b)) or original_power(a, b)))
+    monkeypatch.setattr('sys.stdin', StringIO('power 2 10\nhistory\nhistory\nexit\n'))
+
+    # Act
+    with pytest.raises(SystemExit):
+        calculator()
+
+    # Assert
+    captured = capsys.readouterr()
+    assert calls == [(2.0, 10.0)]
+    assert captured.out.count("1. PowerCalculation: 2.0 Power 10.0 = 1024.0") == 2
+
+
+def test_calculator_cache_command(monkeypatch, capsys):
+    """
+    Test the 'cache' command after a repeated calculation.
+
+    AAA Pattern:
+    - Arrange: Enter the same calculation twice, then 'cache' and 'exit'.
+    - Act: Call the calculator function.
+    - Assert: Verify the counters show one miss and one hit.
+    """
+    # Arrange
+    CalculationFactory.configure_cache()
+    monkeypatch.setattr('sys.stdin', StringIO('add 1 2\nadd 1 2\ncache\nexit\n'))
+
+    # Act
+    with pytest.raises(SystemExit):
+        calculator()
+
+    # Assert
+    captured = capsys.readouterr()
+    assert "Result Cache:" in captured.out
+    assert "entries   : 1/" in captured.out
+    assert "hits      : 1" in captured.out
+    assert "misses    : 1" in captured.out
+    assert "hit rate  : 50.0%" in captured.out
+
+
+def test_display_cache_stats_disabled(capsys):
+    """
+    Test the cache statistics display when the result cache is disabled.
+    """
+    # Arrange
+    from app.calculation import CalculationFactory
+    CalculationFactory.configure_cache(0)
+
+    # Act
+    display_cache_stats()
+
+    # Assert
+    captured = capsys.readouterr()
+    assert captured.out.strip() == "Result cache is disabled."
+
+
+def test_calculator_batch_command(monkeypatch, capsys, tmp_path):
+    """
+    Test the 'batch <file> <output>' command.
+
+    AAA Pattern:
+    - Arrange: Write a small CSV file and enter a batch command for it.
+    - Act: Call the calculator function.
+    - Assert: Verify the summary is printed and the output file holds the results.
+    """
+    # Arrange
+    source = tmp_path / "jobs.csv"
+    source.write_text("add,1,2\ndivide,1,0\n")
+    target = tmp_path / "out.csv"
+    monkeypatch.setattr('sys.stdin', StringIO(f'batch {source} {target}\nexit\n'))
+
+    # Act
+    with pytest.raises(SystemExit):
+        calculator()
+
+    # Assert
+    captured = capsys.readouterr()
+    assert f"Processed 2 rows (1 errors). Results written to {target}" in captured.out
+    assert target.read_text().splitlines()[1] == "add,1,2,3.0,OK"
+
+
+@pytest.mark.parametrize("command, expected", [
+    ("batch", "Usage: batch <file> [output]"),
+    ("batch missing.csv", "Cannot process batch file:"),
+])
+def test_calculator_batch_command_errors(monkeypatch, capsys, tmp_path, command, expected):
+    """
+    Test the batch command's usage message and its handling of unreadable files.
+    """
+    # Arrange
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr('sys.stdin', StringIO(f'{command}\nexit\n'))
+
+    # Act
+    with pytest.raises(SystemExit):
+        calculator()
+
+    # Assert
+    assert expected in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("content, output", [
+    (b"add,1,2\n\xff\xfe,1,2\n", "out.csv"),
+    (b"add,1,2\n", "jobs.csv"),
+])
+def test_calculator_batch_command_reports_bad_files(monkeypatch, capsys, tmp_path, content, output):
+    """
+    Test that undecodable input and an output path naming the input are reported, not raised.
+    """
+    # Arrange
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "jobs.csv").write_bytes(content)
+    monkeypatch.setattr('sys.stdin', StringIO(f'batch jobs.csv {output}\nadd 1 2\nexit\n'))
+
+    # Act
+    with pytest.raises(SystemExit):
+        calculator()
+
+    # Assert
+    captured = capsys.readouterr().out
+    assert "Cannot process batch file:" in captured
+    assert "Add 2.0 = 3.0" in captured
+    assert (tmp_path / "jobs.csv").read_bytes() == content
+
+
+def test_calculator_history_query(monkeypatch, capsys, tmp_path):
+    """
+    Test that calculations are saved to the history database and found by later sessions.
+
+    AAA Pattern:
+    - Arrange: Run one session that performs three calculations.
+    - Act: Run a second session that queries the saved history.
+    - Assert: Verify each query shows the matching calculations, oldest first.
+    """
+    # Arrange
+    database = str(tmp_path / "history.db")
+    monkeypatch.setattr('sys.stdin', StringIO('divide 1 2\nadd 1 2\ndivide 9 3\nexit\n'))
+    with pytest.raises(SystemExit):
+        calculator(history_db=database)
+    capsys.readouterr()
+    queries = 'history divide\nhistory --last 1\nhistory since 1h add\nhistory since 2999-01-01\nexit\n'
+    monkeypatch.setattr('sys.stdin', StringIO(queries))
+
+    # Act
+    with pytest.raises(SystemExit):
+        calculator(history_db=database)
+
+    # Assert
+    blocks = capsys.readouterr().out.split(">> ")[1:]
+    assert "1. [" in blocks[0] and "] DivideCalculation: 1.0 Divide 2.0 = 0.5\n" in blocks[0]
+    assert "2. [" in blocks[0] and "] DivideCalculation: 9.0 Divide 3.0 = 3.0\n" in blocks[0]
+    assert "AddCalculation" not in blocks[0]
+    assert "DivideCalculation: 9.0 Divide 3.0" in blocks[1]
+    assert "Showing the newest 1 matches; use --last N to see more." in blocks[1]
+    assert "AddCalculation: 1.0 Add 2.0 = 3.0" in blocks[2] and "Divide" not in blocks[2]
+    assert "No saved calculations match." in blocks[3]
+
+
+@pytest.mark.parametrize("command, expected", [
+    ("history --last", "where N is a positive number"),
+    ("history --last 0", "where N is a positive number"),
+    ("history since yesterday", "Unrecognised time: 'yesterday'."),
+    ("history add divide", "Unknown history filter: 'divide'."),
+])
+def test_calculator_history_query_errors(monkeypatch, capsys, tmp_path, command, expected):
+    """
+    Test the history query command's messages for malformed filters.
+    """
+    # Arrange
+    monkeypatch.setattr('sys.stdin', StringIO(f'{command}\nexit\n'))
+
+    # Act
+    with pytest.raises(SystemExit):
+        calculator(history_db=str(tmp_path / "history.db"))
+
+    # Assert
+    assert expected in capsys.readouterr().out
+
+
+def test_calculator_history_keeps_nan_calculations(monkeypatch, capsys, tmp_path):
+    """
+    Test that calculations with NaN operands are saved and queried like any other.
+    """
+    # Arrange
+    monkeypatch.setattr('sys.stdin', StringIO('add nan 1\nhistory --last 5\nexit\n'))
+
+    # Act
+    with pytest.raises(SystemExit):
+        calculator(history_db=str(tmp_path / "history.db"))
+
+    # Assert
+    output = capsys.readouterr().out
+    assert "1. [" in output and "] AddCalculation: nan Add 1.0 = nan" in output
+    assert "Error" not in output
+
+
+def test_calculator_reports_history_database_errors(monkeypatch, capsys, tmp_path):
+    """
+    Test that failures to write or read the history database are reported and the
+    session goes on.
+    """
+    # Arrange
+    def fail(*args, **kwargs):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(HistoryStore, 'record', fail)
+    monkeypatch.setattr(HistoryStore, 'flush', fail)
+    monkeypatch.setattr('sys.stdin', StringIO('add 1 2\nhistory --last 5\nexit\n'))
+
+    # Act
+    with pytest.raises(SystemExit):
+        calculator(history_db=str(tmp_path / "history.db"))
+
+    # Assert
+    output = capsys.readouterr().out
+    assert "Add 2.0 = 3.0" in output
+    assert "Error: could not save to the persistent history: disk I/O error" in output
+    assert "Error: could not read the persistent history: disk I/O error" in output
+    assert "Goodbye!" in output
+
+
+def test_calculator_runs_without_an_unopenable_history_database(monkeypatch, capsys, tmp_path):
+    """
+    Test that a history database that cannot be opened is reported and the calculator
+    runs on without persistent history.
+    """
+    # Arrange
+    monkeypatch.setattr('sys.stdin', StringIO('add 1 2\nhistory --last 5\nexit\n'))
+
+    # Act
+    with pytest.raises(SystemExit):
+        calculator(history_db=str(tmp_path / "missing" / "history.db"))
+
+    # Assert
+    output = capsys.readouterr().out
+    assert output.startswith("Error: could not open the persistent history: unable to open database file\n")
+    assert "Add 2.0 = 3.0" in output
+    assert "Persistent history is not enabled." in output
+
+
+def test_calculator_history_query_disabled(monkeypatch, capsys):
+    """
+    Test that history queries explain how to enable the history database.
+    """
+    # Arrange
+    monkeypatch.setattr('sys.stdin', StringIO('history --last 5\nexit\n'))
+
+    # Act
+    with pytest.raises(SystemExit):
+        calculator()
+
+    # Assert
+    assert "Persistent history is not enabled." in capsys.readouterr().out
+
+
+def test_calculator_replays_write_ahead_log(monkeypatch, capsys, tmp_path):
+    """
+    Test that calculations logged by one session are back in the history of the next.
+    """
+    # Arrange
+    log = str(tmp_path / "wal")
+    monkeypatch.setattr('sys.stdin', StringIO('add 1 2\nmultiply 3 4\nexit\n'))
+    with pytest.raises(SystemExit):
+        calculator(history_wal=log)
+    capsys.readouterr()
+    monkeypatch.setattr('sys.stdin', StringIO('history\nexit\n'))
+
+    # Act
+    with pytest.raises(SystemExit):
+        calculator(history_wal=log)
+
+    # Assert
+    captured = capsys.readouterr()
+    assert "Restored 2 calculations from the write-ahead log." in captured.out
+    assert "2. MultiplyCalculation: 3.0 Multiply 4.0 = 12.0\n" in captured.out
+
+
+def test_calculator_stats_command(monkeypatch, capsys):
+    """
+    Test that the stats command summarises the results per operation and overall.
+    """
+    # Arrange
+    user_input = 'stats\nadd 1 1\nadd 2 2\nmultiply 3 3\nstats\nexit\n'
+    monkeypatch.setattr('sys.stdin', StringIO(user_input))
+
+    # Act
+    with pytest.raises(SystemExit):
+        calculator()
+
+    # Assert
+    captured = capsys.readouterr()
+    assert "No calculations performed yet." in captured.out
+    lines = captured.out.split("Session Statistics:\n")[1].splitlines()
+    assert lines[1].split() == ['add', '2', '6', '3', '1', '2', '4']
+    assert lines[2].split() == ['multiply', '1', '9', '9', '0', '9', '9']
+    assert lines[3].split() == ['all', '3', '15', '5', '8.66667', '2', '9']
+
+
+def test_calculator_stats_skip_complex_results(monkeypatch, capsys, tmp_path):
+    """
+    Test that a complex result is shown and logged but left out of the statistics,
+    both when it is calculated and when it is replayed from the write-ahead log.
+    """
+    # Arrange
+    log = str(tmp_path / "wal")
+    monkeypatch.setattr('sys.stdin', StringIO('power -8 0.5\nadd 1 1\nstats\nexit\n'))
+    with pytest.raises(SystemExit):
+        calculator(history_wal=log)
+    first = capsys.readouterr().out
+    monkeypatch.setattr('sys.stdin', StringIO('stats\nexit\n'))
+
+    # Act
+    with pytest.raises(SystemExit):
+        calculator(history_wal=log)
+
+    # Assert
+    second = capsys.readouterr().out
+    assert "Result: PowerCalculation: -8.0 Power 0.5 = (1.7" in first
+    for output in (first, second):
+        lines = output.split("Session Statistics:\n")[1].splitlines()
+        assert lines[1].split() == ['add', '1', '2', '2', '0', '2', '2']
+        assert lines[2].split()[0] == 'all' and 'power' not in output.split("Session Statistics:\n")[1]
+    assert "Restored 2 calculations from the write-ahead log." in second
+
+
+def test_history_lines_are_lazy():
+    """
+    Test that history lines are formatted only as they are consumed.
+    """
+    # Arrange
+    formatted = []
+
+    class Recorded:
+        def __init__(self, i):
+            self.i = i
+
+        def __str__(self):
+            formatted.append(self.i)
+            return f"entry {self.i}"
+
+    history = [Recorded(i) for i in range(5000)]
+
+    # Act
+    lines = history_lines(history, 10)
+    first = next(lines)
+
+    # Assert
+    assert first == "11. entry 10\n"
+    assert formatted == [10]
+
+
+def test_calculator_history_page_and_tail(monkeypatch, capsys):
+    """
+    Test 'history page N' and 'history tail N' against a history longer than memory.
+    """
+    # Arrange
+    calculations = ''.join(f'add {i} 0\n' for i in range(45))
+    user_input = calculations + 'history page 2\nhistory tail 2\nhistory page 4\nhistory tail x\nexit\n'
+    monkeypatch.setattr('sys.stdin', StringIO(user_input))
+
+    # Act
+    with pytest.raises(SystemExit):
+        calculator(history_capacity=10)
+
+    # Assert
+    blocks = capsys.readouterr().out.split(">> ")[46:]
+    assert blocks[0].startswith("Calculation History (entries 21-40 of 45):\n21. AddCalculation: 20.0 Add 0.0")
+    assert blocks[0].rstrip().endswith("40. AddCalculation: 39.0 Add 0.0 = 39.0")
+    assert blocks[1] == ("Calculation History (entries 44-45 of 45):\n"
+                         "44. AddCalculation: 43.0 Add 0.0 = 43.0\n45. AddCalculation: 44.0 Add 0.0 = 44.0\n")
+    assert "Page 4 does not exist; the history has 3 pages." in blocks[2]
+    assert "Usage: history page N | history tail N" in blocks[3]
+
+
+def test_page_lines_stops_when_reader_quits():
+    """
+    Test that lines stop being produced once the pager exits.
+    """
+    # Arrange
+    produced = []
+
+    def lines():
+        for i in range(1_000_000):
+            produced.append(i)
+            yield f"{i}. calculation\n"
+
+    pager = f'"{sys.executable}" -c "import sys; sys.stdin.readline()"'
+
+    # Act
+    page_lines(lines(), pager)
+
+    # Assert
+    assert len(produced) < 100_000
+
+
+def test_page_lines_without_pager(capsys):
+    """
+    Test that lines are written to standard output when the pager cannot be started.
+    """
+    # Act
+    page_lines(iter(["1. a\n", "2. b\n"]), "no-such-pager-command")
+
+    # Assert
+    assert capsys.readouterr().out == "1. a\n2. b\n"
+
+
+def test_display_history_uses_pager_on_terminal(monkeypatch):
+    """
+    Test that a history longer than the terminal goes through the pager.
+    """
+    # Arrange
+    class Terminal(StringIO):
+        def isatty(self):
+            return True
+
+    paged = []
+    monkeypatch.setattr('sys.stdout', Terminal())
+    monkeypatch.setattr('app.calculator.page_lines', lambda lines: paged.extend(lines))
+    monkeypatch.setattr('shutil.get_terminal_size', lambda: os.terminal_size((80, 5)))
+
+    # Act
+    display_history([f"calc {i}" for i in range(3)])
+    display_history([f"calc {i}" for i in range(10)])
+
+    # Assert
+    assert paged[0] == "Calculation History:\n"
+    assert paged[-1] == "10. calc 9\n"
+    assert "3. calc 2\n" in sys.stdout.getvalue()
+
+
+def test_calculator_hot_command(monkeypatch, capsys, tmp_path):
+    """
+    Test the hot command, and that the hot set is saved on exit and restored on start.
+    """
+    # Arrange
+    hot_file = str(tmp_path / "hot.json")
+    user_input = 'hot\ndivide 1 3\ndivide 1 3\nadd 1 1\nhot\nexit\n'
+    CalculationFactory.configure_tracker()
+    monkeypatch.setattr('sys.stdin', StringIO(user_input))
+    with pytest.raises(SystemExit):
+        calculator(hot_file=hot_file)
+    first = capsys.readouterr().out
+    CalculationFactory.configure_cache()
+    CalculationFactory.configure_tracker(1)
+    monkeypatch.setattr('sys.stdin', StringIO('add 2 2\nhot\ncache\nexit\n'))
+
+    # Act
+    with pytest.raises(SystemExit):
+        calculator(hot_file=hot_file)
+
+    # Assert
+    second = capsys.readouterr().out
+    assert "No calculations performed yet." in first
+    assert "Hot Calculations (of 3 requests):\n    1. divide 1.0 3.0 : 2 requests\n    2. add 1.0 1.0 : 1 requests" in first
+    assert "    1. add 2.0 2.0 : 3 requests (at least 1)" in second
+    assert "hits      : 0" in second and "entries   : 3/1024" in second
+
+
+def test_calculator_hot_set_errors(monkeypatch, capsys, tmp_path):
+    """
+    Test that an unreadable hot set is reported without stopping the calculator, and
+    that the hot command explains when tracking is disabled.
+    """
+    # Arrange
+    (tmp_path / "hot.json").write_text("not json")
+    CalculationFactory.configure_tracker(0)
+    monkeypatch.setattr('sys.stdin', StringIO('hot\nexit\n'))
+
+    # Act
+    with pytest.raises(SystemExit):
+        calculator(hot_file=str(tmp_path / "hot.json"))
+    with pytest.raises(SystemExit):
+        monkeypatch.setattr('sys.stdin', StringIO('exit\n'))
+        calculator(hot_file=str(tmp_path / "missing-dir" / "hot.json"))
+
+    # Assert
+    captured = capsys.readouterr().out
+    assert "Could not load the hot calculation set:" in captured
+    assert "Heavy-hitter tracking is disabled." in captured
+    assert "Could not save the hot calculation set:" in captured
@@ -0,0 +1,130 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Columnar Batch Operation Unit Tests
+Tests the stdlib batch kernels used when NumPy is not installed
+"""
+
+# tests/test_columnar.py
+
+"""
+Unit tests for the app.columnar module using pytest.
+
+The stdlib kernels must produce exactly what the scalar Operation methods produce
+for valid rows, flag invalid rows instead of raising, and accept the same operand
+shapes as the NumPy batch path (columns, memoryviews and broadcast scalars).
+"""
+
+import math
+from array import array
+
+import pytest
+
+from app.columnar import ColumnarOperation
+from app.operation import Operation, BatchResult
+
+
+@pytest.mark.parametrize("batch_method, scalar_method", [
+    (ColumnarOperation.batch_addition, Operation.addition),
+    (ColumnarOperation.batch_subtraction, Operation.subtraction),
+    (ColumnarOperation.batch_multiplication, Operation.multiplication),
+    (ColumnarOperation.batch_division, Operation.division),
+    (ColumnarOperation.batch_power, Operation.power),
+    (ColumnarOperation.batch_modulus, Operation.modulus),
+])
+def test_columnar_methods_match_scalar_methods(batch_method, scalar_method):
+    """
+    Test that each stdlib kernel returns array columns matching the scalar operation.
+    """
+    # Arrange
+    a = array('d', [10.0, -7.5, 2.0, 0.0, -9.0])
+    b = array('d', [4.0, 2.0, -3.0, 5.0, 2.0])
+
+    # Act
+    result = batch_method(a, b)
+
+    # Assert
+    assert isinstance(result, BatchResult)
+    assert isinstance(result.values, array) and result.values.typecode == 'd'
+    assert list(result.values) == [scalar_method(x, y) for x, y in zip(a, b)]
+    assert list(result.errors) == [0] * len(a)
+
+
+def test_columnar_broadcasts_scalars_on_either_side():
+    """
+    Test that a scalar operand is repeated to match the other column.
+    """
+    # Arrange
+    column = array('d', [1.0, 2.0, 4.0])
+
+    # Act
+    left = ColumnarOperation.batch_division(8.0, column)
+    right = ColumnarOperation.batch_subtraction(column, 1)
+    both = ColumnarOperation.batch_multiplication(3.0, 2.0)
+
+    # Assert
+    assert list(left.values) == [8.0, 4.0, 2.0]
+    assert list(right.values) == [0.0, 1.0, 3.0]
+    assert list(both.values) == [6.0]
+
+
+@pytest.mark.parametrize("typecode", ['f', 'i', 'B'])
+def test_columnar_converts_other_memoryviews_by_value(typecode):
+    """
+    Test that memoryviews of float32, integer or byte items are read by value, not reinterpreted.
+    """
+    # Arrange
+    view = memoryview(array(typecode, [1, 2]))
+
+    # Act
+    result = ColumnarOperation.batch_addition(view, 0.5)
+
+    # Assert
+    assert list(result.values) == [1.5, 2.5]
+
+
+def test_columnar_rejects_mismatched_columns():
+    """
+    Test that two columns of different lengths raise ValueError.
+    """
+    # Arrange
+    a = array('d', [1.0, 2.0])
+    b = array('d', [1.0])
+
+    # Act & Assert
+    with pytest.raises(ValueError) as exc_info:
+        ColumnarOperation.batch_addition(a, b)
+    assert "different lengths" in str(exc_info.value)
+
+
+@pytest.mark.parametrize("batch_method", [ColumnarOperation.batch_division, ColumnarOperation.batch_modulus])
+def test_columnar_zero_divisor_is_flagged(batch_method):
+    """
+    Test that zero divisors are flagged per row and hold NaN.
+    """
+    # Arrange
+    a = array('d', [1.0, 2.0, 3.0])
+    b = array('d', [0.0, 2.0, 0.0])
+
+    # Act
+    result = batch_method(a, b)
+
+    # Assert
+    assert list(result.errors) == [1, 0, 1]
+    assert math.isnan(result.values[0]) and math.isnan(result.values[2])
+
+
+def test_columnar_power_flags_and_overflows():
+    """
+    Test that power flags rows without a real result and saturates overflow to infinity.
+    """
+    # Arrange
+    a = array('d', [0.0, -8.0, 1e300, -1e300, -1e300])
+    b = array('d', [-2.0, 1.0 / 3.0, 2.0, 3.0, 2.0])
+
+    # Act
+    result = ColumnarOperation.batch_power(a, b)
+
+    # Assert
+    assert list(result.errors) == [1, 1, 0, 0, 0]
+    assert list(result.values[2:]) == [math.inf, -math.inf, math.inf]
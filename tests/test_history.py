@@ -0,0 +1,129 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Calculation History Unit Tests
+Tests the ring buffer and its spill-to-disk segment
+"""
+
+# tests/test_history.py
+
+"""
+Unit tests for the app.history module using pytest.
+
+The history must hold at most `capacity` entries in memory while every entry, on disk
+or in memory, stays reachable in order.
+"""
+
+import pytest
+
+from app.binary import BinaryBatchReader
+from app.calculation import AddCalculation, CalculationFactory, DivideCalculation, PowerCalculation
+from app.history import History
+
+
+def make_calculations(count):
+    """Builds `count` distinct calculations cycling through three operations."""
+    classes = [AddCalculation, DivideCalculation, PowerCalculation]
+    return [classes[i % 3](float(i), 2.0) for i in range(count)]
+
+
+def test_history_keeps_capacity_in_memory():
+    """
+    Test that only the newest entries stay in memory while all of them stay reachable.
+
+    AAA Pattern:
+    - Arrange: Create a history of capacity 4 and ten calculations.
+    - Act: Append them all.
+    - Assert: Verify the length, the spill count and the order of every entry.
+    """
+    # Arrange
+    history = History(capacity=4)
+    calculations = make_calculations(10)
+
+    # Act
+    for calculation in calculations:
+        history.append(calculation)
+
+    # Assert
+    assert len(history) == 10
+    assert history.spilled == 6
+    assert [str(entry) for entry in history] == [str(calc) for calc in calculations]
+    assert sum(entry is not None for entry in history._buffer) == 4
+    assert history[9] is calculations[9]
+    assert history[-10].a == 0.0
+    history.close()
+
+
+def test_history_page_spans_disk_and_memory():
+    """
+    Test that a page can start on disk and end in memory.
+    """
+    # Arrange
+    history = History(capacity=3)
+    for calculation in make_calculations(8):
+        history.append(calculation)
+
+    # Act
+    page = history.page(3, 4)
+    tail = history.page(6, 10)
+    before_start = history.page(-5, 6)
+
+    # Assert
+    assert [entry.a for entry in page] == [3.0, 4.0, 5.0, 6.0]
+    assert [type(entry) for entry in page[:2]] == [AddCalculation, DivideCalculation]
+    assert [entry.a for entry in tail] == [6.0, 7.0]
+    assert [entry.a for entry in before_start] == [0.0]
+
+
+def test_history_index_out_of_range():
+    """
+    Test that indexing past either end raises IndexError.
+    """
+    # Arrange
+    history = History(capacity=2)
+    history.append(AddCalculation(1.0, 2.0))
+
+    # Act & Assert
+    with pytest.raises(IndexError):
+        history[1]
+    with pytest.raises(IndexError):
+        history[-2]
+
+
+def test_history_spill_file_is_a_binary_request_file(tmp_path):
+    """
+    Test that a named spill segment can be read back as a binary request file.
+    """
+    # Arrange
+    path = tmp_path / "history.bin"
+
+    # Act
+    with History(capacity=1, spill_path=str(path)) as history:
+        for calculation in make_calculations(3):
+            history.append(calculation)
+
+    # Assert
+    with BinaryBatchReader(str(path)) as reader:
+        records = list(reader.iter_records())
+    assert records == [
+        (CalculationFactory.opcode('add'), 0.0, 2.0),
+        (CalculationFactory.opcode('divide'), 1.0, 2.0),
+    ]
+
+
+def test_history_rejects_bad_capacity_and_unregistered_calculations():
+    """
+    Test that a capacity below one is rejected, and that only registered calculations can spill.
+    """
+    # Arrange
+    class Unregistered(AddCalculation):
+        __slots__ = ()
+
+    history = History(capacity=1)
+    history.append(Unregistered(1.0, 2.0))
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        History(capacity=0)
+    with pytest.raises(ValueError, match="Unregistered is not a registered calculation type."):
+        history.append(AddCalculation(3.0, 4.0))
@@ -0,0 +1,106 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Hot Calculation Set Unit Tests
+Tests saving, loading and restoring the most frequent calculations
+"""
+
+# tests/test_hotset.py
+
+"""
+Unit tests for the app.hotset module using pytest.
+
+A hot set saved by one process must pre-warm the result cache of the next one and
+carry the request counts over to its tracker.
+"""
+
+import json
+
+import pytest
+
+from app.calculation import CalculationFactory, HeavyHitter
+from app.hotset import load_hot_set, restore_hot_set, save_hot_set
+
+
+def test_hot_set_round_trip(tmp_path):
+    """
+    Test that a saved hot set restores the counts and pre-warms the cache.
+
+    AAA Pattern:
+    - Arrange: Make some repeated requests and save the hot set.
+    - Act: Reset the factory as a new process would start, then restore the file.
+    - Assert: Verify the cache starts warm and the tracker remembers the counts.
+    """
+    # Arrange
+    path = str(tmp_path / "hot.json")
+    CalculationFactory.configure_tracker()
+    for _ in range(3):
+        CalculationFactory.create_calculation('multiply', 6.0, 7.0)
+    CalculationFactory.create_calculation('add', 0.5, 0.25)
+    saved = save_hot_set(path)
+    CalculationFactory.configure_cache()
+    CalculationFactory.configure_tracker()
+
+    # Act
+    restored = restore_hot_set(path)
+    calculation = CalculationFactory.create_calculation('multiply', 6.0, 7.0)
+
+    # Assert
+    assert (saved, restored) == (2, 2)
+    assert load_hot_set(path) == [HeavyHitter('multiply', 6.0, 7.0, 3, 0), HeavyHitter('add', 0.5, 0.25, 1, 0)]
+    assert CalculationFactory.cache_stats().hits == 1
+    assert calculation.result == 42.0
+    assert CalculationFactory.tracker().top(1) == [HeavyHitter('multiply', 6.0, 7.0, 4, 0)]
+
+
+def test_hot_set_missing_file(tmp_path):
+    """
+    Test that restoring a hot set that was never saved does nothing.
+    """
+    # Arrange
+    CalculationFactory.configure_tracker()
+
+    # Act
+    restored = restore_hot_set(str(tmp_path / "missing.json"))
+
+    # Assert
+    assert restored == 0
+    assert len(CalculationFactory.tracker()) == 0
+
+
+def test_hot_set_without_tracker(tmp_path):
+    """
+    Test saving and restoring with tracking disabled.
+    """
+    # Arrange
+    path = str(tmp_path / "hot.json")
+    (tmp_path / "hot.json").write_text(json.dumps({'version': 1, 'calculations': [['add', 1.0, 2.0, 5, 0]]}))
+    CalculationFactory.configure_cache()
+    CalculationFactory.configure_tracker(0)
+
+    # Act
+    restored = restore_hot_set(path)
+    saved = save_hot_set(path)
+
+    # Assert
+    assert restored == 1
+    assert saved == 0
+    assert load_hot_set(path) == []
+
+
+@pytest.mark.parametrize("content, message", [
+    ({'version': 2, 'calculations': []}, "Unsupported hot set version: 2."),
+    ({'calculations': []}, "is not a hot set file."),
+    ({'version': 1, 'calculations': [['add', 1.0]]}, "is not a hot set file."),
+])
+def test_hot_set_rejects_other_files(tmp_path, content, message):
+    """
+    Test that files that are not hot sets are refused with a ValueError.
+    """
+    # Arrange
+    path = tmp_path / "hot.json"
+    path.write_text(json.dumps(content))
+
+    # Act & Assert
+    with pytest.raises(ValueError, match=message):
+        load_hot_set(str(path))
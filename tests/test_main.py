@@ -0,0 +1,119 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Command-Line Entry Point Unit Tests
+Tests the options main.py hands to the calculator modes
+"""
+
+# tests/test_main.py
+
+"""
+Unit tests for main.py using pytest.
+
+The server itself is replaced by a stub, so these tests only check what happens around
+it: the hot calculation set is opt-in, and a bad hot set file never stops the server.
+"""
+
+import json
+
+import pytest
+
+import main
+from app.calculation import CalculationFactory
+
+
+def run_serve(monkeypatch, argv):
+    """Runs `main.py serve` with the server replaced by a stub and returns its arguments."""
+    calls = []
+
+    async def serve(*args):
+        calls.append(args)
+
+    monkeypatch.setattr(main, 'serve', serve)
+    main.main(argv + ['serve', '--port', '0'])
+    return calls
+
+
+def test_hot_file_is_off_by_default(monkeypatch, tmp_path):
+    """
+    Test that without --hot-file no calculations are counted and no file is written.
+
+    AAA Pattern:
+    - Arrange: Point the home directory at an empty temporary directory.
+    - Act: Parse the default options and run the server.
+    - Assert: Verify there is no hot file, no tracker and nothing written.
+    """
+    # Arrange
+    monkeypatch.setenv('HOME', str(tmp_path))
+
+    # Act
+    args = main.build_parser().parse_args([])
+    calls = run_serve(monkeypatch, [])
+
+    # Assert
+    assert args.hot_file is None
+    assert len(calls) == 1
+    assert CalculationFactory.tracker() is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_serve_reports_unreadable_hot_file(monkeypatch, capsys, tmp_path):
+    """
+    Test that a hot set file that cannot be loaded is reported, the server still starts,
+    and the file is replaced with the new hot set on shutdown.
+    """
+    # Arrange
+    hot_file = tmp_path / "hot.json"
+    hot_file.write_text("not json")
+
+    # Act
+    calls = run_serve(monkeypatch, ['--hot-file', str(hot_file)])
+
+    # Assert
+    assert "Could not load the hot calculation set:" in capsys.readouterr().out
+    assert len(calls) == 1
+    assert CalculationFactory.tracker() is not None
+    assert json.loads(hot_file.read_text()) == {'version': 1, 'calculations': []}
+
+
+def test_serve_reports_unwritable_hot_file(monkeypatch, capsys, tmp_path):
+    """
+    Test that a hot set that cannot be saved on shutdown is reported, not raised.
+    """
+    # Arrange
+    hot_file = tmp_path / "missing" / "hot.json"
+
+    # Act
+    run_serve(monkeypatch, ['--hot-file', str(hot_file)])
+
+    # Assert
+    assert "Could not save the hot calculation set:" in capsys.readouterr().out
+    assert not hot_file.exists()
+
+
+@pytest.mark.parametrize("name, content, output", [
+    ("missing.txt", None, None),
+    ("jobs.txt", b"add 1 2\n\xff\xfe 1 2\n", None),
+    ("jobs.txt", b"add 1 2\n", "jobs.txt"),
+])
+def test_lines_reports_bad_files(tmp_path, name, content, output):
+    """
+    Test that the lines subcommand exits with a message, not a traceback, for a missing
+    input, an input that is not UTF-8 text, and an output that is the input file.
+    """
+    # Arrange
+    source = tmp_path / name
+    if content is not None:
+        source.write_bytes(content)
+    argv = ['lines', str(source), '--jobs', '1']
+    if output is not None:
+        argv += ['-o', str(tmp_path / output)]
+
+    # Act
+    with pytest.raises(SystemExit) as exit_info:
+        main.main(argv)
+
+    # Assert
+    assert str(exit_info.value).startswith("Cannot process lines file: ")
+    if content is not None:
+        assert source.read_bytes() == content
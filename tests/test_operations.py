@@ -576,4 +576,161 @@ def test_operations_invalid_input_types(calc_method, a, b, expected_exception):
 
     # Act & Assert
     with pytest.raises(expected_exception):
-        calc_method(a, b)
\ No newline at end of file
+        calc_method(a, b)
+
+# -----------------------------------------------------------------------------------
+# Test Batch (Vectorized) Operations
+# -----------------------------------------------------------------------------------
+# These tests run against whichever backend is active: NumPy when it is installed,
+# otherwise the stdlib kernels in app.columnar.
+
+import math
+from array import array
+
+from app.operation import BatchResult, batch_backend, np
+
+requires_numpy = pytest.mark.skipif(np is None, reason="NumPy is not installed")
+
+
+@pytest.mark.parametrize("batch_method, scalar_method", [
+    (Operation.batch_addition, Operation.addition),
+    (Operation.batch_subtraction, Operation.subtraction),
+    (Operation.batch_multiplication, Operation.multiplication),
+    (Operation.batch_division, Operation.division),
+    (Operation.batch_power, Operation.power),
+    (Operation.batch_modulus, Operation.modulus),
+])
+def test_batch_methods_match_scalar_methods(batch_method, scalar_method):
+    """
+    Test that every batch method agrees element by element with its scalar counterpart.
+    """
+    # Arrange
+    a = [10.0, -7.5, 2.0, 0.0, 9.0]
+    b = [4.0, 2.0, -3.0, 5.0, 0.5]
+
+    # Act
+    result = batch_method(a, b)
+
+    # Assert
+    assert isinstance(result, BatchResult)
+    assert result.values.tolist() == [scalar_method(x, y) for x, y in zip(a, b)]
+    assert result.errors.tolist() == [0] * len(a)
+
+
+def test_batch_addition_broadcasts_scalar():
+    """
+    Test that a scalar operand is broadcast against an array operand.
+    """
+    # Arrange
+    a = array('d', [1.0, 2.0, 3.0])
+
+    # Act
+    result = Operation.batch_addition(a, 10.0)
+
+    # Assert
+    assert result.values.tolist() == [11.0, 12.0, 13.0]
+    assert result.errors.tolist() == [0, 0, 0]
+
+
+def test_batch_operands_are_viewed_without_copying():
+    """
+    Test that an array('d') operand is viewed in place rather than copied.
+    """
+    # Arrange
+    a = array('d', [1.0, 2.0])
+    view = memoryview(a)
+
+    # Act
+    before = Operation.batch_multiplication(view, 1.0)
+    a[0] = 5.0
+    again = Operation.batch_multiplication(view, 1.0)
+
+    # Assert
+    assert before.values.tolist() == [1.0, 2.0]
+    assert again.values.tolist() == [5.0, 2.0]
+
+
+@pytest.mark.parametrize("batch_method", [Operation.batch_division, Operation.batch_modulus])
+def test_batch_zero_divisor_is_masked(batch_method):
+    """
+    Test that a zero divisor flags only its own row instead of raising ValueError.
+    """
+    # Arrange
+    a = [10.0, 10.0, 9.0]
+    b = [2.0, 0.0, 4.0]
+
+    # Act
+    result = batch_method(a, b)
+
+    # Assert
+    assert result.errors.tolist() == [0, 1, 0]
+    assert [math.isnan(value) for value in result.values] == [False, True, False]
+
+
+def test_batch_modulus_keeps_python_sign_semantics():
+    """
+    Test that batch modulus follows the sign of the divisor, like Python's % operator.
+    """
+    # Arrange
+    a = [-7.0, 7.0, -7.0, -5.0]
+    b = [3.0, -3.0, -3.0, float('inf')]
+
+    # Act
+    result = Operation.batch_modulus(a, b)
+
+    # Assert
+    assert result.values.tolist() == [x % y for x, y in zip(a, b)]
+
+
+def test_batch_power_flags_rows_without_a_real_result():
+    """
+    Test that batch power flags zero to a negative power and negative bases with fractional exponents.
+    """
+    # Arrange
+    a = [0.0, -8.0, -2.0, 2.0, 1e300, -1e300]
+    b = [-1.0, 0.5, 3.0, 10.0, 2.0, 3.0]
+
+    # Act
+    result = Operation.batch_power(a, b)
+
+    # Assert
+    assert result.errors.tolist() == [1, 1, 0, 0, 0, 0]
+    assert result.values[2:].tolist() == [-8.0, 1024.0, math.inf, -math.inf]
+
+
+@pytest.mark.parametrize("backend", ['active', 'stdlib'])
+def test_batch_results_have_the_same_types_on_every_backend(backend, monkeypatch):
+    """
+    Test that both backends return array('d') values and array('B') errors, and read
+    memoryviews of other item types by value.
+    """
+    # Arrange
+    if backend == 'stdlib':
+        monkeypatch.setattr('app.operation.np', None)
+    floats = memoryview(array('f', [1.0, 2.0]))
+    ints = memoryview(array('i', [3, 0]))
+
+    # Act
+    result = Operation.batch_division(floats, ints)
+
+    # Assert
+    assert (result.values.typecode, result.errors.typecode) == ('d', 'B')
+    assert result.values[0] == 1 / 3 and math.isnan(result.values[1])
+    assert result.errors.tolist() == [0, 1]
+
+
+def test_batch_falls_back_to_stdlib_kernels(monkeypatch):
+    """
+    Test that batch methods are served by the stdlib kernels when NumPy is not available.
+    """
+    # Arrange
+    monkeypatch.setattr('app.operation.np', None)
+
+    # Act
+    result = Operation.batch_division(array('d', [9.0, 1.0]), array('d', [3.0, 0.0]))
+
+    # Assert
+    assert batch_backend() == 'stdlib'
+    assert isinstance(result.values, array)
+    assert result.values[0] == 3.0
+    assert list(result.errors) == [0, 1]
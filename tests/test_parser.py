@@ -0,0 +1,187 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Calculation Line Parser Unit Tests
+Tests the single-pass tokenizer and its error positions
+"""
+
+# tests/test_parser.py
+
+"""
+Unit tests for the app.parser module using pytest.
+
+Every number the parser accepts must be accepted by float() with the same value, and
+every malformed line must come back as a ParseError pointing at the offending column.
+"""
+
+import math
+
+import pytest
+
+from app.calculation import CalculationFactory
+from app.parser import (
+    INVALID_FORMAT,
+    ParseError,
+    ParsedLine,
+    parse_line,
+    parse_lines,
+    parse_number,
+    parse_rows,
+)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("10", 10.0),
+    ("-2.5", -2.5),
+    (".5", 0.5),
+    ("5.", 5.0),
+    ("+1e-3", 0.001),
+    ("2.5E+10", 2.5e10),
+    ("1_000_000", 1_000_000.0),
+    ("1_0.2_5e1_0", 10.25e10),
+    ("-inf", -math.inf),
+    ("Infinity", math.inf),
+    ("1e999", math.inf),
+])
+def test_parse_number_matches_float(text, expected):
+    """
+    Test that accepted numbers convert exactly as float() converts them.
+    """
+    # Act
+    value = parse_number(f" {text} ")
+
+    # Assert
+    assert value == expected == float(text)
+
+
+@pytest.mark.parametrize("text", ["ten", "1__0", "_1", "1_", "1e", "0x10", "--1", "1.2.3", "", "in f"])
+def test_parse_number_rejects_invalid_numbers(text):
+    """
+    Test that text float() would reject is reported as None instead of raising.
+    """
+    # Act & Assert
+    assert parse_number(text) is None
+
+
+def test_parse_line_resolves_opcodes():
+    """
+    Test that a well-formed line yields the interned operation name, its opcode and both operands.
+
+    AAA Pattern:
+    - Arrange: Prepare two lines with the same operation.
+    - Act: Parse them.
+    - Assert: Verify the fields and that the operation names are one shared object.
+    """
+    # Arrange
+    first, second = "  power 2 1e1 \n", "".join(["po", "wer -1 NaN"])
+
+    # Act
+    parsed_first, parsed_second = parse_line(first), parse_line(second)
+
+    # Assert
+    assert parsed_first == ParsedLine("power", CalculationFactory.opcode("power"), 2.0, 10.0)
+    assert parsed_first.operation is parsed_second.operation
+    assert math.isnan(parsed_second.b)
+    assert parse_line("LOGARITHM 2 3") == ParsedLine("LOGARITHM", None, 2.0, 3.0)
+    assert parse_line("ADD 1 2").opcode == CalculationFactory.opcode("add")
+
+
+@pytest.mark.parametrize("line, message, position", [
+    ("add 5", "Expected 3 fields (<operation> <num1> <num2>), found 2.", 5),
+    ("add", "Expected 3 fields (<operation> <num1> <num2>), found 1.", 3),
+    ("add 1 2 3", "Unexpected field '3'.", 8),
+    ("add ten five", "Invalid number 'ten'.", 4),
+    ("add 10 5x", "Invalid number '5x'.", 8),
+    ("add 1e 2", "Invalid number '1e'.", 5),
+    ("add 1 inf5", "Invalid number 'inf5'.", 9),
+])
+def test_parse_line_reports_error_positions(line, message, position):
+    """
+    Test that malformed lines report what is wrong and the column where it is.
+    """
+    # Act
+    parsed = parse_line(line)
+
+    # Assert
+    assert parsed == ParseError(message, position)
+    assert parsed.describe(line).splitlines()[1] == " " * position + "^ " + message
+
+
+def test_parse_line_blank_and_unicode_whitespace():
+    """
+    Test that blank lines parse to None and that non-ASCII spaces and digits are read as float() reads them.
+    """
+    # Act & Assert
+    assert parse_line("   \n") is None
+    assert parse_line("add 1 2") == ParsedLine("add", CalculationFactory.opcode("add"), 1.0, 2.0)
+
+
+def test_parse_lines_builds_columns_and_slots():
+    """
+    Test that the columnar parser keeps one slot per non-blank line, in order.
+    """
+    # Act
+    opcodes, a_values, b_values, slots = parse_lines(
+        ["add 1 2", "", "logarithm 2 3", "add ten five", "modulus 7 -3", "foo 1 2"]
+    )
+
+    # Assert
+    assert opcodes == [CalculationFactory.opcode("add"), CalculationFactory.opcode("modulus")]
+    assert a_values == [1.0, 7.0] and b_values == [2.0, -3.0]
+    assert slots == [
+        None,
+        "Unsupported calculation type: 'logarithm'.",
+        INVALID_FORMAT,
+        None,
+        "Unsupported calculation type: 'foo'.",
+    ]
+
+
+def test_parse_lines_matches_line_by_line_parsing():
+    """
+    Test that the columnar parser gives the same columns as parsing each line on its own.
+    """
+    # Arrange
+    samples = ["add 1 2", "POWER 2 8", "divide 1_000 1e-3", "add 5", "", "multiply 1 2 3",
+               "add ten 5", "foo 1 2", "modulus -7 inf", "subtract  4\t2", "\n"]
+    lines = [samples[(i * 7 + i // 3) % len(samples)] for i in range(3000)] + ["add 1"]
+    expected = ([], [], [], [])
+    for line in lines:
+        parsed = parse_line(line)
+        if parsed is None:
+            continue
+        if isinstance(parsed, ParseError):
+            expected[3].append(INVALID_FORMAT)
+        elif parsed.opcode is None:
+            expected[3].append(f"Unsupported calculation type: '{parsed.operation}'.")
+        else:
+            expected[0].append(parsed.opcode)
+            expected[1].append(parsed.a)
+            expected[2].append(parsed.b)
+            expected[3].append(None)
+
+    # Act
+    columns = parse_lines(lines)
+
+    # Assert
+    assert columns == expected
+
+
+def test_parse_rows_gives_every_row_a_slot():
+    """
+    Test that pre-split rows are parsed in bulk, tolerate whitespace around fields, and
+    report each bad row in place.
+    """
+    # Act
+    opcodes, a_values, b_values, slots = parse_rows([
+        ["add", "1", "2"], [" Power ", " 2 ", "1e1"], ["add", "1"], ["log", "2", "3"],
+        ["divide", "x", "1"], ["multiply", "1_0", "-inf"],
+    ])
+    empty = parse_rows([])
+
+    # Assert
+    assert opcodes == [CalculationFactory.opcode(name) for name in ("add", "power", "multiply")]
+    assert a_values == [1.0, 2.0, 10.0]
+    assert b_values == [2.0, 10.0, -math.inf]
+    assert slots == [None, None, INVALID_FORMAT, "Unsupported calculation type: 'log'.", INVALID_FORMAT, None]
+    assert empty == ([], [], [], [])
@@ -0,0 +1,120 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Micro-Batching Scheduler Unit Tests
+Tests batching windows, early batches and result routing
+"""
+
+# tests/test_scheduler.py
+
+"""
+Unit tests for the app.scheduler module using pytest.
+
+Each test drives its own event loop through `asyncio.run`.
+"""
+
+import asyncio
+
+import pytest
+
+from app.calculation import CalculationFactory, CalculationStatus
+from app.scheduler import MicroBatcher
+
+ADD = CalculationFactory.opcode('add')
+DIVIDE = CalculationFactory.opcode('divide')
+
+
+def test_batcher_runs_window_as_one_batch():
+    """
+    Test that calculations submitted within the window run together and each submitter
+    gets the results of its own rows.
+    """
+    async def scenario():
+        # Arrange
+        batcher = MicroBatcher(window=0.01)
+
+        # Act
+        first = batcher.submit([ADD, DIVIDE], [1.0, 1.0], [2.0, 0.0])
+        second = batcher.submit([DIVIDE], [9.0], [3.0])
+        waiting = len(batcher)
+        results = await asyncio.gather(first, second)
+        return results, waiting, batcher.batches, batcher.rows
+
+    results, waiting, batches, rows = asyncio.run(scenario())
+
+    # Assert
+    (first_results, first_status), (second_results, second_status) = results
+    assert first_results[0] == 3.0
+    assert list(first_status) == [CalculationStatus.OK, CalculationStatus.DIV_BY_ZERO]
+    assert list(second_results) == [3.0] and list(second_status) == [CalculationStatus.OK]
+    assert (waiting, batches, rows) == (3, 1, 3)
+
+
+def test_batcher_runs_full_batch_without_waiting():
+    """
+    Test that reaching `max_items` runs the batch before the window ends.
+    """
+    async def scenario():
+        # Arrange
+        batcher = MicroBatcher(window=60, max_items=2)
+
+        # Act
+        first = batcher.submit([ADD], [1.0], [1.0])
+        second = batcher.submit([ADD], [2.0], [2.0])
+        done = first.done() and second.done()
+        batcher.flush()  # Nothing left to run.
+        return done, (await second)[0], batcher.batches
+
+    done, results, batches = asyncio.run(scenario())
+
+    # Assert
+    assert done
+    assert list(results) == [4.0]
+    assert batches == 1
+
+
+def test_batcher_skips_cancelled_submitters():
+    """
+    Test that a submitter that stopped waiting does not prevent the others from getting results.
+    """
+    async def scenario():
+        # Arrange
+        batcher = MicroBatcher(window=0)
+        abandoned = batcher.submit([ADD], [1.0], [1.0])
+        kept = batcher.submit([ADD], [2.0], [3.0])
+
+        # Act
+        abandoned.cancel()
+        return (await kept)[0]
+
+    # Assert
+    assert list(asyncio.run(scenario())) == [5.0]
+
+
+def test_batcher_rejects_uneven_columns():
+    """
+    Test that columns of different lengths are rejected and leave no rows waiting.
+    """
+    async def scenario():
+        # Arrange
+        batcher = MicroBatcher()
+
+        # Act
+        with pytest.raises(ValueError, match="same length"):
+            batcher.submit([ADD, ADD], [1.0], [2.0, 3.0])
+        return len(batcher)
+
+    # Assert
+    assert asyncio.run(scenario()) == 0
+
+
+@pytest.mark.parametrize("window, max_items, message", [
+    (-0.001, 1, "negative"),
+    (0.001, 0, "at least one"),
+])
+def test_batcher_rejects_bad_settings(window, max_items, message):
+    """
+    Test that a negative window or an empty batch size is rejected.
+    """
+    with pytest.raises(ValueError, match=message):
+        MicroBatcher(window, max_items)
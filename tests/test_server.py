@@ -0,0 +1,799 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Calculation Server Unit Tests
+Tests the line protocol, per-connection sessions and both socket types
+"""
+
+# tests/test_server.py
+
+"""
+Unit tests for the app.server module using pytest.
+
+The server is exercised over real sockets on the loopback interface and in a temporary
+directory, with each test driving its own event loop through `asyncio.run`.
+"""
+
+import asyncio
+import math
+import os
+import sys
+
+import pytest
+
+from app.calculation import CalculationFactory, CalculationStatus
+from app.scheduler import MicroBatcher
+from app.server import (BINARY_MAGIC, FRAME_HEADER, MAX_BATCH_SIZE, MAX_FRAME_RECORDS, MAX_LINE_BYTES,
+                        OVERLOADED_RESPONSE, READ_CHUNK_BYTES, AdmissionControl, CalculationServer, Session,
+                        pack_request, pack_results, serve, unpack_request, unpack_results)
+
+unix_only = pytest.mark.skipif(sys.platform == 'win32', reason="Unix domain sockets")
+
+
+@pytest.mark.parametrize("line, expected", [
+    ("add 1 2\n", "3.0\n"),
+    ("DIVIDE 1 4", "0.25\n"),
+    ("divide 1 0\n", "Error: Cannot divide by zero.\n"),
+    ("root 1 2\n", "Error: Unsupported calculation type: 'root'.\n"),
+    ("add 1 x\n", "Error: Invalid number 'x'.\n"),
+    ("   \n", None),
+])
+def test_session_responds_to_lines(line, expected):
+    """
+    Test the response to each kind of request line.
+    """
+    # Arrange
+    session = Session()
+
+    # Act
+    response = session.respond(line)
+
+    # Assert
+    assert response == expected
+
+
+def test_session_history():
+    """
+    Test that a session's history holds only its successful calculations.
+    """
+    # Arrange
+    session = Session(history_capacity=1)
+    for line in ("add 1 2", "divide 1 0", "multiply 2 3"):
+        session.respond(line)
+
+    # Act
+    response = session.respond("History")
+
+    # Assert
+    assert response == ("History: 2\n"
+                        "1. AddCalculation: 1.0 Add 2.0 = 3.0\n"
+                        "2. MultiplyCalculation: 2.0 Multiply 3.0 = 6.0\n")
+    assert session.requests == 4
+    session.close()
+
+
+def test_session_batch_frame():
+    """
+    Test that a batch frame is answered once, with one result per calculation in order.
+    """
+    # Arrange
+    session = Session()
+    frame = ["batch 4", "add 1 2", "divide 1 0", "", "history"]
+
+    # Act
+    responses = [session.respond(line) for line in frame]
+
+    # Assert
+    assert responses[:4] == [None] * 4
+    assert responses[4] == ("Batch: 4\n"
+                            "3.0\n"
+                            "Error: Cannot divide by zero.\n"
+                            "Error: Empty line in batch.\n"
+                            "Error: Expected 3 fields (<operation> <num1> <num2>), found 1.\n")
+    assert not session.in_batch
+    assert session.requests == 4
+    assert len(session.history) == 1
+    session.close()
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("batch 0", "Batch: 0\n"),
+    ("BATCH", f"Error: Expected 'batch <count>' with a count from 0 to {MAX_BATCH_SIZE}.\n"),
+    ("batch -1", f"Error: Expected 'batch <count>' with a count from 0 to {MAX_BATCH_SIZE}.\n"),
+    (f"batch {MAX_BATCH_SIZE + 1}", f"Error: Expected 'batch <count>' with a count from 0 to {MAX_BATCH_SIZE}.\n"),
+])
+def test_session_batch_headers(header, expected):
+    """
+    Test empty batch frames and rejected batch headers.
+    """
+    # Arrange
+    session = Session()
+
+    # Act
+    response = session.respond(header)
+
+    # Assert
+    assert response == expected
+    assert not session.in_batch
+
+
+async def exchange(reader, writer, lines):
+    """Sends each line and reads one response line for it."""
+    responses = []
+    for line in lines:
+        writer.write(line.encode())
+        responses.append((await reader.readline()).decode())
+    return responses
+
+
+def test_server_tcp_sessions_are_separate():
+    """
+    Test that concurrent TCP clients are answered and keep separate histories.
+
+    AAA Pattern:
+    - Arrange: Start a server on a free loopback port.
+    - Act: Connect two clients, calculate on both and ask each for its history.
+    - Assert: Verify the results and that each history holds only its own calculation.
+    """
+    async def scenario():
+        # Arrange
+        server = CalculationServer()
+        listener = await server.start_tcp('127.0.0.1', 0)
+        port = listener.sockets[0].getsockname()[1]
+        first = await asyncio.open_connection('127.0.0.1', port)
+        second = await asyncio.open_connection('127.0.0.1', port)
+
+        # Act
+        results = await asyncio.gather(exchange(*first, ["add 1 2\n", "history\n"]),
+                                       exchange(*second, ["power 2 10\n", "\nhistory\n"]))
+        connections = server.connections
+        for _, writer in (first, second):
+            writer.write(b"exit\n")
+        closed = [await reader.read() for reader, _ in (first, second)]
+        await server.close()
+        return results, connections, closed, server.requests
+
+    results, connections, closed, requests = asyncio.run(scenario())
+
+    # Assert
+    assert results[0] == ["3.0\n", "History: 1\n"]
+    assert results[1] == ["1024.0\n", "History: 1\n"]
+    assert connections == 2
+    assert closed == [b"1. AddCalculation: 1.0 Add 2.0 = 3.0\n", b"1. PowerCalculation: 2.0 Power 10.0 = 1024.0\n"]
+    assert requests == 4
+
+
+def test_server_answers_pipelined_requests_in_order():
+    """
+    Test that requests sent without waiting are all answered, in order, and that a
+    batch frame split across reads is answered as one frame.
+
+    AAA Pattern:
+    - Arrange: Start a server and build requests spanning several read chunks.
+    - Act: Send them with one write, ending with `exit` followed by a line never answered.
+    - Assert: Verify every response arrives in request order before the connection closes.
+    """
+    count = 3 * READ_CHUNK_BYTES // len("add 1 1\n")
+    requests = [f"add {i} 1\n" for i in range(count)] + ["batch 2\n", "multiply 2 3\n", "add 1\n"]
+
+    async def scenario():
+        # Arrange
+        server = CalculationServer()
+        listener = await server.start_tcp('127.0.0.1', 0)
+        reader, writer = await asyncio.open_connection('127.0.0.1', listener.sockets[0].getsockname()[1])
+
+        # Act
+        writer.write(''.join(requests + ["exit\n", "add 5 5\n"]).encode())
+        response = await reader.read()
+        await server.close()
+        return response.decode(), server.requests
+
+    response, served = asyncio.run(scenario())
+
+    # Assert
+    expected = [f"{i + 1.0!r}" for i in range(count)]
+    expected += ["Batch: 2", "6.0", "Error: Expected 3 fields (<operation> <num1> <num2>), found 2."]
+    assert response.splitlines() == expected
+    assert served == count + 2
+
+
+def test_server_answers_last_line_without_newline():
+    """
+    Test that a final request without a line break is answered when the client stops sending.
+    """
+    async def scenario():
+        # Arrange
+        server = CalculationServer()
+        listener = await server.start_tcp('127.0.0.1', 0)
+        reader, writer = await asyncio.open_connection('127.0.0.1', listener.sockets[0].getsockname()[1])
+
+        # Act
+        writer.write(b"add 1 2\nsubtract 1 2")
+        writer.write_eof()
+        response = await reader.read()
+        await server.close()
+        return response
+
+    # Assert
+    assert asyncio.run(scenario()) == b"3.0\n-1.0\n"
+
+
+@unix_only
+def test_server_unix_socket(tmp_path):
+    """
+    Test serving over a Unix socket that replaces a stale socket file.
+    """
+    path = str(tmp_path / "calc.sock")
+    (tmp_path / "calc.sock").write_text("stale")
+
+    async def scenario():
+        # Arrange
+        server = CalculationServer()
+        await server.start_unix(path)
+
+        # Act
+        reader, writer = await asyncio.open_unix_connection(path)
+        responses = await exchange(reader, writer, ["modulus 10 3\n"])
+        writer.close()
+        await asyncio.sleep(0.05)
+        open_after_close = server.connections
+        await server.close()
+        return responses, open_after_close
+
+    responses, open_after_close = asyncio.run(scenario())
+
+    # Assert
+    assert responses == ["1.0\n"]
+    assert open_after_close == 0
+
+
+def test_server_rejects_long_lines():
+    """
+    Test that a request line over the limit gets an error and the connection is closed.
+    """
+    async def scenario():
+        # Arrange
+        server = CalculationServer()
+        listener = await server.start_tcp('127.0.0.1', 0)
+        reader, writer = await asyncio.open_connection('127.0.0.1', listener.sockets[0].getsockname()[1])
+
+        # Act
+        writer.write(b"add " + b"1" * (MAX_LINE_BYTES + 10) + b" 2\n")
+        response = await reader.read()
+        await server.close()
+        return response
+
+    response = asyncio.run(scenario())
+
+    # Assert
+    assert response == f"Error: Line longer than {MAX_LINE_BYTES} bytes.\n".encode()
+
+
+def test_server_stops_answering_at_long_line():
+    """
+    Test that lines after an over-long line in the same read are not answered.
+    """
+    # Arrange
+    server = CalculationServer()
+    session = Session()
+    lines = [b"add 1 2", b"1" * (MAX_LINE_BYTES + 1), b"add 3 4"]
+
+    # Act
+    parts, closing = server._collect(session, lines)
+
+    # Assert
+    assert session.render(parts) == f"3.0\nError: Line longer than {MAX_LINE_BYTES} bytes.\n"
+    assert closing
+    assert server.requests == 1
+
+
+def test_server_survives_reset_connection():
+    """
+    Test that a client disconnecting while its response is sent does not stop the server.
+    """
+    async def scenario():
+        # Arrange
+        server = CalculationServer()
+        listener = await server.start_tcp('127.0.0.1', 0)
+        port = listener.sockets[0].getsockname()[1]
+        _, writer = await asyncio.open_connection('127.0.0.1', port)
+
+        # Act
+        writer.write(b"history\n" + b"add 1 2\n" * 10_000)
+        writer.transport.abort()
+        await asyncio.sleep(0.1)
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        responses = await exchange(reader, writer, ["add 2 2\n"])
+        writer.close()
+        await server.close()
+        return responses
+
+    # Assert
+    assert asyncio.run(scenario()) == ["4.0\n"]
+
+
+def test_binary_frames_round_trip():
+    """
+    Test that a request frame decodes to its batch and a result frame decodes to its columns.
+    """
+    # Arrange
+    opcodes = [CalculationFactory.opcode('add'), CalculationFactory.opcode('divide'), 255]
+    frame = pack_request(opcodes, [1.5, 1.0, 2.0], [2.0, 0.0, 3.0])
+
+    # Act
+    with memoryview(frame) as view:
+        batch = unpack_request(view[FRAME_HEADER.size:], 3)
+    batch.execute()
+    response = pack_results(batch.results, batch.status)
+    results, status = unpack_results(response[FRAME_HEADER.size:], 3)
+
+    # Assert
+    assert len(frame) == FRAME_HEADER.size + 3 * 17
+    assert list(batch.opcodes) == opcodes
+    assert FRAME_HEADER.unpack_from(response) == (3,)
+    assert results[0] == 3.5 and math.isnan(results[1]) and math.isnan(results[2])
+    assert list(status) == [CalculationStatus.OK, CalculationStatus.DIV_BY_ZERO, CalculationStatus.UNSUPPORTED]
+
+
+def test_pack_request_rejects_uneven_columns():
+    """
+    Test that request columns of different lengths are rejected.
+    """
+    with pytest.raises(ValueError, match="same length"):
+        pack_request([0, 0], [1.0], [2.0])
+
+
+async def read_result_frames(reader, frames):
+    """Reads `frames` response frames and returns their (results, status) columns."""
+    columns = []
+    for _ in range(frames):
+        (count,) = FRAME_HEADER.unpack(await reader.readexactly(FRAME_HEADER.size))
+        columns.append(unpack_results(await reader.readexactly(9 * count), count))
+    return columns
+
+
+def test_server_answers_binary_frames():
+    """
+    Test a binary connection with pipelined frames, split writes and a large frame.
+
+    AAA Pattern:
+    - Arrange: Start a server and pack a small, an empty and a large request frame.
+    - Act: Send the magic in two writes, the first two frames together and the large
+      frame in two halves.
+    - Assert: Verify every result frame, in order.
+    """
+    add, power = CalculationFactory.opcode('add'), CalculationFactory.opcode('power')
+    rows = 3 * READ_CHUNK_BYTES // 17
+    small = pack_request([add, power], [1.0, 2.0], [2.0, 10.0])
+    empty = pack_request([], [], [])
+    large = pack_request([add] * rows, range(rows), [1.0] * rows)
+
+    async def scenario():
+        # Arrange
+        server = CalculationServer()
+        listener = await server.start_tcp('127.0.0.1', 0)
+        reader, writer = await asyncio.open_connection('127.0.0.1', listener.sockets[0].getsockname()[1])
+
+        # Act
+        writer.write(BINARY_MAGIC[:3])
+        await asyncio.sleep(0.01)
+        writer.write(BINARY_MAGIC[3:] + small + empty + large[:1000])
+        await asyncio.sleep(0.01)
+        writer.write(large[1000:])
+        columns = await read_result_frames(reader, 3)
+        writer.close()
+        await server.close()
+        return columns, server.requests
+
+    columns, requests = asyncio.run(scenario())
+
+    # Assert
+    assert [list(results) for results, _ in columns[:2]] == [[3.0, 1024.0], []]
+    assert list(columns[2][0]) == [float(i + 1) for i in range(rows)]
+    assert not any(columns[2][1])
+    assert requests == rows + 2
+
+
+@pytest.mark.parametrize("payload, expected", [
+    (BINARY_MAGIC + FRAME_HEADER.pack(MAX_FRAME_RECORDS + 1), b""),
+    (BINARY_MAGIC + FRAME_HEADER.pack(2) + bytes(17), b""),
+    (BINARY_MAGIC + b"\x01\x00", b""),
+    (BINARY_MAGIC[:4], b"Error: Expected 3 fields (<operation> <num1> <num2>), found 1.\n"),
+])
+def test_server_closes_binary_connection(payload, expected):
+    """
+    Test that an oversized or truncated frame ends a binary connection without a
+    response, and that a connection cut short within the magic is answered as text.
+    """
+    async def scenario():
+        # Arrange
+        server = CalculationServer()
+        listener = await server.start_tcp('127.0.0.1', 0)
+        reader, writer = await asyncio.open_connection('127.0.0.1', listener.sockets[0].getsockname()[1])
+
+        # Act
+        writer.write(payload)
+        writer.write_eof()
+        response = await asyncio.wait_for(reader.read(), 5)
+        await server.close()
+        return response
+
+    # Assert
+    assert asyncio.run(scenario()) == expected
+
+
+def test_server_batches_requests_of_all_connections():
+    """
+    Test that with a scheduler, the requests of concurrent text and binary connections
+    run as one batch and each connection gets its own results, in order.
+
+    AAA Pattern:
+    - Arrange: Start a server whose scheduler waits long enough to collect every request.
+    - Act: Send calculations, a history request and a batch frame on one text
+      connection, and a binary frame on another.
+    - Assert: Verify each connection's responses and that a single batch ran.
+    """
+    async def scenario():
+        # Arrange
+        scheduler = MicroBatcher(window=0.05)
+        server = CalculationServer(scheduler=scheduler)
+        listener = await server.start_tcp('127.0.0.1', 0)
+        port = listener.sockets[0].getsockname()[1]
+        text_reader, text_writer = await asyncio.open_connection('127.0.0.1', port)
+        binary_reader, binary_writer = await asyncio.open_connection('127.0.0.1', port)
+
+        # Act
+        text_writer.write(b"add 1 2\ndivide 1 0\nroot 1 2\nhistory\nbatch 2\nmultiply 2 3\nadd 1\nexit\n")
+        binary_writer.write(BINARY_MAGIC + pack_request([CalculationFactory.opcode('power')], [2.0], [8.0]))
+        text = await text_reader.read()
+        binary = await read_result_frames(binary_reader, 1)
+        binary_writer.close()
+        await server.close()
+        return text.decode(), binary, scheduler.batches
+
+    text, binary, batches = asyncio.run(scenario())
+
+    # Assert
+    assert text == ("3.0\n"
+                    "Error: Cannot divide by zero.\n"
+                    "Error: Unsupported calculation type: 'root'.\n"
+                    "History: 1\n"
+                    "1. AddCalculation: 1.0 Add 2.0 = 3.0\n"
+                    "Batch: 2\n"
+                    "6.0\n"
+                    "Error: Expected 3 fields (<operation> <num1> <num2>), found 2.\n")
+    assert list(binary[0][0]) == [256.0]
+    assert batches == 1
+
+
+def test_admission_waits_in_arrival_order():
+    """
+    Test that slices which do not fit wait, oldest first, and are let in as room frees up.
+    """
+    async def scenario():
+        # Arrange
+        admission = AdmissionControl(queue_limit=3, client_limit=3, timeout=5)
+        await admission.admit(3)
+        large = asyncio.ensure_future(admission.admit(3))
+        small = asyncio.ensure_future(admission.admit(1))
+        await asyncio.sleep(0)
+        waiting = admission.waiting
+
+        # Act
+        admission.release(1)  # Room for the small slice, but the large one came first.
+        await asyncio.sleep(0)
+        small_first = small.done()
+        admission.release(2)
+        admitted = [await large]
+        admission.release(3)
+        admitted.append(await small)
+        return waiting, small_first, admitted, admission.queued
+
+    waiting, small_first, admitted, queued = asyncio.run(scenario())
+
+    # Assert
+    assert waiting == 2
+    assert not small_first
+    assert admitted == [True, True]
+    assert queued == 1
+
+
+def test_admission_sheds_after_timeout():
+    """
+    Test that a slice still waiting when the timeout passes is shed, and that slices
+    behind it are not held up by it.
+    """
+    async def scenario():
+        # Arrange
+        admission = AdmissionControl(queue_limit=2, client_limit=2, timeout=0.01)
+        await admission.admit(1)
+
+        # Act
+        shed = await admission.admit(2)
+        admitted = await admission.admit(1)
+        return shed, admitted, admission.queued, admission.shed
+
+    # Assert
+    assert asyncio.run(scenario()) == (False, True, 2, 2)
+
+
+def test_admission_forgets_cancelled_waiters():
+    """
+    Test that a connection cancelled while waiting, or just as it was admitted, leaves
+    only admitted calculations counted.
+    """
+    async def scenario():
+        # Arrange
+        admission = AdmissionControl(queue_limit=2, client_limit=2, timeout=5)
+        await admission.admit(2)
+        abandoned = asyncio.ensure_future(admission.admit(2))
+        racing = asyncio.ensure_future(admission.admit(1))
+        await asyncio.sleep(0)
+
+        # Act
+        abandoned.cancel()
+        await asyncio.gather(abandoned, return_exceptions=True)
+        admission.release(2)  # Admits the racing slice ...
+        racing.cancel()  # ... which is cancelled before it runs again.
+        (outcome,) = await asyncio.gather(racing, return_exceptions=True)
+        return outcome, admission.queued, admission.waiting
+
+    outcome, queued, waiting = asyncio.run(scenario())
+
+    # Assert
+    assert queued == (0 if isinstance(outcome, asyncio.CancelledError) else 1)
+    assert waiting == 0
+
+
+def test_admission_counts_out_slices_cancelled_after_admission(monkeypatch):
+    """
+    Test that a slice admitted just before its connection is cancelled is counted out,
+    as happens when the cancellation reaches `wait_for` after the slice was admitted.
+    """
+    async def wait_then_cancel(future, timeout):
+        await future
+        raise asyncio.CancelledError
+
+    async def scenario():
+        # Arrange
+        admission = AdmissionControl(queue_limit=2, client_limit=2, timeout=5)
+        await admission.admit(2)
+        monkeypatch.setattr(asyncio, 'wait_for', wait_then_cancel)
+        waiting = asyncio.ensure_future(admission.admit(1))
+        await asyncio.sleep(0)
+
+        # Act
+        admission.release(2)
+        (outcome,) = await asyncio.gather(waiting, return_exceptions=True)
+        return outcome, admission.queued, admission.waiting
+
+    # Assert
+    outcome, queued, waiting = asyncio.run(scenario())
+    assert isinstance(outcome, asyncio.CancelledError)
+    assert (queued, waiting) == (0, 0)
+
+
+@pytest.mark.parametrize("queue_limit, client_limit, timeout", [
+    (4, 5, 1.0),
+    (4, 0, 1.0),
+    (4, 4, -1.0),
+])
+def test_admission_rejects_bad_settings(queue_limit, client_limit, timeout):
+    """
+    Test that a client limit outside 1..queue_limit or a negative timeout is rejected.
+    """
+    with pytest.raises(ValueError):
+        AdmissionControl(queue_limit, client_limit, timeout)
+
+
+def test_server_sheds_requests_over_the_queue_limit():
+    """
+    Test that calculations which find the global queue full are answered with an
+    overload error on text and binary connections, and that queue depths are reported.
+
+    AAA Pattern:
+    - Arrange: Start a server whose queue holds two calculations, with a scheduler that
+      keeps them queued for a while, and fill the queue from one client.
+    - Act: Send a calculation and a metrics request from a second text client and a
+      frame from a binary client.
+    - Assert: Verify the overload answers, the metrics and the first client's results.
+    """
+    async def scenario():
+        # Arrange
+        server = CalculationServer(scheduler=MicroBatcher(window=0.2),
+                                   admission=AdmissionControl(queue_limit=2, client_limit=2, timeout=0))
+        listener = await server.start_tcp('127.0.0.1', 0)
+        port = listener.sockets[0].getsockname()[1]
+        first, second, binary = [await asyncio.open_connection('127.0.0.1', port) for _ in range(3)]
+        first[1].write(b"add 1 1\nadd 2 2\n")
+        await asyncio.sleep(0.05)
+
+        # Act
+        second[1].write(b"add 3 3\nmetrics\n")
+        binary[1].write(BINARY_MAGIC + pack_request([CalculationFactory.opcode('add')], [1.0], [1.0]))
+        shed = [(await second[0].readline()).decode()]
+        for _ in range(int((await second[0].readline()).split()[1])):
+            shed.append((await second[0].readline()).decode())
+        frames = await read_result_frames(binary[0], 1)
+        served = [await first[0].readline() for _ in range(2)]
+        for _, writer in (first, second, binary):
+            writer.close()
+        await server.close()
+        return shed, frames, served
+
+    shed, frames, served = asyncio.run(scenario())
+
+    # Assert
+    metrics = dict(line.split() for line in shed[1:])
+    assert shed[0] == OVERLOADED_RESPONSE == "Error: Server is overloaded; try again later.\n"
+    assert metrics['queued'] == '2' and metrics['queue_limit'] == '2' and metrics['batch_queue'] == '2'
+    assert metrics['shed'] == '1' and metrics['connections'] == '3' and metrics['waiting'] == '0'
+    assert math.isnan(frames[0][0][0]) and list(frames[0][1]) == [CalculationStatus.OVERLOADED]
+    assert served == [b"2.0\n", b"4.0\n"]
+
+
+def test_server_answers_in_client_limit_slices():
+    """
+    Test that requests beyond the per-connection limit are answered in order, in slices.
+    """
+    async def scenario():
+        # Arrange
+        server = CalculationServer(admission=AdmissionControl(queue_limit=4, client_limit=2))
+        listener = await server.start_tcp('127.0.0.1', 0)
+        port = listener.sockets[0].getsockname()[1]
+        text = await asyncio.open_connection('127.0.0.1', port)
+        binary = await asyncio.open_connection('127.0.0.1', port)
+
+        # Act
+        text[1].write(b"".join(f"add {i} 0\n".encode() for i in range(5)) + b"exit\n")
+        binary[1].write(BINARY_MAGIC + pack_request([CalculationFactory.opcode('multiply')] * 5, range(5), [2.0] * 5))
+        lines = await text[0].read()
+        frames = await read_result_frames(binary[0], 1)
+        binary[1].close()
+        await server.close()
+        return lines, frames, server.admission.queued
+
+    lines, frames, queued = asyncio.run(scenario())
+
+    # Assert
+    assert lines == b"0.0\n1.0\n2.0\n3.0\n4.0\n"
+    assert list(frames[0][0]) == [0.0, 2.0, 4.0, 6.0, 8.0]
+    assert queued == 0
+
+
+def test_server_admits_large_batch_frames_in_client_limit_slices():
+    """
+    Test that a batch frame with more calculations than the queue holds is answered in
+    full, admitted in client-limit slices instead of waiting for room it can never get.
+    """
+    async def scenario():
+        # Arrange
+        server = CalculationServer(admission=AdmissionControl(queue_limit=100, client_limit=10, timeout=0.5))
+        listener = await server.start_tcp('127.0.0.1', 0)
+        reader, writer = await asyncio.open_connection('127.0.0.1', listener.sockets[0].getsockname()[1])
+
+        # Act
+        writer.write(b"batch 200\n" + b"".join(f"add {i} 1\n".encode() for i in range(200)) + b"exit\n")
+        lines = (await reader.read()).decode().splitlines()
+        await server.close()
+        return lines, server.admission
+
+    lines, admission = asyncio.run(scenario())
+
+    # Assert
+    assert lines[0] == "Batch: 200"
+    assert lines[1:] == [f"{i + 1.0}" for i in range(200)]
+    assert (admission.shed, admission.queued) == (0, 0)
+
+
+def test_server_rejects_long_unfinished_lines():
+    """
+    Test that a line which grows past the limit before its newline arrives gets an
+    error and the connection is closed.
+    """
+    async def scenario():
+        # Arrange
+        server = CalculationServer()
+        listener = await server.start_tcp('127.0.0.1', 0)
+        reader, writer = await asyncio.open_connection('127.0.0.1', listener.sockets[0].getsockname()[1])
+
+        # Act
+        writer.write(b"add 1 2\nadd " + b"1" * (MAX_LINE_BYTES + 10))
+        response = await reader.read()
+        writer.close()
+        await server.close()
+        return response
+
+    response = asyncio.run(scenario())
+
+    # Assert
+    assert response == f"3.0\nError: Line longer than {MAX_LINE_BYTES} bytes.\n".encode()
+
+
+def test_server_turns_away_connections_over_the_limit():
+    """
+    Test that a connection beyond `max_connections` gets the overload error and is closed.
+    """
+    async def scenario():
+        # Arrange
+        server = CalculationServer(max_connections=1)
+        listener = await server.start_tcp('127.0.0.1', 0)
+        port = listener.sockets[0].getsockname()[1]
+        first = await asyncio.open_connection('127.0.0.1', port)
+        await exchange(*first, ["add 1 1\n"])
+
+        # Act
+        reader, _ = await asyncio.open_connection('127.0.0.1', port)
+        response = await reader.read()
+        metrics = server.metrics()
+        first[1].close()
+        await server.close()
+        return response, metrics
+
+    response, metrics = asyncio.run(scenario())
+
+    # Assert
+    assert response == OVERLOADED_RESPONSE.encode()
+    assert metrics['rejected_connections'] == 1 and metrics['connections'] == 1
+
+
+@unix_only
+def test_serve_until_cancelled(tmp_path, capsys):
+    """
+    Test that serve() listens on the requested sockets and cleans up when stopped.
+    """
+    path = str(tmp_path / "calc.sock")
+
+    async def scenario():
+        # Arrange
+        task = asyncio.ensure_future(serve(port=0, unix_path=path, batch_window=0))
+        while not os.path.exists(path):
+            await asyncio.sleep(0.01)
+        reader, writer = await asyncio.open_unix_connection(path)
+        responses = await exchange(reader, writer, ["subtract 5 7\n"])
+        writer.close()
+
+        # Act
+        task.cancel()
+        await task
+        return responses
+
+    responses = asyncio.run(scenario())
+
+    # Assert
+    output = capsys.readouterr().out
+    assert responses == ["-2.0\n"]
+    assert output.startswith(f"Serving calculations on {path}, 127.0.0.1:")
+    assert "Server stopped after 1 requests." in output
+    assert not os.path.exists(path)
+
+
+@pytest.mark.parametrize("unix", [False, pytest.param(True, marks=unix_only)])
+def test_serve_on_one_kind_of_socket(tmp_path, capsys, unix):
+    """
+    Test that serve() listens only on TCP without a Unix socket, and only on the Unix
+    socket when no TCP address is given.
+    """
+    path = str(tmp_path / "calc.sock")
+    arguments = {'unix_path': path} if unix else {'port': 0}
+
+    async def scenario():
+        # Arrange
+        task = asyncio.ensure_future(serve(**arguments))
+        output = ''
+        while "Serving" not in output:
+            await asyncio.sleep(0.01)
+            output += capsys.readouterr().out
+
+        # Act
+        task.cancel()
+        await task
+        return output + capsys.readouterr().out
+
+    output = asyncio.run(scenario())
+
+    # Assert
+    expected = f"Serving calculations on {path}\n" if unix else "Serving calculations on 127.0.0.1:"
+    assert output.startswith(expected)
+    assert "Server stopped after 0 requests." in output
+    assert not os.path.exists(path)
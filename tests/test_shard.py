@@ -0,0 +1,186 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Sharded Line File Unit Tests
+Tests byte-range splitting, per-range workers and the ordered merge
+"""
+
+# tests/test_shard.py
+
+"""
+Unit tests for the app.shard module using pytest.
+
+Sharded processing must produce exactly the output of stream mode, whatever the
+number of workers or the window size.
+"""
+
+from io import StringIO
+
+import pytest
+
+from app.shard import default_output_path, process_range, process_sharded, shard_ranges
+from app.stream import run_stream
+
+LINES = ''.join(
+    f'{operation} {i} {i % 4}\n'
+    for i in range(200)
+    for operation in ('add', 'divide', 'power', 'modulus')
+) + 'logarithm 2 3\n\nadd ten five\nadd 1 1'
+
+
+def expected_output(text: str) -> str:
+    """Runs the text through stream mode for comparison."""
+    outfile = StringIO()
+    run_stream(StringIO(text), outfile)
+    return outfile.getvalue()
+
+
+@pytest.mark.parametrize("shards", [1, 2, 3, 7, 50])
+def test_shard_ranges_cover_the_file_on_line_boundaries(tmp_path, shards):
+    """
+    Test that the ranges are contiguous, cover the whole file and start on new lines.
+    """
+    # Arrange
+    path = tmp_path / "jobs.txt"
+    path.write_text(LINES)
+    data = path.read_bytes()
+
+    # Act
+    ranges = shard_ranges(str(path), shards)
+
+    # Assert
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+    assert all(stop == start for (_, stop), (start, _) in zip(ranges, ranges[1:]))
+    assert all(data[start - 1:start] == b'\n' for start, _ in ranges[1:])
+    assert len(ranges) <= shards
+
+
+def test_shard_ranges_of_short_and_empty_files(tmp_path):
+    """
+    Test that a file with fewer lines than shards yields one range per line, and an empty file none.
+    """
+    # Arrange
+    short = tmp_path / "short.txt"
+    short.write_text("add 1 2\nadd 3 4\n")
+    empty = tmp_path / "empty.txt"
+    empty.write_text("")
+
+    # Act & Assert
+    assert shard_ranges(str(short), 8) == [(0, 8), (8, 16)]
+    assert shard_ranges(str(empty), 4) == []
+
+
+@pytest.mark.parametrize("jobs, window", [(1, 1 << 22), (1, 64), (3, 100)])
+def test_process_sharded_matches_stream_mode(tmp_path, jobs, window):
+    """
+    Test that sharded output equals stream mode output line for line.
+    """
+    # Arrange
+    source = tmp_path / "jobs.txt"
+    source.write_text(LINES)
+
+    # Act
+    summary = process_sharded(str(source), jobs=jobs, window=window)
+
+    # Assert
+    target = tmp_path / "jobs.results.txt"
+    assert target.read_text() == expected_output(LINES)
+    assert summary == (803, 102, str(target))
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["jobs.results.txt", "jobs.txt"]
+
+
+def test_process_range_handles_lines_longer_than_the_window(tmp_path):
+    """
+    Test that a window never splits a line, even one longer than the window itself.
+    """
+    # Arrange
+    source = tmp_path / "jobs.txt"
+    source.write_text("add 1 2\nadd " + "0" * 100 + "1 1\nadd 3 4\n")
+    part = tmp_path / "out.part"
+
+    # Act
+    totals = process_range(str(source), 0, source.stat().st_size, str(part), window=16)
+
+    # Assert
+    assert part.read_text() == "3.0\n2.0\n7.0\n"
+    assert totals == (3, 0)
+
+
+def test_process_range_only_splits_lines_on_newlines(tmp_path):
+    """
+    Test that other line break characters stay inside their line, as in stream mode, and
+    that windows holding only blank lines write nothing.
+    """
+    # Arrange
+    text = "add 1 2\nadd 3\x0c 4\nadd\x1c 5 1\nadd 1\u2028 1\n" + "\n" * 40 + "add 2 2\n"
+    source = tmp_path / "jobs.txt"
+    source.write_text(text, encoding='utf-8')
+    part = tmp_path / "out.part"
+
+    # Act
+    totals = process_range(str(source), 0, source.stat().st_size, str(part), window=16)
+
+    # Assert
+    assert part.read_text(encoding='utf-8') == expected_output(text)
+    assert totals == (5, expected_output(text).count("Error: "))
+
+
+@pytest.mark.parametrize("sendfile_result", [OSError("sendfile unavailable"), 0])
+def test_merge_falls_back_without_sendfile(tmp_path, monkeypatch, sendfile_result):
+    """
+    Test that parts are still merged in order where sendfile fails or copies nothing.
+    """
+    # Arrange
+    def no_sendfile(*args):
+        if isinstance(sendfile_result, OSError):
+            raise sendfile_result
+        return sendfile_result
+
+    monkeypatch.setattr('os.sendfile', no_sendfile)
+    source = tmp_path / "jobs.txt"
+    source.write_text(LINES)
+
+    # Act
+    process_sharded(str(source), str(tmp_path / "out.txt"), jobs=1, window=128)
+
+    # Assert
+    assert (tmp_path / "out.txt").read_text() == expected_output(LINES)
+
+
+def test_process_sharded_missing_input(tmp_path):
+    """
+    Test that a missing input file raises before any output is created.
+    """
+    # Act & Assert
+    with pytest.raises(FileNotFoundError):
+        process_sharded(str(tmp_path / "missing.txt"))
+    assert list(tmp_path.iterdir()) == []
+    assert default_output_path("jobs") == "jobs.results.txt"
+
+
+def test_process_sharded_refuses_to_overwrite_its_input(tmp_path):
+    """
+    Test that naming the input file as the output raises and leaves the input untouched.
+    """
+    # Arrange
+    source = tmp_path / "jobs.txt"
+    source.write_text("add 1 2\n")
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="is the input file"):
+        process_sharded(str(source), str(source), jobs=1)
+    assert source.read_text() == "add 1 2\n"
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_process_sharded_reports_undecodable_input(tmp_path, jobs):
+    """
+    Test that an input file that is not UTF-8 text raises ValueError, serially or in workers.
+    """
+    # Arrange
+    source = tmp_path / "jobs.txt"
+    source.write_bytes(b"add 1 2\n" * 100 + b"\xff\xfe 1 2\n")
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        process_sharded(str(source), str(tmp_path / "out.txt"), jobs=jobs)
@@ -0,0 +1,121 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Running Statistics Unit Tests
+Tests compensated sums and Welford variance against the statistics module
+"""
+
+# tests/test_stats.py
+
+"""
+Unit tests for the app.stats module using pytest.
+
+The running values must agree with the exact results of `math.fsum` and the
+`statistics` module, including on inputs where naive summation loses precision.
+"""
+
+import math
+import random
+import statistics
+
+from app.stats import RunningStats, SessionStats
+
+
+def test_running_stats_match_statistics_module():
+    """
+    Test that count, sum, mean, variance, min and max match a full recomputation.
+
+    AAA Pattern:
+    - Arrange: Build 10,000 random values over many orders of magnitude.
+    - Act: Add them one at a time.
+    - Assert: Verify every statistic against fsum and the statistics module.
+    """
+    # Arrange
+    rng = random.Random(0)
+    values = [rng.uniform(-1, 1) * 10 ** rng.randint(-5, 8) for _ in range(10_000)]
+    stats = RunningStats()
+
+    # Act
+    for value in values:
+        stats.add(value)
+
+    # Assert
+    assert stats.count == len(values)
+    assert stats.total == math.fsum(values)
+    assert math.isclose(stats.mean, statistics.fmean(values), rel_tol=1e-12)
+    assert math.isclose(stats.variance, statistics.pvariance(values), rel_tol=1e-9)
+    assert math.isclose(stats.stdev, statistics.pstdev(values), rel_tol=1e-9)
+    assert (stats.minimum, stats.maximum) == (min(values), max(values))
+
+
+def test_running_stats_compensates_rounding():
+    """
+    Test that small values added to a large one are not lost, as they are with sum().
+    """
+    # Arrange
+    values = [1e16] + [1.0] * 1000 + [-1e16]
+    stats = RunningStats()
+
+    # Act
+    for value in values:
+        stats.add(value)
+
+    # Assert
+    assert sum(values) != 1000.0
+    assert stats.total == 1000.0
+
+
+def test_running_stats_variance_of_offset_values():
+    """
+    Test that the variance of values far from zero keeps its precision.
+    """
+    # Arrange
+    values = [1e9 + 4, 1e9 + 7, 1e9 + 13, 1e9 + 16]
+    stats = RunningStats()
+
+    # Act
+    for value in values:
+        stats.add(value)
+
+    # Assert
+    assert stats.variance == 22.5
+
+
+def test_running_stats_empty_and_infinite():
+    """
+    Test the empty statistics and a sum that overflows to infinity.
+    """
+    # Arrange
+    empty = RunningStats()
+    infinite = RunningStats()
+
+    # Act
+    infinite.add(1.0)
+    infinite.add(math.inf)
+
+    # Assert
+    assert empty.count == 0 and empty.total == 0.0
+    assert math.isnan(empty.mean) and math.isnan(empty.variance) and math.isnan(empty.stdev)
+    assert infinite.total == math.inf
+    assert infinite.maximum == math.inf
+
+
+def test_session_stats_per_operation():
+    """
+    Test that results are counted per operation and overall.
+    """
+    # Arrange
+    stats = SessionStats()
+
+    # Act
+    stats.add('add', 3.0)
+    stats.add('divide', 0.5)
+    stats.add('add', 5.0)
+    stats.add('power', (-8.0) ** 0.5)
+
+    # Assert
+    assert len(stats) == 3
+    assert 'power' not in stats.by_operation
+    assert stats.by_operation['add'].total == 8.0
+    assert stats.by_operation['divide'].count == 1
+    assert stats.overall.total == 8.5
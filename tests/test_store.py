@@ -0,0 +1,252 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Persistent History Store Unit Tests
+Tests batched writes and indexed history queries
+"""
+
+# tests/test_store.py
+
+"""
+Unit tests for the app.store module using pytest.
+
+Recorded calculations are written in batches, so every query must see the calculations
+still waiting in the queue as well as the ones already in the database.
+"""
+
+import math
+import sqlite3
+from datetime import datetime
+from fractions import Fraction
+
+import pytest
+
+from app.calculation import AddCalculation, DivideCalculation, PowerCalculation
+from app.store import HistoryEntry, HistoryStore, parse_time
+
+
+def test_store_writes_in_batches(tmp_path):
+    """
+    Test that recorded calculations reach the database once a batch is full.
+
+    AAA Pattern:
+    - Arrange: Open a store with a batch size of 3.
+    - Act: Record two calculations, then a third.
+    - Assert: Verify a second connection sees nothing until the batch is written.
+    """
+    # Arrange
+    path = str(tmp_path / "history.db")
+    store = HistoryStore(path, batch_size=3)
+    reader = HistoryStore(path)
+
+    # Act
+    store.record(AddCalculation(1.0, 2.0))
+    store.record(AddCalculation(3.0, 4.0))
+    before = reader.count()
+    store.record(AddCalculation(5.0, 6.0))
+    after = reader.count()
+
+    # Assert
+    assert (before, after) == (0, 3)
+    store.close()
+    reader.close()
+
+
+def test_store_last_filters_by_operation():
+    """
+    Test that 'last' returns the newest calculations of one operation, oldest first.
+    """
+    # Arrange
+    store = HistoryStore(':memory:')
+    for i in range(10):
+        calculation = DivideCalculation(float(i), 2.0) if i % 2 else AddCalculation(float(i), 2.0)
+        store.record(calculation, created=1000.0 + i)
+
+    # Act
+    entries = store.last(3, operation='Divide')
+
+    # Assert
+    assert [entry.a for entry in entries] == [5.0, 7.0, 9.0]
+    assert {entry.operation for entry in entries} == {'divide'}
+    assert store.count() == 10
+    assert store.count('divide') == 5
+
+
+def test_store_since_and_query():
+    """
+    Test that 'since' keeps calculations recorded at or after a time, with optional filters.
+    """
+    # Arrange
+    store = HistoryStore(':memory:')
+    for i in range(6):
+        store.record(PowerCalculation(2.0, float(i)), created=100.0 * i)
+
+    # Act
+    since = store.since(300.0)
+    limited = store.since(100.0, operation='power', limit=2)
+    everything = store.query()
+
+    # Assert
+    assert [entry.result for entry in since] == [8.0, 16.0, 32.0]
+    assert [entry.result for entry in limited] == [16.0, 32.0]
+    assert len(everything) == 6
+
+
+def test_store_keeps_history_across_sessions(tmp_path):
+    """
+    Test that closing a store writes queued calculations so a new session can read them.
+    """
+    # Arrange
+    path = str(tmp_path / "history.db")
+    with HistoryStore(path) as store:
+        store.record(DivideCalculation(1.0, 4.0))
+
+    # Act
+    with HistoryStore(path) as store:
+        entries = store.last(10)
+
+    # Assert
+    assert len(entries) == 1
+    assert entries[0].calculation().result == 0.25
+    assert entries[0].result == 0.25
+
+
+def test_history_entry_str():
+    """
+    Test that an entry shows its local time followed by the rebuilt calculation.
+    """
+    # Arrange
+    created = datetime(2025, 9, 28, 14, 30, 5).timestamp()
+    entry = HistoryEntry(1, created, 'add', 1.0, 2.0, 3.0)
+
+    # Act
+    text = str(entry)
+
+    # Assert
+    assert text == "[2025-09-28 14:30:05] AddCalculation: 1.0 Add 2.0 = 3.0"
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("90s", 910.0),
+    ("15m", 100.0),
+    ("0.5h", -800.0),
+    ("1d", 1000.0 - 86400),
+    ("2025-09-28", datetime(2025, 9, 28).timestamp()),
+    ("2025-09-28T14:30", datetime(2025, 9, 28, 14, 30).timestamp()),
+    ("yesterday", None),
+    ("5w", None),
+])
+def test_parse_time(text, expected):
+    """
+    Test that ages are counted back from now and ISO dates are read in local time.
+    """
+    # Act
+    result = parse_time(text, now=1000.0)
+
+    # Assert
+    assert result == expected
+
+
+def test_parse_time_defaults_to_now():
+    """
+    Test that an age without an explicit 'now' is counted back from the current time.
+    """
+    # Arrange
+    before = datetime.now().timestamp()
+
+    # Act
+    result = parse_time("0s")
+
+    # Assert
+    assert before <= result <= datetime.now().timestamp()
+
+
+def test_store_entries_streams_oldest_first():
+    """
+    Test that 'entries' yields every stored calculation in time order, queued ones included.
+    """
+    # Arrange
+    store = HistoryStore(':memory:')
+    store.record(AddCalculation(2.0, 2.0), created=200.0)
+    store.record(AddCalculation(1.0, 1.0), created=100.0)
+
+    # Act
+    entries = list(store.entries())
+
+    # Assert
+    assert [entry.created for entry in entries] == [100.0, 200.0]
+
+
+def test_store_round_trips_nan(tmp_path):
+    """
+    Test that NaN operands and results are written and read back as NaN, not NULL.
+
+    AAA Pattern:
+    - Arrange: Record calculations with a NaN first operand, second operand and result.
+    - Act: Close the store and read the calculations back in a new session.
+    - Assert: Verify every NaN comes back as a float NaN and each entry can be displayed.
+    """
+    # Arrange
+    path = str(tmp_path / "history.db")
+    nan = float('nan')
+    with HistoryStore(path) as store:
+        store.record(AddCalculation(nan, 1.0), created=100.0)
+        store.record(DivideCalculation(1.0, nan), created=200.0)
+        store.record(AddCalculation(float('inf'), float('-inf')), created=300.0)
+
+    # Act
+    with HistoryStore(path) as store:
+        queried = store.last(5)
+        streamed = list(store.entries())
+
+    # Assert
+    assert len(queried) == len(streamed) == 3
+    first, second, third = queried
+    assert math.isnan(first.a) and first.b == 1.0 and math.isnan(first.result)
+    assert second.a == 1.0 and math.isnan(second.b) and math.isnan(second.result)
+    assert third.a == float('inf') and third.b == float('-inf') and math.isnan(third.result)
+    assert all(isinstance(value, float) for entry in streamed for value in (entry.a, entry.b, entry.result))
+    assert str(first).endswith("AddCalculation: nan Add 1.0 = nan")
+
+
+def test_store_saves_complex_results_as_null():
+    """
+    Test that a calculation without a real result is stored with a NULL result.
+    """
+    # Arrange
+    store = HistoryStore(':memory:', batch_size=2)
+
+    # Act
+    store.record(PowerCalculation(-8.0, 0.5))
+    store.record(AddCalculation(1.0, 2.0))
+    entries = store.last(5)
+
+    # Assert
+    assert [(entry.a, entry.b, entry.result) for entry in entries] == [(-8.0, 0.5, None), (1.0, 2.0, 3.0)]
+    assert str(entries[0]).endswith("PowerCalculation: -8.0 Power 0.5 = (1.7319121124709868e-16+2.8284271247461903j)")
+
+
+def test_store_drops_rows_sqlite_refuses():
+    """
+    Test that a row SQLite cannot store is reported once and dropped, while the rows
+    queued with it are written and later calculations are saved as usual.
+
+    AAA Pattern:
+    - Arrange: Open a store that writes every two calculations.
+    - Act: Record a storable calculation and one with an operand SQLite cannot bind,
+      then two more calculations.
+    - Assert: Verify the first flush raises and every storable calculation is saved.
+    """
+    # Arrange
+    store = HistoryStore(':memory:', batch_size=2)
+
+    # Act
+    store.record(AddCalculation(1.0, 2.0), created=1.0)
+    with pytest.raises(sqlite3.Error):
+        store.record(AddCalculation(Fraction(1, 3), 2.0), created=2.0)
+    store.record(AddCalculation(3.0, 4.0), created=3.0)
+    store.record(AddCalculation(5.0, 6.0), created=4.0)
+
+    # Assert
+    assert [entry.a for entry in store.query()] == [1.0, 3.0, 5.0]
+    store.close()
@@ -0,0 +1,157 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Stream Mode Unit Tests
+Tests non-interactive processing of piped calculation lines
+"""
+
+# tests/test_stream.py
+
+"""
+Unit tests for the app.stream module using pytest.
+
+Stream mode must write exactly one line per non-blank input line, in input order,
+with no prompts or banners, and report bad lines inline without stopping.
+"""
+
+from io import StringIO
+
+from app.calculation import AddCalculation, PowerCalculation
+from app.stream import parse_lines, process_lines, run_stream
+
+
+def test_run_stream_writes_one_result_per_line():
+    """
+    Test that every calculation line produces exactly one output line and no prompts.
+
+    AAA Pattern:
+    - Arrange: Prepare piped input with several operations.
+    - Act: Run the stream processor.
+    - Assert: Verify the output holds only the results, in input order.
+    """
+    # Arrange
+    infile = StringIO('add 10 5\nsubtract 20 3\nmultiply 7 8\ndivide 20 4\npower 2 3\nmodulus 10 3\n')
+    outfile = StringIO()
+
+    # Act
+    written = run_stream(infile, outfile)
+
+    # Assert
+    assert outfile.getvalue() == '15.0\n17.0\n56.0\n5.0\n8.0\n1.0\n'
+    assert written == 6
+
+
+def test_run_stream_reports_errors_inline():
+    """
+    Test that bad lines are reported in place and blank lines are skipped.
+    """
+    # Arrange
+    infile = StringIO('divide 1 0\n\nlogarithm 2 3\nadd ten five\nadd 5\nPOWER 2 10\nmultiply 1e300 1e300\n')
+    outfile = StringIO()
+
+    # Act
+    run_stream(infile, outfile)
+
+    # Assert
+    assert outfile.getvalue().splitlines() == [
+        "Error: Cannot divide by zero.",
+        "Error: Unsupported calculation type: 'logarithm'.",
+        "Error: Invalid input. Please follow the format: <operation> <num1> <num2>",
+        "Error: Invalid input. Please follow the format: <operation> <num1> <num2>",
+        "1024.0",
+        "Error: Result is too large to represent.",
+    ]
+
+
+def test_run_stream_handles_many_chunks():
+    """
+    Test that input spanning many read chunks keeps its order.
+    """
+    # Arrange
+    lines = ''.join(f'add {i} 1\n' for i in range(1000))
+    outfile = StringIO()
+
+    # Act
+    written = run_stream(StringIO(lines), outfile, chunk_size=64)
+
+    # Assert
+    assert written == 1000
+    assert outfile.getvalue().splitlines() == [repr(float(i + 1)) for i in range(1000)]
+
+
+def test_run_stream_skips_chunks_of_blank_lines():
+    """
+    Test that a chunk holding only blank lines writes nothing.
+    """
+    # Arrange
+    infile = StringIO('add 1 2\n' + '\n' * 100 + 'add 3 4\n')
+    outfile = StringIO()
+
+    # Act
+    written = run_stream(infile, outfile, chunk_size=16)
+
+    # Assert
+    assert written == 2
+    assert outfile.getvalue() == '3.0\n7.0\n'
+
+
+def test_run_stream_powers_match_scalar_calculations():
+    """
+    Test that batched powers are bit-for-bit the results of Python's `**`, whatever the backend.
+    """
+    # Arrange
+    pairs = [(1.0 + i / 997, 1.0 + i / 3.7) for i in range(500)]
+    infile = StringIO(''.join(f'power {a!r} {b!r}\n' for a, b in pairs))
+    outfile = StringIO()
+
+    # Act
+    run_stream(infile, outfile)
+
+    # Assert
+    assert outfile.getvalue().splitlines() == [repr(PowerCalculation(a, b).result) for a, b in pairs]
+
+
+def test_run_stream_defaults_to_standard_streams(monkeypatch, capsys):
+    """
+    Test that stdin and stdout are used when no streams are given.
+    """
+    # Arrange
+    monkeypatch.setattr('sys.stdin', StringIO('add 1 2\n'))
+
+    # Act
+    run_stream()
+
+    # Assert
+    assert capsys.readouterr().out == '3.0\n'
+
+
+def test_process_lines_retains_history_only_when_asked():
+    """
+    Test that successful calculations are appended to a history list when one is given.
+    """
+    # Arrange
+    history = []
+
+    # Act
+    process_lines(['add 1 2', 'divide 1 0', 'power 2 2'], history)
+    without_history = process_lines(['add 1 2'])
+
+    # Assert
+    assert [type(calc) for calc in history] == [AddCalculation, PowerCalculation]
+    assert str(history[1]) == "PowerCalculation: 2.0 Power 2.0 = 4.0"
+    assert without_history == ['3.0']
+
+
+def test_parse_lines_builds_columns():
+    """
+    Test that parsing separates valid rows into columns and keeps a slot per line.
+    """
+    # Act
+    opcodes, a_values, b_values, slots = parse_lines(['add 1 2', '   ', 'oops', 'modulus 7 -3'])
+
+    # Assert
+    assert opcodes == [0, 5]
+    assert a_values == [1.0, 7.0]
+    assert b_values == [2.0, -3.0]
+    assert slots[0] is None and slots[2] is None
+    assert slots[1].startswith("Invalid input.")
@@ -0,0 +1,283 @@
+"""
+Author: Pruthul Patel
+Date: September 28, 2025
+Assignment 4: Write-Ahead Log Unit Tests
+Tests group commit, checksummed replay and segment compaction
+"""
+
+# tests/test_wal.py
+
+"""
+Unit tests for the app.wal module using pytest.
+
+Whatever state a crash leaves the log directory in, replay must return exactly the
+calculations whose records were written completely, in the order they were logged.
+"""
+
+import os
+import time
+import zlib
+
+from app.binary import REQUEST_RECORD
+from app.calculation import AddCalculation, DivideCalculation, PowerCalculation
+from app.wal import WAL_CHECKSUM, WAL_HEADER, WAL_MAGIC, WAL_RECORD_SIZE, WriteAheadLog, encode_record, read_segment
+
+
+def make_calculations(count):
+    """Builds `count` distinct calculations cycling through three operations."""
+    classes = [AddCalculation, DivideCalculation, PowerCalculation]
+    return [classes[i % 3](float(i), 2.0) for i in range(count)]
+
+
+def describe(calculations):
+    """Returns comparable (class, a, b) tuples."""
+    return [(type(c).__name__, c.a, c.b) for c in calculations]
+
+
+def test_wal_commits_full_groups(tmp_path):
+    """
+    Test that records reach the segment file only once a group is full.
+
+    AAA Pattern:
+    - Arrange: Open a log that commits every 3 records, with a long interval.
+    - Act: Append two calculations, then a third.
+    - Assert: Verify the segment grows by three records at once.
+    """
+    # Arrange
+    wal = WriteAheadLog(str(tmp_path), group_records=3, group_interval=60)
+    calculations = make_calculations(3)
+
+    # Act
+    wal.append(calculations[0])
+    wal.append(calculations[1])
+    before = os.listdir(tmp_path)
+    wal.append(calculations[2])
+
+    # Assert
+    assert before == []
+    assert os.path.getsize(wal.segment_path(1)) == WAL_HEADER.size + 3 * WAL_RECORD_SIZE
+    wal.close()
+
+
+def test_wal_commits_after_interval(tmp_path):
+    """
+    Test that a group that never fills is committed once the interval has passed.
+    """
+    # Arrange
+    wal = WriteAheadLog(str(tmp_path), group_records=100, group_interval=0.01)
+
+    # Act
+    wal.append(AddCalculation(1.0, 2.0))
+    deadline = time.monotonic() + 5
+    while not os.path.exists(wal.segment_path(1)) or len(read_segment(wal.segment_path(1))) < 1:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    # Assert
+    assert describe(read_segment(wal.segment_path(1))) == [('AddCalculation', 1.0, 2.0)]
+    wal.close()
+
+
+def test_wal_replays_after_reopen(tmp_path):
+    """
+    Test that a new log on the same directory replays every closed-over calculation.
+    """
+    # Arrange
+    calculations = make_calculations(10)
+    with WriteAheadLog(str(tmp_path), group_records=4, segment_records=3) as wal:
+        for calculation in calculations[:7]:
+            wal.append(calculation)
+
+    # Act
+    with WriteAheadLog(str(tmp_path), group_records=4, segment_records=3) as wal:
+        for calculation in calculations[7:]:
+            wal.append(calculation)
+        replayed = list(wal.replay())
+
+    # Assert
+    assert describe(replayed) == describe(calculations)
+
+
+def test_wal_replay_stops_at_torn_record(tmp_path):
+    """
+    Test that replay drops a half-written record and a record with a bad checksum.
+    """
+    # Arrange
+    with WriteAheadLog(str(tmp_path)) as wal:
+        for calculation in make_calculations(5):
+            wal.append(calculation)
+        path = wal.segment_path(1)
+    with open(path, 'r+b') as segment:
+        segment.truncate(WAL_HEADER.size + 4 * WAL_RECORD_SIZE + 7)
+        segment.seek(WAL_HEADER.size + 2 * WAL_RECORD_SIZE + 3)
+        segment.write(b'\xff')
+
+    # Act
+    replayed = read_segment(path)
+
+    # Assert
+    assert describe(replayed) == describe(make_calculations(2))
+
+
+def test_wal_rejects_unknown_opcode(tmp_path):
+    """
+    Test that a record with a valid checksum but an unknown opcode ends the segment.
+    """
+    # Arrange
+    payload = REQUEST_RECORD.pack(250, 1.0, 2.0)
+    path = tmp_path / "00000001.wal"
+    path.write_bytes(WAL_HEADER.pack(WAL_MAGIC, 1) + encode_record(AddCalculation(1.0, 2.0))
+                     + payload + WAL_CHECKSUM.pack(zlib.crc32(payload)))
+
+    # Act
+    replayed = read_segment(str(path))
+
+    # Assert
+    assert describe(replayed) == [('AddCalculation', 1.0, 2.0)]
+
+
+def test_wal_compacts_full_segments(tmp_path):
+    """
+    Test that full segments are merged into one once there are too many of them.
+    """
+    # Arrange
+    calculations = make_calculations(27)
+    wal = WriteAheadLog(str(tmp_path), group_records=1, segment_records=5, max_segments=2)
+
+    # Act
+    for calculation in calculations:
+        wal.append(calculation)
+    wal.close()
+
+    # Assert
+    assert sorted(os.listdir(tmp_path)) == ['00000005.wal', '00000006.wal']
+    assert describe(WriteAheadLog(str(tmp_path)).replay()) == describe(calculations)
+
+
+def test_wal_compaction_keeps_newest_records(tmp_path):
+    """
+    Test that compaction with `retain` keeps only the newest records.
+    """
+    # Arrange
+    calculations = make_calculations(12)
+    with WriteAheadLog(str(tmp_path), segment_records=4) as wal:
+        for calculation in calculations:
+            wal.append(calculation)
+    wal = WriteAheadLog(str(tmp_path), retain=5)
+
+    # Act
+    wal.compact()
+
+    # Assert
+    assert os.listdir(tmp_path) == ['00000003.wal']
+    assert describe(wal.replay()) == describe(calculations[-5:])
+
+
+def test_wal_compaction_without_work(tmp_path):
+    """
+    Test that compaction leaves an empty log or a single segment untouched.
+    """
+    # Arrange
+    wal = WriteAheadLog(str(tmp_path))
+    wal.compact()
+    wal.append(AddCalculation(1.0, 1.0))
+    wal.close()
+    wal = WriteAheadLog(str(tmp_path), retain=0)
+    single = WriteAheadLog(str(tmp_path))
+
+    # Act
+    single.compact()
+    wal.compact()
+
+    # Assert
+    assert list(wal.replay()) == []
+
+
+def test_wal_recovers_from_interrupted_compaction(tmp_path):
+    """
+    Test that segments already copied into a compacted segment, and unfinished
+    compaction output, are removed when the log is opened.
+    """
+    # Arrange
+    calculations = make_calculations(6)
+    with WriteAheadLog(str(tmp_path), segment_records=2) as wal:
+        for calculation in calculations:
+            wal.append(calculation)
+    merged = WAL_HEADER.pack(WAL_MAGIC, 1) + b''.join(encode_record(c) for c in calculations[:4])
+    (tmp_path / "00000002.wal").write_bytes(merged)
+    (tmp_path / "00000003.wal.tmp").write_bytes(b'partial')
+    (tmp_path / "notes.txt").write_text("not a segment")
+    (tmp_path / "00000009.wal").write_bytes(b'CALC')
+    (tmp_path / "00000010.wal").write_bytes(WAL_HEADER.pack(b'NOTAWAL!', 10))
+
+    # Act
+    wal = WriteAheadLog(str(tmp_path))
+
+    # Assert
+    assert sorted(os.listdir(tmp_path)) == ['00000002.wal', '00000003.wal', '00000009.wal', '00000010.wal', 'notes.txt']
+    assert describe(wal.replay()) == describe(calculations)
+
+
+def test_wal_compacts_without_holding_up_commits(tmp_path):
+    """
+    Test that appends and commits carry on while a compaction is waiting or running.
+
+    AAA Pattern:
+    - Arrange: Open a log with small segments and hold the compaction lock.
+    - Act: Append enough calculations to seal many segments, then release the lock.
+    - Assert: Verify every record was committed before compaction ran, and that closing
+      the log leaves the newest `retain` records of the full segments.
+    """
+    # Arrange
+    calculations = make_calculations(40)
+    wal = WriteAheadLog(str(tmp_path), group_records=1, segment_records=4, max_segments=2, retain=6)
+    wal._compaction_lock.acquire()
+
+    # Act
+    for calculation in calculations:
+        wal.append(calculation)
+    committed = sum(len(read_segment(wal.segment_path(number))) for number in range(1, 11))
+    wal._compaction_lock.release()
+    wal.close()
+
+    # Assert
+    assert committed == 40
+    assert sorted(os.listdir(tmp_path)) == ['00000010.wal']
+    assert describe(WriteAheadLog(str(tmp_path)).replay()) == describe(calculations[-6:])
+
+
+def test_wal_replays_the_active_segment(tmp_path):
+    """
+    Test that replay includes the records of the segment still being appended to.
+    """
+    # Arrange
+    calculations = make_calculations(6)
+    wal = WriteAheadLog(str(tmp_path), group_records=100, segment_records=4)
+
+    # Act
+    for calculation in calculations:
+        wal.append(calculation)
+    replayed = list(wal.replay())
+
+    # Assert
+    assert describe(replayed) == describe(calculations)
+    wal.close()
+
+
+def test_wal_compacts_on_close_when_too_many_segments(tmp_path):
+    """
+    Test that closing a log compacts the full segments it found beyond `max_segments`.
+    """
+    # Arrange
+    calculations = make_calculations(12)
+    with WriteAheadLog(str(tmp_path), segment_records=2, max_segments=10) as wal:
+        for calculation in calculations:
+            wal.append(calculation)
+    wal = WriteAheadLog(str(tmp_path), max_segments=2)
+
+    # Act
+    wal.close()
+
+    # Assert
+    assert os.listdir(tmp_path) == ['00000006.wal']
+    assert describe(WriteAheadLog(str(tmp_path)).replay()) == describe(calculations)